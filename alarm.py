@@ -0,0 +1,119 @@
+###############################################################
+# Alarm engine
+#
+# Turns measurements into an alarm severity without chattering
+# on noise around a threshold:
+# - a level is raised when `confirm` of the last `window` samples
+#   are at or above its threshold, and cleared when as many are
+#   below the threshold minus the hysteresis
+# - a raised severity is latched until it is acknowledged, even
+#   if the temperature drops again
+# - acknowledging an alarm silences it for silence_ms, after that
+#   it sounds again and needs a new acknowledge
+# Each update costs the same whatever the window, so it runs in
+# the measurement tick. It has no hardware, so it runs on the
+# host as well.
+###############################################################
+
+try:
+    from utime import ticks_diff
+except ImportError:
+    def ticks_diff(a, b):
+        return a - b  # on the host
+
+class severity():
+    NORMAL = 0
+    WARNING = 1                       # Display only
+    ALARM = 2                         # Buzzer
+
+class AlarmEngine(object):
+
+    HYSTERESIS    = 2.0               # Degrees below a threshold before it clears
+    CONFIRM       = 3                 # Samples out of WINDOW that must agree
+    WINDOW        = 5
+    SILENCE_MS    = 300000            # An acknowledged alarm sounds again after 5 minutes
+    WARNING_BELOW = 5.0               # The warning is this far below the alarm temperature
+
+    def __init__(self, alarm_temp, hysteresis=HYSTERESIS, confirm=CONFIRM, window=WINDOW,
+                 silence_ms=SILENCE_MS, warning_below=WARNING_BELOW):
+        self.hysteresis = hysteresis
+        self.confirm = confirm
+        self.mask = (1 << window) - 1
+        self.silence_ms = silence_ms
+        self.warning_below = warning_below
+
+        # bits set in a window value, so counting them is a lookup
+        self.counts = bytearray(bin(i).count('1') for i in range(1 << window))
+
+        self.thresholds = [None, 0, 0]    # per severity
+        self.above = [0, 0, 0]            # bit per sample at or above the threshold
+        self.below = [0, 0, 0]            # bit per sample below threshold - hysteresis
+        self.active = [True, False, False]
+        self.set_alarm_temp(alarm_temp)
+
+        self.severity = severity.NORMAL
+        self.latched = severity.NORMAL    # highest severity since the last acknowledge
+        self.acked = True
+        self.silenced_at = None           # ticks_ms of the acknowledge that silenced the alarm
+
+    def set_alarm_temp(self, alarm_temp):
+        self.thresholds[severity.ALARM] = alarm_temp
+        self.thresholds[severity.WARNING] = alarm_temp - self.warning_below
+
+    def update(self, temp_celsius, now):
+        ''' Add a measurement, returns True if the severity changed '''
+        mask = self.mask
+        counts = self.counts
+        for level in (severity.WARNING, severity.ALARM):
+            threshold = self.thresholds[level]
+            above = ((self.above[level] << 1) | (temp_celsius >= threshold)) & mask
+            below = ((self.below[level] << 1) | (temp_celsius < threshold - self.hysteresis)) & mask
+            self.above[level] = above
+            self.below[level] = below
+
+            if self.active[level]:
+                if counts[below] >= self.confirm:
+                    self.active[level] = False
+            elif counts[above] >= self.confirm:
+                self.active[level] = True
+
+        if self.active[severity.ALARM]:
+            level = severity.ALARM
+        elif self.active[severity.WARNING]:
+            level = severity.WARNING
+        else:
+            level = severity.NORMAL
+
+        if self.silenced_at is not None and (level != severity.ALARM
+                or ticks_diff(now, self.silenced_at) >= self.silence_ms):
+            # over, or silenced for long enough
+            self.silenced_at = None
+            if level == severity.ALARM:
+                self.acked = False
+
+        if level > self.latched:
+            self.latched = level
+            self.acked = False
+        elif self.acked:
+            self.latched = level
+
+        changed = level != self.severity
+        self.severity = level
+        return changed
+
+    def acknowledge(self, now):
+        ''' A button press: clears the latch and silences the alarm '''
+        self.acked = True
+        self.latched = self.severity
+        if self.severity == severity.ALARM:
+            self.silenced_at = now
+
+    def unacked(self):
+        return not self.acked
+
+    def silenced(self):
+        return self.silenced_at is not None
+
+    def sounding(self):
+        ''' Should the buzzer sound? '''
+        return self.severity == severity.ALARM and self.silenced_at is None
@@ -0,0 +1,90 @@
+###############################################################
+# I2C bus that survives glitches
+#
+# Drop-in for the writes the SSD1306 driver makes. A failed
+# write is retried; from the second try on the bus is recovered
+# first, by clocking out a device that holds SDA low and sending
+# a stop. Only when all retries fail is the OSError raised.
+###############################################################
+
+from machine import I2C, Pin
+from utime import sleep_us
+
+class I2CBus(object):
+
+    RETRIES = const(3)
+
+    def __init__(self, id, scl, sda, freq=400000, retries=RETRIES):
+        self.id = id
+        self.scl = scl
+        self.sda = sda
+        self.freq = freq
+        self.retries = retries
+        self.errors = 0           # failed writes, including the retried ones
+        self.recoveries = 0       # times the bus was recovered
+        self._open()
+
+    def _open(self):
+        self.i2c = I2C(self.id, scl=Pin(self.scl), sda=Pin(self.sda), freq=self.freq)
+
+    def scan(self):
+        try:
+            return self.i2c.scan()
+        except OSError:
+            self.errors += 1
+            return []
+
+    def writeto(self, addr, buf):
+        attempt = 0
+        while True:
+            try:
+                return self.i2c.writeto(addr, buf)
+            except OSError:
+                if not self._retry(attempt):
+                    raise
+            attempt += 1
+
+    def writevto(self, addr, vector):
+        attempt = 0
+        while True:
+            try:
+                return self.i2c.writevto(addr, vector)
+            except OSError:
+                if not self._retry(attempt):
+                    raise
+            attempt += 1
+
+    def _retry(self, attempt):
+        ''' Count the failure, returns True if it is worth another try '''
+        self.errors += 1
+        if attempt >= self.retries:
+            return False
+        if attempt > 0:
+            self.recover()
+        return True
+
+    def recover(self):
+        ''' Free a bus that is held low, then start the I2C again '''
+        scl = Pin(self.scl, Pin.OPEN_DRAIN, value=1)
+        sda = Pin(self.sda, Pin.OPEN_DRAIN, value=1)
+
+        # up to 9 clocks finish whatever byte a device was sending
+        for i in range(9):
+            if sda.value():
+                break
+            scl.value(0)
+            sleep_us(5)
+            scl.value(1)
+            sleep_us(5)
+
+        # stop: SDA goes high while SCL is high
+        scl.value(0)
+        sda.value(0)
+        sleep_us(5)
+        scl.value(1)
+        sleep_us(5)
+        sda.value(1)
+        sleep_us(5)
+
+        self._open()
+        self.recoveries += 1
@@ -3,12 +3,15 @@
 
 ###############################################################
 
-from machine import Pin, I2C
+from machine import UART, Pin
 from picozero import Button # File needs to be saved on the pico
 from ssd1306 import SSD1306_I2C # File needs to be saved on the pico
-from oled import Write #, GFX, SSD1306_I2C
-from oled.fonts import ubuntu_mono_20
 from statemachine import *
+from settings import Settings
+from i2cbus import I2CBus
+from telemetry import Telemetry
+from nmea import NMEA0183
+from statetrace import Trace
 
 BTN_LEFT       = Button(8) # GP8 - pin 11
 BTN_RIGHT      = Button(1) # GP1 - pin 2
@@ -17,6 +20,12 @@ BTN_ENTER      = Button(5) # GP5 - pin 7
 screen_width   = 128
 screen_height  = 64
 
+DUAL_CORE      = True  # Render the display on the second core
+TRACE          = False # Record state machine events, see statetrace.py
+TELEMETRY_HZ   = 0     # Binary telemetry frames per second on USB serial, 0 is off
+NMEA_OUTPUT    = False # XDR sentences at 4800 baud on GP16 (TX), for a chartplotter
+WATCHDOG       = True  # Reset when sampling stops; switch off while working in the REPL
+
 def btn_left_pressed():
     ''' Left button pressed '''
     sm.button_pressed(buttons.LEFT)
@@ -29,26 +38,51 @@ def btn_enter_pressed():
     ''' Enter button pressed, sets the state to "menu" '''
     sm.button_pressed(buttons.ENTER)
         
-# Start I2C
-i2c_dev = I2C(1, scl=Pin(19), sda=Pin(18), freq=200000)
+# Start I2C, failed writes are retried and a stuck bus is recovered
+i2c_dev = I2CBus(1, scl=19, sda=18, freq=200000)
 i2c_addr = [hex(ii) for ii in i2c_dev.scan()]  # get I2C address in hex format
 if i2c_addr == []:
-    print('No I2C Display Found')
-    sys.exit()  # exit routine if no dev found
+    print('No I2C Display Found, the alarm runs without it')  # keeps looking for it
 else:
     print("I2C Address      : {}".format(i2c_addr[0]))  # I2C device address
-    print("I2C Configuration: {}".format(i2c_dev))  # print I2C params
+    print("I2C Configuration: {}".format(i2c_dev.i2c))  # print I2C params
 
-oled = SSD1306_I2C(screen_width, screen_height, i2c_dev)  # oled controller
+# oled controller, Hardware initializes it and does so again after a fault
+oled = SSD1306_I2C(screen_width, screen_height, i2c_dev, init=False)
+if not DUAL_CORE:
+    oled.double_buffer()  # frames are sent to the display from the second core
 
 hw = Hardware(oled)
 
+settings = Settings()
+settings.load()  # Read once, the settings are plain attributes after this
+
 # Start the state machine
-sm = StateMachine(hw)
+sm = StateMachine(hw, settings)
+if TRACE:
+    sm.trace = Trace()
 sm.add_state(StartState())
+sm.add_state(RunningState())
 sm.add_state(MonitorState())
-sm.add_state(MenuState())
-sm.go_to_state('start')
+sm.add_state(MenuState(settings))
+
+if NMEA_OUTPUT:
+    # The txbuf holds a whole sentence, writing it never waits for the UART
+    uart = UART(0, baudrate=4800, tx=Pin(16), rx=Pin(17), txbuf=128)
+    sm.states[states.RUNNING].outputs.append(NMEA0183(uart))
+
+if TELEMETRY_HZ:
+    telemetry = Telemetry(sm, sm.states[states.RUNNING], TELEMETRY_HZ)
+    telemetry.start()  # Samples on its own, the alarm keeps its own timer
+
+# Sampling starts with the splash screen, the outputs get the first sample
+sm.go_to_state(states.START)
+
+if WATCHDOG:
+    hw.start_watchdog()  # Fed by every update once the alarm is checked
+
+if DUAL_CORE:
+    sm.start_ui_core()  # Sampling and alarm stay on this core
 
 # Attach event handlers to the button presses
 BTN_LEFT.when_pressed = btn_left_pressed
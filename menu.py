@@ -1,15 +1,63 @@
+###############################################################
+# Data driven menu tree
+#
+# A Menu is a list of MenuItems. An item shows a label and,
+# optionally, a value read through a getter. Entering an item
+# opens its submenu, runs its action or, if it has a setter,
+# starts editing its value; entering a plain item goes back up
+# a level.
+###############################################################
 
-class Menu():
+class MenuItem(object):
 
-    oled = None	
-    menu = ["Settings", "Info"]
-    line = 1
-    line_height = 10
+    def __init__(self, label, getter=None, submenu=None, action=None,
+                 setter=None, step=1, low=None, high=None, fmt="%s"):
+        self.label = label
+        self.getter = getter      # returns the value shown after the label
+        self.submenu = submenu    # Menu opened by ENTER
+        self.action = action      # called with the state machine on ENTER
+        self.setter = setter      # called with the new value when editing is committed
+        self.step = step          # change per LEFT/RIGHT press while editing
+        self.low = low
+        self.high = high
+        self.fmt = fmt            # format string or function for the value
 
-    def __init__(self):
-        pass
+    def text(self, value=None, editing=False):
+        if self.getter is None:
+            return self.label
 
-    def display_menu(self):
-        for item in self.menu:
-            self.oled.text(item, 10, self.line * self.line_height)
+        if value is None:
+            value = self.getter()
+        if callable(self.fmt):
+            shown = self.fmt(value)
+        else:
+            shown = self.fmt % value
 
+        if editing:
+            return "%s <%s>" % (self.label, shown)
+        return "%s %s" % (self.label, shown)
+
+    def adjust(self, value, direction):
+        ''' The value one LEFT (-1) or RIGHT (1) press away '''
+        if value is True or value is False:
+            return not value
+
+        value = value + direction * self.step
+        if self.low is not None and value < self.low:
+            value = self.low
+        if self.high is not None and value > self.high:
+            value = self.high
+        return value
+
+class Menu(object):
+
+    def __init__(self, items):
+        self.items = items
+        self.parent = None
+        self.selected = 0         # index of the selected item
+        self.top = 0              # index of the first visible item
+        self.editing = None       # value of the selected item while it is edited
+
+        for item in items:
+            if item.submenu is not None:
+                item.submenu.parent = self
@@ -0,0 +1,147 @@
+###############################################################
+# Temperature output for chartplotters and the engine data bus
+#
+# NMEA0183 writes XDR or MTW sentences to a UART. The fixed parts
+# of a sentence and their checksum are prepared once; per sentence
+# only the digits are written into the same buffer. With a UART
+# txbuf larger than a sentence, the write returns right away.
+#
+# NMEA2000 encodes PGN 130316 and hands it to a transceiver, any
+# object with a send(pgn, priority, data) method.
+###############################################################
+
+from utime import ticks_ms, ticks_diff
+
+def checksum(text):
+    crc = 0
+    for c in text:
+        crc ^= ord(c)
+    return crc
+
+HEX = b'0123456789ABCDEF'
+
+class Output(object):
+    ''' Gets every measurement, sends at its own interval '''
+
+    def __init__(self, interval_ms=1000):
+        self.interval_ms = interval_ms
+        self.last = None
+        self.sent = 0
+        self.errors = 0
+
+    def update(self, temp_celsius):
+        now = ticks_ms()
+        if self.last is not None and ticks_diff(now, self.last) < self.interval_ms:
+            return
+        self.last = now
+
+        try:
+            self.send(temp_celsius)
+            self.sent += 1
+        except OSError:
+            self.errors += 1  # never stop the measurements over an output
+
+    def send(self, temp_celsius):
+        pass
+
+class NMEA0183(Output):
+
+    def __init__(self, uart, sentence='XDR', talker='II', name='EXHAUST', interval_ms=1000):
+        Output.__init__(self, interval_ms)
+        self.uart = uart
+
+        if sentence == 'XDR':
+            head = '$%sXDR,C,' % talker       # transducer type C: temperature
+            tail = ',C,%s' % name
+        elif sentence == 'MTW':
+            head = '$%sMTW,' % talker
+            tail = ',C'
+        else:
+            raise ValueError('unsupported sentence %s' % sentence)
+
+        self.fixed_crc = checksum(head[1:]) ^ checksum(tail)
+        self.tail = tail.encode()
+        self.start = len(head)
+        self.buffer = bytearray(82)           # the longest sentence NMEA allows
+        self.buffer[:self.start] = head.encode()
+        self.view = memoryview(self.buffer)
+
+    def _digits(self, at, value):
+        ''' Write a positive integer, returns the end and the checksum '''
+        width = 1
+        scale = 10
+        while value >= scale:
+            scale *= 10
+            width += 1
+
+        buf = self.buffer
+        crc = 0
+        for i in range(at + width - 1, at - 1, -1):
+            digit = 48 + value % 10
+            buf[i] = digit
+            crc ^= digit
+            value //= 10
+        return at + width, crc
+
+    def format(self, temp_celsius):
+        ''' Build the sentence in the buffer, returns its length '''
+        buf = self.buffer
+        n = self.start
+        crc = self.fixed_crc
+
+        tenths = int(temp_celsius * 10 + (0.5 if temp_celsius >= 0 else -0.5))
+        if tenths < 0:
+            buf[n] = 45  # -
+            crc ^= 45
+            n += 1
+            tenths = -tenths
+
+        n, digits_crc = self._digits(n, tenths // 10)
+        crc ^= digits_crc
+        buf[n] = 46  # .
+        buf[n + 1] = 48 + tenths % 10
+        crc ^= 46 ^ buf[n + 1]
+        n += 2
+
+        buf[n:n + len(self.tail)] = self.tail
+        n += len(self.tail)
+        buf[n] = 42  # *
+        buf[n + 1] = HEX[crc >> 4]
+        buf[n + 2] = HEX[crc & 15]
+        buf[n + 3] = 13
+        buf[n + 4] = 10
+        return n + 5
+
+    def send(self, temp_celsius):
+        self.uart.write(self.view[:self.format(temp_celsius)])
+
+class NMEA2000(Output):
+    ''' PGN 130316, Temperature Extended Range '''
+
+    PGN            = 130316
+    PRIORITY       = 5
+    SOURCE_EXHAUST = 14               # Exhaust gas temperature
+
+    def __init__(self, transceiver, instance=0, interval_ms=1000):
+        Output.__init__(self, interval_ms)
+        self.transceiver = transceiver
+        self.instance = instance
+        self.sid = 0
+        self.data = bytearray(8)
+
+    def encode(self, temp_celsius):
+        data = self.data
+        kelvin = int((temp_celsius + 273.15) * 1000)  # 0.001 K
+        data[0] = self.sid
+        data[1] = self.instance
+        data[2] = self.SOURCE_EXHAUST
+        data[3] = kelvin & 0xFF
+        data[4] = (kelvin >> 8) & 0xFF
+        data[5] = (kelvin >> 16) & 0xFF
+        data[6] = 0xFF                # no set temperature
+        data[7] = 0xFF
+        self.sid = (self.sid + 1) % 253
+        return data
+
+    def send(self, temp_celsius):
+        self.transceiver.send(self.PGN, self.PRIORITY, self.encode(temp_celsius))
@@ -0,0 +1,40 @@
+###############################################################################
+# PICOZERO
+#
+# The devices live in submodules that are only imported when a name from them
+# is first asked for, so "from picozero import Button" doesn't compile or hold
+# the motors, the speaker or the pinout. The names are the same as they were in
+# the single picozero.py. tools/slim_picozero.py goes further and writes one
+# module with only what an application imports.
+###############################################################################
+
+_SUBMODULES = {
+    'base': ('PWMChannelAlreadyInUse', 'PWMSliceFrequencyConflict',
+             'EventFailedScheduleQueueFull', 'clamp', 'PinMixin', 'PinsMixin'),
+    'board': ('pinout',),
+    'patterns': ('ValueChange', 'PIOPattern'),
+    'output': ('OutputDevice', 'DigitalOutputDevice', 'DigitalLED', 'Buzzer'),
+    'pwm': ('PWMChannels', 'PWMOutputDevice', 'PWMLED', 'LED', 'pico_led', 'PWMBuzzer'),
+    'speaker': ('Speaker',),
+    'group': ('OutputGroup',),
+    'rgbled': ('RGBLED',),
+    'motor': ('Motor', 'Robot', 'Rover'),
+    'servo': ('Servo',),
+    'input': ('InputDevice', 'DigitalInputDevice', 'Switch', 'Button'),
+    'analog': ('AnalogInputDevice', 'Potentiometer', 'Pot', 'pico_temp_conversion',
+               'TemperatureSensor', 'pico_temp_sensor', 'TempSensor', 'Thermistor'),
+    'distance': ('DistanceSensor',),
+}
+
+def __getattr__(name):
+    """
+    Imports the submodule that defines `name` the first time it is asked for,
+    e.g. by ``from picozero import Servo``.
+    """
+    for submodule, names in _SUBMODULES.items():
+        if name in names:
+            module = __import__('picozero.' + submodule, None, None, (name,))
+            value = getattr(module, name)
+            globals()[name] = value  # found directly from now on
+            return value
+    raise AttributeError(name)
@@ -0,0 +1,44 @@
+###############################################################################
+# EXCEPTIONS AND SUPPORTING CLASSES
+###############################################################################
+
+class PWMChannelAlreadyInUse(Exception):
+    pass
+
+class PWMSliceFrequencyConflict(Exception):
+    pass
+
+class EventFailedScheduleQueueFull(Exception):
+    pass
+
+def clamp(n, low, high): return max(low, min(n, high))
+
+class PinMixin:
+    """
+    Mixin used by devices that have a single pin number.
+    """
+
+    @property
+    def pin(self):
+        """
+        Returns the pin number used by the device.
+        """
+        return self._pin_num
+
+    def __str__(self):
+        return "{} (pin {})".format(self.__class__.__name__, self._pin_num)
+
+class PinsMixin:
+    """
+    Mixin used by devices that use multiple pins.
+    """
+
+    @property
+    def pins(self):
+        """
+        Returns a tuple of pins used by the device.
+        """
+        return self._pin_nums
+
+    def __str__(self):
+        return "{} (pins - {})".format(self.__class__.__name__, self._pin_nums)
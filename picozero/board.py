@@ -0,0 +1,38 @@
+###############################################################################
+# PINOUT
+###############################################################################
+
+def pinout(output=True):
+    """
+    Returns a textual representation of the Raspberry Pi pico pins and functions.
+
+    :param bool output:
+        If :data:`True` (the default) the pinout will be "printed".
+        
+    """
+    pins = """        ---usb---
+GP0  1  |o     o| -1  VBUS
+GP1  2  |o     o| -2  VSYS
+GND  3  |o     o| -3  GND
+GP2  4  |o     o| -4  3V3_EN
+GP3  5  |o     o| -5  3V3(OUT)
+GP4  6  |o     o| -6           ADC_VREF
+GP5  7  |o     o| -7  GP28     ADC2
+GND  8  |o     o| -8  GND      AGND
+GP6  9  |o     o| -9  GP27     ADC1
+GP7  10 |o     o| -10 GP26     ADC0
+GP8  11 |o     o| -11 RUN
+GP9  12 |o     o| -12 GP22
+GND  13 |o     o| -13 GND
+GP10 14 |o     o| -14 GP21
+GP11 15 |o     o| -15 GP20
+GP12 16 |o     o| -16 GP19
+GP13 17 |o     o| -17 GP18
+GND  18 |o     o| -18 GND
+GP14 19 |o     o| -19 GP17
+GP15 20 |o     o| -20 GP16
+        ---------"""
+
+    if output:
+        print(pins)
+    return pins
@@ -0,0 +1,167 @@
+###############################################################################
+# DISTANCE SENSOR
+###############################################################################
+
+from machine import Pin
+from time import ticks_ms, ticks_us, ticks_diff, sleep
+
+from .base import PinsMixin
+
+class DistanceSensor(PinsMixin):
+    """
+    Represents a HC-SR04 ultrasonic distance sensor.
+
+    :param int echo:
+        The pin that the ECHO pin is connected to.
+
+    :param int trigger:
+        The pin that the TRIG pin is connected to. 
+
+    :param float max_distance:
+        The :attr:`value` attribute reports a normalized value between 0 (too
+        close to measure) and 1 (maximum distance). This parameter specifies
+        the maximum distance expected in meters. This defaults to 1.
+
+    :param bool irq:
+        If :data:`False` (the default), each reading waits for the echo.
+        If :data:`True`, the echo is timed by a pin interrupt: reading
+        :attr:`distance` returns the latest filtered result at once and
+        starts the next measurement in the background.
+
+    :param float smoothing:
+        Only used if `irq` is :data:`True`. The weight (0 - 1) given to
+        each new measurement in the filtered distance; 1 means no
+        filtering. Defaults to 0.5.
+    """
+    TIMEOUT_MS = 100
+
+    def __init__(self, echo, trigger, max_distance=1, irq=False, smoothing=0.5):
+        self._pin_nums = (echo, trigger)
+        self._max_distance = max_distance
+        self._echo = Pin(echo, mode=Pin.IN, pull=Pin.PULL_DOWN)
+        self._trigger = Pin(trigger, mode=Pin.OUT, value=0)
+
+        self._irq = irq
+        self._smoothing = smoothing
+        self._filtered = None
+        self._pending = False
+        self._timed_out = False
+        self._started = 0
+        self._echo_on = 0
+        self._echo_off = 0
+        self._echoed = False
+        if irq:
+            self._echo.irq(self._echo_change, Pin.IRQ_RISING | Pin.IRQ_FALLING, hard=True)
+
+    def _send_trigger(self):
+        self._trigger.off()
+        sleep(0.000005)
+        self._trigger.on()
+        sleep(0.00001)
+        self._trigger.off()
+
+    def _to_distance(self, echo_us):
+        distance = (echo_us * 0.000343) / 2
+        return min(distance, self._max_distance)
+        
+    def _read(self):
+        echo_on = None
+        echo_off = None
+        timed_out = False
+        
+        self._send_trigger()
+
+        # If an echo isn't measured in 100 milliseconds, it should
+        # be considered out of range. The maximum length of the
+        # echo is 38 milliseconds but it's not known how long the
+        # transmission takes after the trigger
+        stop = ticks_ms() + self.TIMEOUT_MS
+        while echo_off is None and not timed_out:
+            if self._echo.value() == 1 and echo_on is None:
+                echo_on = ticks_us()
+            if echo_on is not None and self._echo.value() == 0:
+                echo_off = ticks_us()
+            if ticks_ms() > stop:
+                timed_out = True
+            
+        if echo_off is None or timed_out:
+            return None
+        else:
+            return self._to_distance(echo_off - echo_on)
+
+    def _echo_change(self, p):
+        # hard interrupt, called at the edge: only timestamp both edges of
+        # the echo pulse, _collect turns them into a distance later
+        now = ticks_us()
+        if p.value():
+            self._echo_on = now
+        else:
+            self._echo_off = now
+            self._echoed = True
+
+    def _collect(self):
+        # add a completed echo to the filtered distance
+        if not (self._pending and self._echoed):
+            return
+        self._pending = False
+        self._timed_out = False
+        distance = self._to_distance(ticks_diff(self._echo_off, self._echo_on))
+        if self._filtered is None:
+            self._filtered = distance
+        else:
+            self._filtered += self._smoothing * (distance - self._filtered)
+
+    def measure(self):
+        """
+        Starts a measurement in the background and returns immediately.
+        Only available if the sensor was created with `irq` set to
+        :data:`True`. Measurements that get no echo within 100 ms are
+        dropped and :attr:`distance` returns :data:`None` until the next
+        one succeeds.
+        """
+        self._collect()
+        if self._pending:
+            if ticks_diff(ticks_ms(), self._started) < self.TIMEOUT_MS:
+                # still waiting for the echo
+                return
+            self._timed_out = True
+
+        self._pending = True
+        self._echoed = False
+        self._started = ticks_ms()
+        self._send_trigger()
+
+    def _read_irq(self):
+        self.measure()  # collects the last echo first
+        return None if self._timed_out else self._filtered
+    
+    @property
+    def value(self):
+        """
+        Returns a value between 0, indicating the reflector is either touching 
+        the sensor or is sufficiently near that the sensor can’t tell the 
+        difference, and 1, indicating the reflector is at or beyond the 
+        specified max_distance. A return value of None indicates that the
+        echo was not received before the timeout.
+        """
+        distance = self.distance
+        return distance / self._max_distance if distance is not None else None
+    
+    @property
+    def distance(self):
+        """
+        Returns the current distance measured by the sensor in meters. Note 
+        that this property will have a value between 0 and max_distance.
+        If `irq` is :data:`True`, this is the filtered result of the
+        measurements completed so far.
+        """
+        if self._irq:
+            return self._read_irq()
+        return self._read()
+
+    @property
+    def max_distance(self):
+        """
+        Returns the maximum distance that the sensor will measure in metres.
+        """
+        return self._max_distance
@@ -0,0 +1,105 @@
+###############################################################################
+# OUTPUT GROUPS
+###############################################################################
+
+
+try:
+    from machine import mem32
+except ImportError:
+    # no direct register access, groups write each device in turn
+    mem32 = None
+
+from .output import OutputDevice, DigitalOutputDevice
+
+class OutputGroup(OutputDevice):
+    """
+    Represents a group of output devices which are updated together with
+    a single call. Digital devices in the group are switched with one write
+    to the RP2040 SIO GPIO set register and one to its clear register, so
+    they change within a cycle of each other; other devices (e.g. PWM) are
+    written one after another.
+
+    ::
+
+        from picozero import OutputGroup, DigitalLED
+
+        bar = OutputGroup(DigitalLED(2), DigitalLED(3), DigitalLED(4))
+        bar.value = (1, 1, 0)
+
+    :param devices:
+        The output devices in the group.
+    """
+    SIO_GPIO_OUT_SET = 0xD0000014
+    SIO_GPIO_OUT_CLR = 0xD0000018
+
+    def __init__(self, *devices):
+        self._devices = devices
+        self._mask = 0
+        # the GPIO bit of each device, or 0 if it is written on its own
+        self._bits = []
+        for device in devices:
+            bit = 0
+            if mem32 is not None and isinstance(device, DigitalOutputDevice) and type(device._pin_num) is int:
+                bit = 1 << device._pin_num
+            self._bits.append(bit)
+            self._mask |= bit
+        super().__init__(initial_value=None)
+
+    @property
+    def devices(self):
+        """
+        Returns a tuple of the devices in the group.
+        """
+        return self._devices
+
+    def _read(self):
+        return tuple(device.value for device in self._devices)
+
+    def _write(self, value):
+        if isinstance(value, (int, float)):
+            value = (value, ) * len(self._devices)
+
+        out = 0
+        for device, bit, v in zip(self._devices, self._bits, value):
+            if bit:
+                if device._value_to_state(v):
+                    out |= bit
+            else:
+                device._write(v)
+
+        if self._mask:
+            # no read of GPIO_OUT, other pins written meanwhile keep their value
+            mem32[self.SIO_GPIO_OUT_SET] = out
+            mem32[self.SIO_GPIO_OUT_CLR] = self._mask & ~out
+
+    @property
+    def value(self):
+        """
+        Sets or returns a tuple with the value of each device in the group.
+        Setting a single number sets all the devices to it, any other
+        sequence gives the value of each device.
+        """
+        return self._read()
+
+    @value.setter
+    def value(self, value):
+        self._stop_change()
+        for device in self._devices:
+            device._stop_change()
+        self._write(value)
+
+    @property
+    def is_active(self):
+        """
+        Returns :data:`True` if any device in the group is on.
+        """
+        return any(self.value)
+
+    def close(self):
+        """
+        Turns all the devices off. The devices themselves are not closed.
+        """
+        self.value = 0
+        self._devices = ()
+        self._bits = []
+        self._mask = 0
@@ -0,0 +1,235 @@
+###############################################################################
+# OUTPUT DEVICES
+###############################################################################
+
+from machine import Pin
+
+from .base import PinMixin
+from .patterns import ValueChange, PIOPattern
+
+class OutputDevice:
+    """
+    Base class for output devices. 
+    """   
+    _pio_sm = None
+
+    def __init__(self, active_high=True, initial_value=False):
+        self.active_high = active_high
+        if initial_value is not None:
+            self._write(initial_value)
+        self._value_changer = None
+    
+    @property
+    def active_high(self):
+        """
+        Sets or returns the active_high property. If :data:`True`, the 
+        :meth:`on` method will set the Pin to HIGH. If :data:`False`, 
+        the :meth:`on` method will set the Pin to LOW (the :meth:`off` method 
+        always does the opposite).
+        """
+        return self._active_state
+
+    @active_high.setter
+    def active_high(self, value):
+        self._active_state = True if value else False
+        self._inactive_state = False if value else True
+        
+    @property
+    def value(self):
+        """
+        Sets or returns a value representing the state of the device: 1 is on, 0 is off.
+        """
+        return self._read()
+
+    @value.setter
+    def value(self, value):
+        self._stop_change()
+        self._write(value)
+        
+    def on(self, value=1, t=None, wait=False):
+        """
+        Turns the device on.
+
+        :param float value:
+            The value to set when turning on. Defaults to 1.
+
+        :param float t:
+            The time in seconds that the device should be on. If None is 
+            specified, the device will stay on. The default is None.
+
+        :param bool wait:
+           If True, the method will block until the time `t` has expired. 
+           If False, the method will return and the device will turn on in
+           the background. Defaults to False. Only effective if `t` is not
+           None.
+        """
+        if t is None:
+            self.value = value
+        else:
+            self._start_change(lambda : iter([(value, t), ]), 1, wait)
+
+    def off(self):
+        """
+        Turns the device off.
+        """
+        self.value = 0
+            
+    @property
+    def is_active(self):
+        """
+        Returns :data:`True` if the device is on.
+        """
+        return bool(self.value)
+
+    def toggle(self):
+        """
+        If the device is off, turn it on. If it is on, turn it off.
+        """
+        if self.is_active:
+            self.off()
+        else:
+            self.on()
+            
+    def blink(self, on_time=1, off_time=None, n=None, wait=False):
+        """
+        Makes the device turn on and off repeatedly.
+        
+        :param float on_time:
+            The length of time in seconds that the device will be on. Defaults to 1.
+
+        :param float off_time:
+            The length of time in seconds that the device will be off. If `None`, 
+            it will be the same as ``on_time``. Defaults to `None`.
+
+        :param int n:
+            The number of times to repeat the blink operation. If None is 
+            specified, the device will continue blinking forever. The default
+            is None.
+
+        :param bool wait:
+           If True, the method will block until the device stops turning on and off. 
+           If False, the method will return and the device will turn on and off in
+           the background. Defaults to False.        
+        """
+        off_time = on_time if off_time is None else off_time
+        
+        self.off()
+
+        # is there anything to change?
+        if on_time > 0 or off_time > 0:
+            if self._pio_sm is not None:
+                self._value_changer = PIOPattern(self, self._pio_sm, on_time, off_time, n, wait)
+            else:
+                self._start_change(lambda : iter([(1,on_time), (0,off_time)]), n, wait)
+            
+    def _start_change(self, generator, n, wait, write=None):
+        self._value_changer = ValueChange(self, generator, n, wait, write)
+    
+    def _stop_change(self):
+        if self._value_changer is not None:
+            self._value_changer.stop()
+            self._value_changer = None
+
+    def close(self):
+        """
+        Turns the device off.
+        """
+        self.value = 0
+
+class DigitalOutputDevice(OutputDevice, PinMixin):
+    """
+    Represents a device driven by a digital pin.
+
+    :param int pin:
+        The pin that the device is connected to.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the LED will be off initially. If
+        :data:`True`, the LED will be switched on initially.
+    """
+    def __init__(self, pin, active_high=True, initial_value=False):
+        self._pin_num = pin
+        self._pin = Pin(pin, Pin.OUT)
+        super().__init__(active_high, initial_value)
+        
+    def _value_to_state(self, value):
+        return int(self._active_state if value else self._inactive_state)
+    
+    def _state_to_value(self, state):
+        return int(bool(state) == self._active_state)
+    
+    def _read(self):
+        return self._state_to_value(self._pin.value())
+
+    def _write(self, value):
+        self._pin.value(self._value_to_state(value))
+
+    def use_pio(self, state_machine=0):
+        """
+        Runs :meth:`blink` patterns on a PIO state machine rather than a
+        Timer, so no CPU time is used until the pattern is changed. Falls
+        back to a Timer if PIO is not available.
+
+        :param int state_machine:
+            The PIO state machine (0 - 7) to use. Defaults to 0. Pass
+            :data:`None` to stop using PIO.
+        """
+        self._stop_change()
+        self._pio_sm = state_machine
+
+    def _pio_release(self):
+        # hand the pin back from the PIO to the CPU
+        self._pin.init(Pin.OUT)
+                
+    def close(self):
+        """
+        Closes the device and turns the device off. Once closed, the device
+        can no longer be used.
+        """
+        super().close()
+        self._pin = None
+
+class DigitalLED(DigitalOutputDevice):
+    """
+    Represents a simple LED, which can be switched on and off.
+
+    :param int pin:
+        The pin that the device is connected to.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the LED will be off initially. If
+        :data:`True`, the LED will be switched on initially.
+    """
+    pass
+
+DigitalLED.is_lit = DigitalLED.is_active
+
+class Buzzer(DigitalOutputDevice):
+    """
+    Represents an active or passive buzzer, which can be turned on or off.
+
+    :param int pin:
+        The pin that the device is connected to.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the Buzzer will be off initially. If
+        :data:`True`, the Buzzer will be switched on initially.
+    """
+    pass
+
+Buzzer.beep = Buzzer.blink
@@ -0,0 +1,252 @@
+###############################################################################
+# VALUE PATTERNS
+###############################################################################
+
+from machine import Pin, Timer, freq
+from time import sleep
+
+try:
+    import rp2
+except ImportError:
+    # not running on an RP2040, patterns fall back to ValueChange
+    rp2 = None
+
+from .base import clamp
+
+class ValueChange:
+    """
+    Internal class to control the value of an output device. 
+
+    :param OutputDevice output_device:
+        The OutputDevice object you wish to change the value of.
+
+    :param generator:
+        A generator function that yields a 2d list of
+        ((value, seconds), *).
+        
+        The output_device's value will be set for the number of
+        seconds.
+
+    :param int n:
+        The number of times to repeat the sequence. If None, the
+        sequence will repeat forever. 
+    
+    :param bool wait:
+        If True the ValueChange object will block (wait) until
+        the sequence has completed.
+
+    :param write:
+        The function used to write each value. If None (the default),
+        the output_device's ``_write`` method is used.
+    """
+    def __init__(self, output_device, generator, n, wait, write=None):
+        self._output_device = output_device
+        self._write = output_device._write if write is None else write
+        self._generator = generator
+        self._n = n
+
+        self._gen = self._generator()
+        
+        self._timer = Timer()
+        self._running = True
+        self._wait = wait
+        
+        self._set_value()
+            
+    def _set_value(self, timer_obj=None):
+        if self._wait:
+            # wait for the exection to end
+            next_seq = self._get_value()
+            while next_seq is not None:
+                value, seconds = next_seq
+                
+                self._write(value)
+                sleep(seconds)
+                
+                next_seq = self._get_value()
+                
+        else:
+            # run the timer
+            next_seq = self._get_value()
+            if next_seq is not None:
+                value, seconds = next_seq
+                
+                self._write(value)            
+                self._timer.init(period=int(seconds * 1000), mode=Timer.ONE_SHOT, callback=self._set_value)
+
+        if next_seq is None:
+            # the sequence has finished, turn the device off
+            self._output_device.off()
+            self._running = False
+                
+    def _get_value(self):
+        try:
+            return next(self._gen)
+            
+        except StopIteration:
+            
+            self._n = self._n - 1 if self._n is not None else None
+            if self._n == 0:
+                # it's the end, return None
+                return None
+            else:
+                # recreate the generator and start again
+                self._gen = self._generator()
+                return next(self._gen)
+        
+    def stop(self):
+        """
+        Stops the ValueChange object running.
+        """
+        self._running = False
+        self._timer.deinit()
+
+if rp2 is not None:
+
+    # Both programs take one 32 bit word: the low 16 bits are the number of
+    # "on" units and the high 16 bits the number of "off" units (minus one).
+    # OUT shifts right, so the low half comes out first.
+    # Every unit is 20 PIO cycles. A new word replaces the pattern at the
+    # start of the next cycle, otherwise the last one is repeated from X.
+
+    @rp2.asm_pio(set_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_RIGHT)
+    def _pio_gate_program():
+        pull(noblock)
+        mov(x, osr)
+        out(y, 16)
+        set(pins, 1)
+        label("on")
+        jmp(y_dec, "on")    [19]
+        out(y, 16)
+        set(pins, 0)
+        label("off")
+        jmp(y_dec, "off")   [19]
+
+    @rp2.asm_pio(set_init=rp2.PIO.OUT_LOW, out_shiftdir=rp2.PIO.SHIFT_RIGHT)
+    def _pio_tone_program():
+        pull(noblock)
+        mov(x, osr)
+        out(y, 16)
+        label("on")
+        set(pins, 1)        [9]
+        set(pins, 0)        [8]
+        jmp(y_dec, "on")
+        out(y, 16)
+        label("off")
+        jmp(y_dec, "off")   [19]
+
+class PIOPattern:
+    """
+    Internal class to run an on / off pattern on an RP2040 PIO state
+    machine, so the timing runs without using the CPU. If the rp2 module is
+    not available the same pattern is run by a :class:`ValueChange`.
+
+    :param OutputDevice output_device:
+        The OutputDevice object to run the pattern on.
+
+    :param int state_machine:
+        The PIO state machine (0 - 7) to use.
+
+    :param float on_time:
+        The length of time in seconds the device will be on.
+
+    :param float off_time:
+        The length of time in seconds the device will be off.
+
+    :param int n:
+        The number of times to repeat the pattern. If None, the pattern
+        will repeat forever.
+
+    :param bool wait:
+        If True the PIOPattern object will block (wait) until the pattern
+        has completed.
+
+    :param int tone:
+        If set, the pin is driven with a square wave of this frequency in
+        hertz during the on time, for passive buzzers. If None (the
+        default) the pin is held on. Tones below the slowest state machine
+        clock, about 96Hz at 125MHz, raise a ValueError.
+    """
+    UNIT_CYCLES = 20
+    MAX_UNITS = 0xFFFF
+    MAX_CLOCK_DIVIDER = 65536
+
+    def __init__(self, output_device, state_machine, on_time, off_time, n, wait, tone=None):
+        self._output_device = output_device
+        self._sm = None
+        self._timer = None
+        self._value_changer = None
+        self._running = True
+
+        if rp2 is None:
+            self._value_changer = ValueChange(
+                output_device, lambda : iter([(1, on_time), (0, off_time)]), n, wait)
+            return
+
+        if tone is None:
+            program = _pio_gate_program
+            units_per_second = 1000
+        else:
+            program = _pio_tone_program
+            units_per_second = int(tone)
+            min_tone = freq() // (self.MAX_CLOCK_DIVIDER * self.UNIT_CYCLES) + 1
+            if units_per_second < min_tone:
+                raise ValueError(
+                    "tone of {}Hz is too low, the lowest is {}Hz".format(tone, min_tone))
+
+        on_units = self._to_units(on_time, units_per_second)
+        off_units = self._to_units(off_time, units_per_second)
+        if tone is None and not output_device.active_high:
+            # the program drives the pin high first, swap the phases
+            on_units, off_units = off_units, on_units
+
+        self._sm = rp2.StateMachine(
+            state_machine,
+            program,
+            freq=units_per_second * self.UNIT_CYCLES,
+            set_base=Pin(output_device._pin_num))
+        self._sm.put(on_units | (off_units << 16))
+        self._sm.active(1)
+
+        if n is not None:
+            duration = n * (on_time + off_time)
+            if wait:
+                sleep(duration)
+                # the device doesn't hold this pattern yet, off() alone
+                # would leave the state machine driving the pin
+                self.stop()
+                self._output_device.off()
+            else:
+                self._timer = Timer()
+                self._timer.init(period=int(duration * 1000), mode=Timer.ONE_SHOT, callback=self._finished)
+
+    def _to_units(self, seconds, units_per_second):
+        return clamp(int(seconds * units_per_second) - 1, 0, self.MAX_UNITS)
+
+    def _finished(self, timer_obj=None):
+        # turning the device off stops the pattern and releases the pin
+        self._output_device.off()
+
+    @property
+    def is_running(self):
+        """
+        Returns :data:`True` if the pattern is running.
+        """
+        if self._value_changer is not None:
+            return self._value_changer._running
+        return self._running
+
+    def stop(self):
+        """
+        Stops the pattern and hands the pin back to the device.
+        """
+        if self._value_changer is not None:
+            self._value_changer.stop()
+            return
+
+        if self._running:
+            self._running = False
+            if self._timer is not None:
+                self._timer.deinit()
+            self._sm.active(0)
+            self._output_device._pio_release()
@@ -0,0 +1,462 @@
+###############################################################################
+# PWM OUTPUT DEVICES
+###############################################################################
+
+from machine import Pin, PWM
+
+from .base import PWMChannelAlreadyInUse, PWMSliceFrequencyConflict, PinMixin
+from .patterns import PIOPattern
+from .output import OutputDevice, DigitalLED
+
+class PWMChannels:
+    """
+    Keeps track of which device owns each of the 16 RP2040 PWM channels
+    (8 slices, each with an A and a B channel). GP0 - GP15 and GP16 - GP29
+    map onto the same channels, and both channels of a slice always run at
+    the same frequency.
+
+    ::
+
+        from picozero import PWMChannels
+
+        print(PWMChannels.in_use())
+    """
+    CHANNELS = 16
+
+    _owners = [None] * 16
+    _freqs = [0] * 8
+
+    @staticmethod
+    def channel(pin):
+        """
+        Returns the channel number (0 - 15) used by a GP pin.
+        """
+        return pin & 15
+
+    @staticmethod
+    def name(channel):
+        """
+        Returns the name of a channel number, e.g. ``"3B"``.
+        """
+        return "{}{}".format(channel >> 1, "AB"[channel & 1])
+
+    @classmethod
+    def acquire(cls, pin, device, freq):
+        """
+        Reserves the channel used by `pin` for `device` and returns the
+        channel number. The other channel of the slice may be in use, as
+        long as it runs at the same frequency.
+
+        :raises PWMChannelAlreadyInUse:
+            If the channel is used by another device.
+
+        :raises PWMSliceFrequencyConflict:
+            If the other channel of the slice runs at a different frequency.
+        """
+        channel = pin & 15
+        owner = cls._owners[channel]
+        if owner is not None and owner is not device:
+            raise PWMChannelAlreadyInUse(
+                "PWM channel {} is already in use by {}. Use a different pin".format(
+                    cls.name(channel),
+                    str(owner)
+                    )
+                )
+
+        cls._check_sibling(channel, freq)
+        cls._owners[channel] = device
+        cls._freqs[channel >> 1] = freq
+        return channel
+
+    @classmethod
+    def _check_sibling(cls, channel, freq):
+        sibling = cls._owners[channel ^ 1]
+        if sibling is not None and cls._freqs[channel >> 1] != freq:
+            raise PWMSliceFrequencyConflict(
+                "PWM slice {} is running at {}Hz for {}. Use a different pin or the same frequency".format(
+                    channel >> 1,
+                    cls._freqs[channel >> 1],
+                    str(sibling)
+                    )
+                )
+
+    @classmethod
+    def release(cls, channel):
+        """
+        Frees a channel so that it can be used by another device.
+        """
+        cls._owners[channel] = None
+        if cls._owners[channel ^ 1] is None:
+            cls._freqs[channel >> 1] = 0
+
+    @classmethod
+    def set_freq(cls, channel, freq):
+        """
+        Records a new frequency for the slice of a channel.
+
+        :raises PWMSliceFrequencyConflict:
+            If the other channel of the slice is in use, it would be
+            retuned as well.
+        """
+        cls._check_sibling(channel, freq)
+        cls._freqs[channel >> 1] = freq
+
+    @classmethod
+    def owner(cls, pin):
+        """
+        Returns the device using the channel of `pin`, or :data:`None`.
+        """
+        return cls._owners[pin & 15]
+
+    @classmethod
+    def slice_freq(cls, pin):
+        """
+        Returns the frequency of the slice used by `pin`, or 0 if neither of
+        its channels is in use.
+        """
+        return cls._freqs[(pin & 15) >> 1]
+
+    @classmethod
+    def in_use(cls):
+        """
+        Returns a dictionary of channel name to the device using it.
+        """
+        return {
+            cls.name(channel): owner
+            for channel, owner in enumerate(cls._owners)
+            if owner is not None
+            }
+
+    @classmethod
+    def free(cls):
+        """
+        Returns a list of the names of the channels not in use.
+        """
+        return [
+            cls.name(channel)
+            for channel, owner in enumerate(cls._owners)
+            if owner is None
+            ]
+
+class PWMOutputDevice(OutputDevice, PinMixin):
+    """
+    Represents a device driven by a PWM pin.
+
+    :param int pin:
+        The pin that the device is connected to.
+
+    :param int freq:
+        The frequency of the PWM signal in hertz. Defaults to 100.
+
+    :param int duty_factor:
+        The duty factor of the PWM signal. This is a value between 0 and 65535.
+        Defaults to 65535.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the LED will be off initially. If
+        :data:`True`, the LED will be switched on initially.
+    """
+    def __init__(self, pin, freq=100, duty_factor=65535, active_high=True, initial_value=False):
+        self._pin_num = pin
+        self._channel = PWMChannels.acquire(pin, self, freq)
+        self._duty_factor = duty_factor
+        try:
+            self._pwm = PWM(Pin(pin))
+            self._pwm.freq(freq)
+        except Exception:
+            # don't keep the channel if the device couldn't be created
+            PWMChannels.release(self._channel)
+            raise
+        super().__init__(active_high, initial_value)
+        
+    def _state_to_value(self, state):
+        return (state if self.active_high else self._duty_factor - state) / self._duty_factor
+
+    def _value_to_state(self, value):
+        return int(self._duty_factor * (value if self.active_high else 1 - value))
+    
+    def _read(self):
+        return self._state_to_value(self._pwm.duty_u16())
+    
+    def _write(self, value):
+        self._pwm.duty_u16(self._value_to_state(value))
+
+    def use_pio(self, state_machine=0, tone=False):
+        """
+        Runs :meth:`blink` patterns without fades on a PIO state machine
+        rather than a Timer, so no CPU time is used until the pattern is
+        changed. Falls back to a Timer if PIO is not available.
+
+        :param int state_machine:
+            The PIO state machine (0 - 7) to use. Defaults to 0. Pass
+            :data:`None` to stop using PIO.
+
+        :param bool tone:
+            If :data:`True`, the PIO generates a square wave at :attr:`freq`
+            during the on time (at full volume) instead of holding the pin
+            on. Defaults to :data:`False`.
+        """
+        self._stop_change()
+        self._pio_sm = state_machine
+        self._pio_tone = tone
+
+    def _pio_release(self):
+        # hand the pin back from the PIO to the PWM slice
+        freq = self._pwm.freq()
+        self._pwm = PWM(Pin(self._pin_num))
+        self._pwm.freq(freq)
+        
+    @property
+    def is_active(self):
+        """
+        Returns :data:`True` if the device is on.
+        """
+        return self.value != 0
+
+    @property
+    def freq(self):
+        """
+        Returns the current frequency of the device.
+        """
+        return self._pwm.freq()
+    
+    @freq.setter
+    def freq(self, freq):
+        """
+        Sets the frequency of the device. Raises
+        :exc:`PWMSliceFrequencyConflict` if the other channel on the same PWM
+        slice is in use, as it would change as well.
+        """
+        PWMChannels.set_freq(self._channel, freq)
+        self._pwm.freq(freq)
+
+    def blink(self, on_time=1, off_time=None, n=None, wait=False, fade_in_time=0, fade_out_time=None, fps=25):
+        """
+        Makes the device turn on and off repeatedly.
+        
+        :param float on_time:
+            The length of time in seconds the device will be on. Defaults to 1.
+
+        :param float off_time:
+            The length of time in seconds the device will be off. If `None`, 
+            it will be the same as ``on_time``. Defaults to `None`.
+
+        :param int n:
+            The number of times to repeat the blink operation. If `None`, the 
+            device will continue blinking forever. The default is `None`.
+
+        :param bool wait:
+           If True, the method will block until the LED stops blinking. If False,
+           the method will return and the LED will blink in the background.
+           Defaults to False.
+
+        :param float fade_in_time:
+            The length of time in seconds to spend fading in. Defaults to 0.
+
+        :param float fade_out_time:
+            The length of time in seconds to spend fading out. If `None`,
+            it will be the same as ``fade_in_time``. Defaults to `None`.
+
+        :param int fps:
+           The frames per second that will be used to calculate the number of
+           steps between off/on states when fading. Defaults to 25.
+        """
+        self.off()
+        
+        off_time = on_time if off_time is None else off_time
+        fade_out_time = fade_in_time if fade_out_time is None else fade_out_time
+        
+        def blink_generator():
+            if fade_in_time > 0:
+                for s in [
+                    (i * (1 / fps) / fade_in_time, 1 / fps)
+                    for i in range(int(fps * fade_in_time))
+                    ]:
+                    yield s
+            
+            if on_time > 0:
+                yield (1, on_time)
+
+            if fade_out_time > 0:
+                for s in [
+                    (1 - (i * (1 / fps) / fade_out_time), 1 / fps)
+                    for i in range(int(fps * fade_out_time))
+                    ]:
+                    yield s
+            
+            if off_time > 0:
+                yield (0, off_time)
+        
+        # is there anything to change?
+        if self._pio_sm is not None and fade_in_time == 0 and fade_out_time == 0:
+            if on_time > 0 or off_time > 0:
+                self._value_changer = PIOPattern(
+                    self, self._pio_sm, on_time, off_time, n, wait,
+                    tone=self.freq if self._pio_tone else None)
+        elif on_time > 0 or off_time > 0 or fade_in_time > 0 or fade_out_time > 0:
+            self._start_change(blink_generator, n, wait)
+
+    def pulse(self, fade_in_time=1, fade_out_time=None, n=None, wait=False, fps=25):
+        """
+        Makes the device pulse on and off repeatedly.
+        
+        :param float fade_in_time:
+            The length of time in seconds that the device will take to turn on.
+            Defaults to 1.
+
+        :param float fade_out_time:
+           The length of time in seconds that the device will take to turn off.
+           Defaults to 1.
+           
+        :param int fps:
+           The frames per second that will be used to calculate the number of
+           steps between off/on states. Defaults to 25.
+           
+        :param int n:
+           The number of times to pulse the LED. If None, the LED will pulse
+           forever. Defaults to None.
+    
+        :param bool wait:
+           If True, the method will block until the LED stops pulsing. If False,
+           the method will return and the LED will pulse in the background.
+           Defaults to False.
+        """
+        self.blink(on_time=0, off_time=0, fade_in_time=fade_in_time, fade_out_time=fade_out_time, n=n, wait=wait, fps=fps)
+
+    def close(self):
+        """
+        Closes the device and turns the device off. Once closed, the device
+        can no longer be used.
+        """
+        if self._pwm is None:
+            return
+        super().close()
+        PWMChannels.release(self._channel)
+        self._pwm.deinit()
+        self._pwm = None
+
+class PWMLED(PWMOutputDevice):
+    """
+    Represents an LED driven by a PWM pin; the brightness of the LED can be changed.
+
+    :param int pin:
+        The pin that the device is connected to.
+
+    :param int freq:
+        The frequency of the PWM signal in hertz. Defaults to 100.
+
+    :param int duty_factor:
+        The duty factor of the PWM signal. This is a value between 0 and 65535.
+        Defaults to 65535.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the LED will be off initially. If
+        :data:`True`, the LED will be switched on initially.
+    """
+
+PWMLED.brightness = PWMLED.value
+
+def LED(pin, pwm=True, active_high=True, initial_value=False):
+    """
+    Returns an instance of :class:`DigitalLED` or :class:`PWMLED` depending on
+    the value of the `pwm` parameter. 
+
+    ::
+
+        from picozero import LED
+
+        my_pwm_led = LED(1)
+
+        my_digital_led = LED(2, pwm=False)
+
+    :param int pin:
+        The pin that the device is connected to.
+
+    :param int pin:
+        If `pwm` is :data:`True` (the default), a :class:`PWMLED` will be
+        returned. If `pwm` is :data:`False`, a :class:`DigitalLED` will be
+        returned. A :class:`PWMLED` can control the brightness of the LED but
+        uses 1 PWM channel.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the device will be off initially. If
+        :data:`True`, the device will be switched on initially.
+    """
+    if pwm:
+        return PWMLED(
+            pin=pin,
+            active_high=active_high,
+            initial_value=initial_value)
+    else:
+        return DigitalLED(
+            pin=pin,
+            active_high=active_high,
+            initial_value=initial_value)
+
+try:
+    pico_led = LED("LED", pwm=False)
+except TypeError:
+    # older version of micropython before "LED" was supported
+    pico_led = LED(25, pwm=False)
+
+class PWMBuzzer(PWMOutputDevice):
+    """
+    Represents a passive buzzer driven by a PWM pin; the volume of the buzzer can be changed.
+
+    :param int pin:
+        The pin that the buzzer is connected to.
+
+    :param int freq:
+        The frequency of the PWM signal in hertz. Defaults to 440.
+
+    :param int duty_factor:
+        The duty factor of the PWM signal. This is a value between 0 and 65535.
+        Defaults to 1023.
+
+    :param bool active_high:
+        If :data:`True` (the default), the :meth:`on` method will set the Pin
+        to HIGH. If :data:`False`, the :meth:`on` method will set the Pin to
+        LOW (the :meth:`off` method always does the opposite).
+
+    :param bool initial_value:
+        If :data:`False` (the default), the buzzer will be off initially.  If
+        :data:`True`, the buzzer will be switched on initially.
+    """    
+    def __init__(self, pin, freq=440, duty_factor=1023, active_high=True, initial_value=False):
+        super().__init__(pin, freq, duty_factor, active_high, initial_value)
+
+    def use_pio(self, state_machine=0, tone=True):
+        """
+        Runs :meth:`beep` patterns without fades on a PIO state machine
+        which also generates the tone at :attr:`freq`, so no CPU time is
+        used until the pattern is changed. Falls back to a Timer if PIO is
+        not available.
+
+        :param int state_machine:
+            The PIO state machine (0 - 7) to use. Defaults to 0. Pass
+            :data:`None` to stop using PIO.
+
+        :param bool tone:
+            If :data:`True` (the default), the PIO generates the tone at
+            full volume. If :data:`False`, the pin is held on.
+        """
+        super().use_pio(state_machine, tone)
+
+PWMBuzzer.volume = PWMBuzzer.value
+
+PWMBuzzer.beep = PWMBuzzer.blink
@@ -0,0 +1,94 @@
+###############################################################
+# Sensor health and filtering
+#
+# Every reading passes through SensorHealth on its way to the
+# alarm. It keeps an exponential moving mean, the filtered
+# temperature, and watches for the faults of the LM35 and its
+# wiring:
+# - RANGE: readings the sensor can't give, an open or shorted wire
+# - STUCK: the very same ADC value for minutes, the input is dead.
+#   A steady engine often reads the same 12 bit value a few times
+#   in a row, the ADC noise changes it long before STUCK_READINGS
+# - SLEW:  repeated jumps the exhaust can't make, a loose contact
+# Unusable readings are not filtered and return None.
+###############################################################
+
+class fault():
+    NONE = 0
+    RANGE = 1
+    STUCK = 2
+    SLEW = 4
+
+class SensorHealth(object):
+
+    ALPHA          = 0.25             # Weight of a new reading in the filter
+    RAW_LOW        = 64               # read_u16 values this close to the rails are a short
+    RAW_HIGH       = 65535 - 64
+    MIN_TEMP       = 1.0              # The LM35 on a single supply reads from 2C,
+    MAX_TEMP       = 200.0            # and up to 150C; near 0V it is disconnected
+    MAX_STEP       = 15.0             # Degrees from the filtered value in one update
+    STUCK_READINGS = 300              # Identical raw readings in a row, 5 minutes at 1s
+    CONFIRM        = 3                # Readings before a fault, or before a jump is real
+    WINDOW         = 8                # Readings over which jumps are counted
+
+    def __init__(self):
+        self.mean = None              # the filtered temperature
+        self.last_raw = None
+        self.same = 0                 # readings in a row equal to last_raw
+        self.fault = fault.NONE
+        self.bad = 0                  # out of range readings in a row
+        self.steps = 0                # jumps in a row
+        self.jumps = 0                # bit per reading in WINDOW, set for a jump
+        self.mask = (1 << self.WINDOW) - 1
+        self.counts = bytearray(bin(i).count('1') for i in range(1 << self.WINDOW))
+
+    def update(self, raw, temp_celsius):
+        ''' Returns the filtered temperature, or None if the reading
+            can't be used '''
+        if (raw <= self.RAW_LOW or raw >= self.RAW_HIGH
+                or temp_celsius < self.MIN_TEMP or temp_celsius > self.MAX_TEMP):
+            self.bad += 1
+            if self.bad >= self.CONFIRM:
+                self.fault |= fault.RANGE
+            return None
+        self.bad = 0
+        self.fault &= ~fault.RANGE
+
+        if raw == self.last_raw:
+            self.same += 1
+            if self.same >= self.STUCK_READINGS:
+                self.fault |= fault.STUCK
+        else:
+            self.last_raw = raw
+            self.same = 1
+            self.fault &= ~fault.STUCK
+
+        if self.mean is None:
+            self._restart(temp_celsius)
+            return temp_celsius
+
+        delta = temp_celsius - self.mean
+        if delta > self.MAX_STEP or delta < -self.MAX_STEP:
+            self.steps += 1
+            if self.steps < self.CONFIRM:
+                self.jumps = ((self.jumps << 1) | 1) & self.mask
+                if self.counts[self.jumps] >= self.CONFIRM:
+                    self.fault |= fault.SLEW
+                return None
+
+            # it jumped and stayed there, that is real
+            self._restart(temp_celsius)
+            return temp_celsius
+        self.steps = 0
+
+        self.jumps = (self.jumps << 1) & self.mask
+        if self.jumps == 0:
+            self.fault &= ~fault.SLEW
+
+        self.mean += self.ALPHA * delta
+        return self.mean
+
+    def _restart(self, temp_celsius):
+        self.mean = temp_celsius
+        self.steps = 0
+        self.jumps = 0
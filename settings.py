@@ -0,0 +1,71 @@
+###############################################################
+# User settings, stored on flash as JSON
+#
+# The file is read once at boot. The rest of the code reads the
+# plain attributes, nothing touches the file again until a
+# setting is changed in the menu.
+###############################################################
+
+import json
+import os
+
+class Settings(object):
+
+    __slots__ = ('alarm_temp', 'hist_interval', 'update_time_ms', 'silent')
+
+    FILE = 'settings.json'
+
+    # The type and the (low, high) range of every setting, the menu
+    # offers the same range
+    TYPES = {
+        'alarm_temp':     ((int, float), (20, 150)),
+        'hist_interval':  (int, (1, 60)),
+        'update_time_ms': (int, (250, 5000)),
+        'silent':         (bool, None),
+    }
+
+    def __init__(self):
+        self.alarm_temp     = 30          # Alarm temperature in degrees Celsius
+        self.hist_interval  = 7           # Updates per graph point, 7 gives about 15 minutes graph
+        self.update_time_ms = 1000        # Time between measurements
+        self.silent         = False       # Never sound the buzzer
+
+    def load(self, path=FILE):
+        ''' Read the settings file, missing or broken files keep the
+            defaults, and so do values of the wrong type. Numbers out of
+            range are clamped, hist_interval 0 would stop the updates. '''
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            print('No settings in "%s", using defaults' % path)
+            return
+
+        if not isinstance(data, dict):
+            print('No settings in "%s", using defaults' % path)
+            return
+
+        for name in self.__slots__:
+            if name not in data:
+                continue
+            value = data[name]
+            kind, limits = self.TYPES[name]
+            # JSON true is not a number here
+            if not isinstance(value, kind) or (kind is not bool and isinstance(value, bool)):
+                print('Setting %s=%r ignored, using %r' % (name, value, getattr(self, name)))
+                continue
+            if limits:
+                value = min(max(value, limits[0]), limits[1])
+            setattr(self, name, value)
+
+    def save(self, path=FILE):
+        ''' Write to a temporary file first, so a reset halfway through
+            never leaves a broken settings file behind '''
+        data = {}
+        for name in self.__slots__:
+            data[name] = getattr(self, name)
+
+        tmp = path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.rename(tmp, path)
@@ -3,9 +3,14 @@
 # library taken from repository at:
 # https://github.com/micropython/micropython/blob/master/drivers/display/ssd1306.py
 #
-from micropython import const
+from micropython import const, schedule
 import framebuf
 
+try:
+    import _thread
+except ImportError:
+    _thread = None
+
 # register definitions
 SET_CONTRAST = const(0x81)
 SET_ENTIRE_ON = const(0xA4)
@@ -30,17 +35,25 @@ SET_CHARGE_PUMP = const(0x8D)
 
 
 class SSD1306(framebuf.FrameBuffer):
-    def __init__(self, width, height, external_vcc):
+    def __init__(self, width, height, external_vcc, init=True):
         self.width = width
         self.height = height
         self.external_vcc = external_vcc
         self.pages = self.height // 8
         self.buffer = bytearray(self.pages * self.width)
         super().__init__(self.buffer, self.width, self.height, framebuf.MONO_VLSB)
-        self.init_display()
+        self._lock = None
+        self._bus = None
+        self._region = None
+        self.frames_skipped = 0
+        self.send_errors = 0
+        if init:
+            self.init_display()
 
     def init_display(self):
-        for cmd in (
+        # may be called again to recover the display while the flush
+        # thread is sending, so it goes through _commands as well
+        self._commands(
             SET_DISP | 0x00,  # off
             # address setting
             SET_MEM_ADDR,
@@ -70,48 +83,150 @@ class SSD1306(framebuf.FrameBuffer):
             # charge pump
             SET_CHARGE_PUMP,
             0x10 if self.external_vcc else 0x14,
-            SET_DISP | 0x01,
-        ):  # on
-            self.write_cmd(cmd)
+            SET_DISP | 0x01,  # on
+        )
         self.fill(0)
         self.show()
 
     def poweroff(self):
-        self.write_cmd(SET_DISP | 0x00)
+        self._commands(SET_DISP | 0x00)
 
     def poweron(self):
-        self.write_cmd(SET_DISP | 0x01)
+        self._commands(SET_DISP | 0x01)
 
     def contrast(self, contrast):
-        self.write_cmd(SET_CONTRAST)
-        self.write_cmd(contrast)
+        self._commands(SET_CONTRAST, contrast)
 
     def invert(self, invert):
-        self.write_cmd(SET_NORM_INV | (invert & 1))
+        self._commands(SET_NORM_INV | (invert & 1))
+
+    def _commands(self, *cmds):
+        # the flush thread may be using the bus
+        if self._bus is not None:
+            self._bus.acquire()
+        try:
+            for cmd in cmds:
+                self.write_cmd(cmd)
+        finally:
+            if self._bus is not None:
+                self._bus.release()
+
+    def double_buffer(self, thread=True):
+        # Drawing keeps going to self.buffer, show() copies it to a back
+        # buffer and returns while the previous frame is sent. Frames shown
+        # faster than the bus can send them are skipped, only the latest
+        # one is sent next. The frame is sent from a thread on the second
+        # core, or scheduled on this one if thread is False.
+        if _thread is None:
+            return
+        self._front = bytearray(len(self.buffer))
+        self._back = bytearray(len(self.buffer))
+        self._frame_ready = False
+        self._flushing = False
+        self._wake = None
+        self._lock = _thread.allocate_lock()
+        if thread:
+            self._bus = _thread.allocate_lock()
+            self._wake = _thread.allocate_lock()
+            self._wake.acquire()
+            _thread.start_new_thread(self._flush_thread, ())
+
+    def _flush_thread(self):
+        while True:
+            self._wake.acquire()
+            self._flush_pending(True)
+
+    def _flush_scheduled(self, _):
+        self._flush_pending(False)
+
+    def _flush_pending(self, blocking):
+        while True:
+            if not self._lock.acquire(blocking):
+                # show() is busy on this core, try again later
+                schedule(self._flush_scheduled, None)
+                return
+            if not self._frame_ready:
+                self._flushing = False
+                self._lock.release()
+                return
+            self._front, self._back = self._back, self._front
+            self._frame_ready = False
+            self._lock.release()
+            try:
+                self._send(self._front)
+            except OSError:
+                # nobody to raise it to here, the owner watches the count
+                self.send_errors += 1
 
     def show(self):
-        x0 = 0
-        x1 = self.width - 1
+        if self._lock is None:
+            self._send(self.buffer)
+            return
+
+        self._lock.acquire()
+        if self._frame_ready:
+            self.frames_skipped += 1
+        self._back[:] = self.buffer
+        self._frame_ready = True
+        start = not self._flushing
+        self._flushing = True
+        self._lock.release()
+
+        if start:
+            if self._wake is not None:
+                self._wake.release()
+            else:
+                schedule(self._flush_scheduled, None)
+
+    def show_region(self, x0, y0, x1, y1):
+        # Only send columns x0 - x1 of the pages holding rows y0 - y1.
+        # Double buffered frames are always sent whole.
+        if self._lock is not None:
+            self.show()
+            return
+        if self._region is None:
+            self._region = bytearray(len(self.buffer))
+        page0 = y0 // 8
+        page1 = y1 // 8
+        cols = x1 - x0 + 1
+        buf = memoryview(self.buffer)
+        n = 0
+        for page in range(page0, page1 + 1):
+            start = page * self.width + x0
+            self._region[n : n + cols] = buf[start : start + cols]
+            n += cols
+        self._send_window(x0, x1, page0, page1, memoryview(self._region)[:n])
+
+    def _send(self, buf):
+        self._send_window(0, self.width - 1, 0, self.pages - 1, buf)
+
+    def _send_window(self, x0, x1, page0, page1, buf):
         if self.width == 64:
             # displays with width of 64 pixels are shifted by 32
             x0 += 32
             x1 += 32
-        self.write_cmd(SET_COL_ADDR)
-        self.write_cmd(x0)
-        self.write_cmd(x1)
-        self.write_cmd(SET_PAGE_ADDR)
-        self.write_cmd(0)
-        self.write_cmd(self.pages - 1)
-        self.write_data(self.buffer)
+        if self._bus is not None:
+            self._bus.acquire()
+        try:
+            self.write_cmd(SET_COL_ADDR)
+            self.write_cmd(x0)
+            self.write_cmd(x1)
+            self.write_cmd(SET_PAGE_ADDR)
+            self.write_cmd(page0)
+            self.write_cmd(page1)
+            self.write_data(buf)
+        finally:
+            if self._bus is not None:
+                self._bus.release()
 
 
 class SSD1306_I2C(SSD1306):
-    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False):
+    def __init__(self, width, height, i2c, addr=0x3C, external_vcc=False, init=True):
         self.i2c = i2c
         self.addr = addr
         self.temp = bytearray(2)
         self.write_list = [b"\x40", None]  # Co=0, D/C#=1
-        super().__init__(width, height, external_vcc)
+        super().__init__(width, height, external_vcc, init)
 
     def write_cmd(self, cmd):
         self.temp[0] = 0x80  # Co=1, D/C#=0
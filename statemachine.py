@@ -2,102 +2,468 @@
 # https://learn.adafruit.com/circuitpython-101-state-machines?view=all
 
 
-from utime import sleep
-from machine import Timer, Pin
-from oled import Write  # , GFX, SSD1306_I2C
+from utime import sleep_ms, ticks_ms, ticks_diff
+from machine import Timer, WDT
+from array import array
+from collections import namedtuple
+import _thread
 from oled.fonts import ubuntu_mono_20
+from picozero import Buzzer
+from widgets import Screen, BigNumber, Graph, MenuList, StatusIcon, ICON_SENSOR
+from menu import Menu, MenuItem
+from alarm import AlarmEngine, severity
+from sensor import SensorHealth
+from statetrace import TRACE_ENTER, TRACE_EXIT, TRACE_DROPPED, TRACE_SAMPLE, TRACE_OVERRUN, TRACE_ALARM, TRACE_FAULT
 import machine
 
+VERSION = 0.6
+
 class buttons():
     ENTER = 1
     LEFT = 2
     RIGHT = 3
 
+# State ids, index into StateMachine.states
+class states():
+    START = 0
+    RUNNING = 1                       # Parent of START, MONITOR and MENU
+    MONITOR = 2
+    MENU = 3
+    COUNT = 4
+
+# Events; the button presses are events as well
+class events():
+    ENTER = buttons.ENTER
+    LEFT = buttons.LEFT
+    RIGHT = buttons.RIGHT
+    DONE = 4                          # A state finished its work
+    EXIT = 5                          # Leave the menu
+    ALARM = 6                         # The alarm went off, or the sensor failed
+    COUNT = 7
+
+# The transition graph: (from, event, to, guard, action). The guard and
+# action are optional and called with the state machine. Events without
+# a transition in a state are tried on its parents; button events nobody
+# takes go to the current state itself. While an alarm or sensor fault
+# is waiting for an acknowledge ENTER acknowledges it instead of opening
+# the menu.
+TRANSITIONS = (
+    (states.START,   events.DONE,  states.MONITOR, None, None),
+    (states.MONITOR, events.ENTER, states.MENU,    lambda sm: not sm.states[states.RUNNING].needs_ack(), None),
+    (states.MENU,    events.EXIT,  states.MONITOR, None, None),
+    (states.MENU,    events.ALARM, states.MONITOR, None, None),
+)
+
 # The hardware class keeps track of all the hardware components
 # It represents the Pico, buzzer, SSD1306 oled display and buttons
 class Hardware(object):
 
     BUZZER         = None
 
-    silent         = False            # Alarm is silent
+    DIM_AFTER_MS   = const(60000)     # Dim the display after a minute without input
+    BLANK_AFTER_MS = const(600000)    # Switch the display off after 10 minutes
+    DIM_CONTRAST   = const(8)
+    STABLE_DELTA   = 1.0              # Degrees; smaller changes count as stable
+    STABLE_REFRESH = const(5)         # Redraw every 5th update while stable
+
+    RECOVER_MS     = const(2000)      # Time between attempts to bring back a faulty display
+    WATCHDOG_MS    = const(8000)      # Longer than the slowest update, at most 8388 on the RP2040
+
+    DISPLAY_ON     = const(0)
+    DISPLAY_DIM    = const(1)
+    DISPLAY_OFF    = const(2)
 
     def __init__(self, oled):
         self.oled = oled
         self.buttons = None
-        self.BUZZER = Pin(14, Pin.OUT)  # Buzzer pin
+        self.BUZZER = Buzzer(14)  # Buzzer pin
+        self.BUZZER.use_pio(0)    # beep patterns are timed by PIO state machine 0
+
+        self.display = self.DISPLAY_ON
+        self.last_input = ticks_ms()
+        self.last_frame = bytearray(len(oled.buffer))  # what the display shows
+        self.last_temp = None                           # last temperature drawn
+        self.updates_skipped = 0
+        self.frames_skipped = 0
+        self.wdt = None
+
+        # Display bus faults never reach the alarm. The display is
+        # left alone until it is initialized again, every RECOVER_MS.
+        self.display_ok = False
+        self.display_errors = 0
+        self.fault_time = ticks_ms()
+        self.recovered = False        # the display was cleared by a new init
+        self.send_errors = 0          # errors seen from the display's flush thread
+        self._init_display()
         
         print('Hardware initialized')
 
+    def _init_display(self):
+        try:
+            self.oled.init_display()
+        except OSError:
+            self._display_fault()
+            return False
+
+        print('Display initialized')
+        self.display_ok = True
+        self.display = self.DISPLAY_ON
+        self.last_frame[:] = self.oled.buffer  # init_display clears it
+        self.last_temp = None
+        self.recovered = True
+        return True
+
+    def _display_fault(self):
+        print('Display fault, running without display')
+        self.display_errors += 1
+        self.display_ok = False
+        self.fault_time = ticks_ms()
+
+    def display_ready(self):
+        ''' False while the display is faulty, in the meantime it is
+            initialized again every RECOVER_MS '''
+        if self.oled.send_errors != self.send_errors:
+            self.send_errors = self.oled.send_errors
+            self._display_fault()
+
+        if self.display_ok:
+            return True
+        if ticks_diff(ticks_ms(), self.fault_time) < self.RECOVER_MS:
+            return False
+        return self._init_display()
+
+    def _display_call(self, method, *args):
+        if not self.display_ready():
+            return
+        try:
+            method(*args)
+        except OSError:
+            self._display_fault()
+
+    def draw(self, screen):
+        ''' Render the screen and send the part that changed '''
+        if self.display == self.DISPLAY_OFF or not self.display_ready():
+            return
+
+        if self.recovered:
+            self.recovered = False
+            screen.invalidate()
+        self.show_region(screen.render(self.oled))
+
+    def show_region(self, rect):
+        ''' Send the changed part of the frame, rect is (x0, y0, x1, y1) '''
+        if self.display == self.DISPLAY_OFF or rect is None:
+            return
+
+        self.last_frame[:] = self.oled.buffer
+        self._display_call(self.oled.show_region, *rect)
+
+    def show(self):
+        ''' Send the frame to the display, unless it didn't change '''
+        if self.display == self.DISPLAY_OFF:
+            return
+
+        if self.oled.buffer == self.last_frame:
+            self.frames_skipped += 1
+            return
+
+        self.last_frame[:] = self.oled.buffer
+        self._display_call(self.oled.show)
+
+    def refresh_due(self, temp_celsius, alarm):
+        ''' Is the temperature worth redrawing? While it is stable the
+            display is only refreshed every STABLE_REFRESH updates. '''
+        if self.display == self.DISPLAY_OFF:
+            return False
+
+        if (alarm or self.last_temp is None
+                or abs(temp_celsius - self.last_temp) >= self.STABLE_DELTA
+                or self.updates_skipped >= self.STABLE_REFRESH - 1):
+            self.last_temp = temp_celsius
+            self.updates_skipped = 0
+            return True
+
+        self.updates_skipped += 1
+        return False
+
+    def wake(self):
+        ''' A button press or alarm brings the display back to full
+            brightness. Returns True if it was switched off. '''
+        self.last_input = ticks_ms()
+        if self.display == self.DISPLAY_ON:
+            return False
+
+        was_off = self.display == self.DISPLAY_OFF
+        if was_off:
+            self._display_call(self.oled.poweron)
+            self.last_temp = None  # redraw on the next update
+        self._display_call(self.oled.contrast, 255)
+        self.display = self.DISPLAY_ON
+        return was_off
+
+    def idle(self):
+        ''' Dim, and later switch off, the display after inactivity '''
+        idle_ms = ticks_diff(ticks_ms(), self.last_input)
+        if self.display == self.DISPLAY_ON and idle_ms > self.DIM_AFTER_MS:
+            self._display_call(self.oled.contrast, self.DIM_CONTRAST)
+            self.display = self.DISPLAY_DIM
+        elif self.display == self.DISPLAY_DIM and idle_ms > self.BLANK_AFTER_MS:
+            self._display_call(self.oled.poweroff)
+            self.display = self.DISPLAY_OFF
+
+    def start_watchdog(self, timeout_ms=WATCHDOG_MS):
+        ''' Reset the Pico when sampling stops. Once started the
+            watchdog can't be stopped again, not even from the REPL. '''
+        self.wdt = WDT(timeout=timeout_ms)
+
+    def feed_watchdog(self):
+        if self.wdt is not None:
+            self.wdt.feed()
+
     def sound_buzzer(self):
         print('Sounding buzzer...')
 
-        if self.silent == False:
-            for x in range(4):
-                self.BUZZER.high()
-                sleep(0.1)
-                self.BUZZER.low()
-                sleep(0.1)
+        # Four short beeps, runs in the background
+        self.BUZZER.beep(0.1, 0.1, n=4)
+
+    def sound_fault(self):
+        print('Sounding sensor fault...')
 
-                if self.silent == True:
-                    continue
+        # One long beep, so it can't be taken for the alarm
+        self.BUZZER.beep(0.6, 0.1, n=1)
+
+# What the display needs of one update. It is made on the sampling
+# core and handed over whole, the UI core never reads the running
+# state while the next update changes it.
+Snapshot = namedtuple('Snapshot', ('temp', 'alarm', 'fault', 'latched', 'severity',
+                                   'history', 'history_count'))
+
+# Single producer, single consumer ring buffer used to pass values
+# between the two cores. Only the producer moves head and only the
+# consumer moves tail, so no lock is needed. Without a typecode it
+# holds objects.
+class Ring(object):
+
+    def __init__(self, typecode, size):
+        self.items = array(typecode, [0] * size) if typecode else [None] * size
+        self.size = size
+        self.head = 0
+        self.tail = 0
+
+    def put(self, value):
+        head = (self.head + 1) % self.size
+        if head == self.tail:
+            return False  # full, the value is dropped
+
+        self.items[self.head] = value
+        self.head = head
+        return True
+
+    def empty(self):
+        return self.tail == self.head
+
+    def get(self):
+        if self.tail == self.head:
+            return None  # empty
+
+        value = self.items[self.tail]
+        self.tail = (self.tail + 1) % self.size
+        return value
 
 # The state machine class keeps track of possible states,
 # and which state is currently active.
 class StateMachine(object):
 
-    #state = None
-    #states = {}
-    #hardware = None
-    
-    def __init__(self, hardware):
+    UI_POLL_MS = const(10)
+
+    def __init__(self, hardware, settings, transitions=TRANSITIONS):
         self.state = None
         self.hardware = hardware
-        self.states = {}
+        self.settings = settings
+        self.states = [None] * states.COUNT
+        self.ui_core = False          # UI runs on the second core
+        self.samples = None           # Snapshots for the UI core
+        self.ui_events = None         # buttons and events for the UI core
+        self.acks = None              # ticks_ms of acknowledges for the sampling core
+        self.trace = None             # optional trace.Trace recorder
+
+        # Events raised while one is being handled wait in the queue,
+        # so entering a state never recurses into the next one
+        self.queue = Ring('b', 8)
+        self.busy = False
+
+        # (to, guard, action) for every state * events.COUNT + event
+        self.table = [None] * (states.COUNT * events.COUNT)
+        for source, event, target, guard, action in transitions:
+            self.table[source * events.COUNT + event] = (target, guard, action)
         
         print('State machine initialized')
+
+    def start_ui_core(self):
+        ''' Move display rendering and button handling to the second core.
+            Sampling and alarm evaluation stay on this core and never wait
+            for the display. '''
+        self.samples = Ring(None, 16)
+        self.ui_events = Ring('b', 8)
+        self.acks = Ring('i', 4)
+        self.ui_core = True
+        _thread.start_new_thread(self._ui_loop, ())
+
+    def _ui_loop(self):
+        while True:
+            self._ui_step()
+            sleep_ms(self.UI_POLL_MS)
+
+    def _ui_step(self):
+        event = self.ui_events.get()
+        if event is not None:
+            if event <= buttons.RIGHT:
+                self._dispatch_button(event)
+            else:
+                self.dispatch(event)
+
+        # only the newest snapshot is worth drawing
+        latest = None
+        snapshot = self.samples.get()
+        while snapshot is not None:
+            latest = snapshot
+            snapshot = self.samples.get()
+        if latest is not None:
+            self.state.render(self, latest)
         
     def add_state(self, state):
-        print('Adding "%s" state...' % state.name)
-        self.states[state.name] = state
+        self.states[state.id] = state
         print('Added "%s" state' % state.name)
 
-    def go_to_state(self, state_name):
-        print('Going to "%s" state...' % state_name)
-        
-        if self.state:
-            #log('Exiting %s' % (self.state.name))
+    def go_to_state(self, state_id):
+        ''' Enter a state directly, used to start the machine '''
+        self.busy = True
+        self._change(state_id)
+        self._run()
+        self.busy = False
+
+    def dispatch(self, event):
+        ''' Handle an event, or queue it if another one is being handled '''
+        if not self.queue.put(event):
+            self.record(TRACE_DROPPED, event)
+        if not self.busy:
+            self.busy = True
+            self._run()
+            self.busy = False
+
+    def _run(self):
+        event = self.queue.get()
+        while event is not None:
+            # look for a transition from the state, then from its parents
+            transition = None
+            state = self.state
+            while state is not None:
+                transition = self.table[state.id * events.COUNT + event]
+                if transition is not None and (transition[1] is None or transition[1](self)):
+                    break
+                transition = None
+                state = self.parent_of(state)
+
+            self.record(event, transition[0] if transition is not None else -1)
+            if transition is not None:
+                if transition[2] is not None:
+                    transition[2](self)
+                self._change(transition[0])
+            elif event <= buttons.RIGHT:
+                self.state.button_pressed(self, event)
+            event = self.queue.get()
+
+    def parent_of(self, state):
+        if state.parent is None:
+            return None
+        return self.states[state.parent]
+
+    def _change(self, state_id):
+        ''' Exit the states up to the first parent shared with the new
+            state, then enter down to it. Shared parents keep running. '''
+        target = self.states[state_id]
+        while self.state is not None and not self._is_ancestor(self.state, target):
+            self.record(TRACE_EXIT)
             self.state.exit(self)
-        
-        # check if self.states contains the state_name
-        if state_name not in self.states:
-            print('State "%s" not found' % state_name)
+            self.state = self.parent_of(self.state)
+        self._enter_down(self.state, target)
+
+    def _is_ancestor(self, ancestor, state):
+        while state is not None:
+            if state is ancestor:
+                return True
+            state = self.parent_of(state)
+        return False
+
+    def _enter_down(self, ancestor, state):
+        if state is ancestor:
             return
-        
-        self.state = self.states[state_name]
-        #log('Entering %s' % (self.state.name))
-        self.state.enter(self)
+        self._enter_down(ancestor, self.parent_of(state))
+        self.state = state
+        self.record(TRACE_ENTER)
+        state.enter(self)
 
     def update(self):
         if self.state:
             self.state.update(self)
 
     def button_pressed(self, button):
+        if self.ui_core:
+            if not self.ui_events.put(button):
+                self.record(TRACE_DROPPED, button)
+        else:
+            self._dispatch_button(button)
+
+    def post(self, event):
+        ''' Raise an event from the sampling side. With the UI on the
+            second core the event is handled there, like the buttons. '''
+        if self.ui_core:
+            if not self.ui_events.put(event):
+                self.record(TRACE_DROPPED, event)
+        else:
+            self.dispatch(event)
+
+    def record(self, event, payload=0):
+        ''' Add to the trace, if one is attached '''
+        if self.trace is not None:
+            self.trace.record(event, self.state.id if self.state else -1, payload)
+
+    def _dispatch_button(self, button):
+        if self.hardware.wake():
+            return  # The press only switched the display back on
+
         if self.state:
-            self.state.button_pressed(self, button)
+            self.dispatch(button)
+
+    def acknowledge(self, button):
+        ''' Acknowledge the alarm and the sensor fault. With the UI on the
+            second core the sampling core applies it on its next update,
+            only that core changes the alarm engine. '''
+        if self.ui_core:
+            if not self.acks.put(ticks_ms()):
+                self.record(TRACE_DROPPED, button)
+        else:
+            self.states[states.RUNNING].acknowledge(ticks_ms())
+
+    def publish(self, snapshot):
+        ''' Pass a new Snapshot to the display '''
+        if self.ui_core:
+            self.samples.put(snapshot)
+        elif self.state:
+            self.state.render(self, snapshot)
 
 
 # Base class for all states
 class State(object):
     
     oled = None
+    id = None
+    name = ''
+    parent = None                     # id of the parent state
 
     def __init__(self):
         pass
 
-    @property
-    def name(self):
-        return ''
-
     # These are the methods that will be called on each state
     def enter(self, sm):
         print('Entering "%s" state' % self.name)
@@ -111,186 +477,372 @@ class State(object):
         print('Updating "%s" state' % self.name)
         return True
 
+    def render(self, sm, snapshot):
+        pass
+
     def button_pressed(self, sm, button):
         print('Button "%s" pressed' % button)
         pass
 
 class StartState(State):
     
-        @property
-        def name(self):
-            return "start"
+        SPLASH_MS = const(2000)
+
+        id = states.START
+        name = "start"
+        parent = states.RUNNING       # Sampling starts under the splash screen
+        timer = Timer(-1)
         
         def enter(self, sm):
             State.enter(self, sm)
             
             sm.hardware.oled.fill(0)
-            sm.hardware.oled.show()
-
             sm.hardware.oled.rect(0, 0, sm.hardware.oled.width, sm.hardware.oled.height, 1)
             sm.hardware.oled.text("Exhaust", 37, 10)
             sm.hardware.oled.text("temperature", 20, 20)
             sm.hardware.oled.text("alarm", 43, 30)
-            sm.hardware.oled.text("Version {}".format(0.6), 20, 45)
-            sm.hardware.oled.show()
+            sm.hardware.oled.text("Version {}".format(VERSION), 20, 45)
+            sm.hardware.show()
 
             # Test the buzzer
             sm.hardware.sound_buzzer()
             
-            sleep(2)
-            sm.go_to_state('monitor')
+            # Leave the splash on without blocking, the measurements go on meanwhile
+            self.timer.init(period=self.SPLASH_MS, mode=Timer.ONE_SHOT,
+                            callback=lambda timer: sm.post(events.DONE))
         
         def exit(self, sm):
+            self.timer.deinit()
             sm.hardware.oled.fill(0)
-            sm.hardware.oled.show()
+            sm.hardware.show()
         
-class MonitorState(State):
-
-    UPDATE_TIME_MS = const(1000)      # every second
+class RunningState(State):
+    ''' Parent of the monitor and menu views. Owns the sensors, the
+        measurement timer and the alarm, so sampling carries on
+        whichever view is shown. '''
 
     TEMP_SENSOR    = None
     OFFSET_SENSOR  = None
     ADC_REF_VOLT   = 3.3              # Should be 3.3 which is the ref for the ADC, not the 5V VBUS that powers the LM35
     adc_offset     = 0                # Initialize to zero
-    HIST_INTERVAL  = const(7)         # A history point every 7 seconds, giving about 15 minutes graph
-    ALARM_TEMP     = 30               # Alarm temperature, 65 degrees Celsius
-    MIN_TEMP       = const(0)
-    MAX_TEMP       = const(150)
 
     timer          = Timer(-1)
+    period_ms      = None             # Period the timer runs at
     counter        = 0
-    history        = []               # 128 measurements
-    alarm          = False            # Alarm is on
+    history        = ()               # 128 measurements, replaced as a whole
+    history_count  = 0                # Number of history points recorded
+    alarm          = False            # Alarm is on, the engine has the details
+    fault          = 0                # sensor.fault bits
+    fault_acked    = True
+    temp           = None             # Last filtered temperature
+    last_snapshot  = None             # Last Snapshot published
+    first_sample_ms = None            # ticks_ms of the first usable reading, time since reset
+
+    SHED_UPDATES   = const(5)         # Updates without display work after an overrun
+    overruns       = 0                # Updates that took longer than update_time_ms
+    shed           = 0                # Updates left without display work
+    updates_shed   = 0
+
+    id = states.RUNNING
+    name = "running"
 
     def __init__(self):
         self.TEMP_SENSOR = machine.ADC(26)  # Channel 0
         self.OFFSET_SENSOR = machine.ADC(27)  # Channel 1
+        self.outputs = []             # nmea.Output, get every measurement
+        self.engine = AlarmEngine(30)
+        self.health = SensorHealth()
 
-    @property
-    def name(self):
-        return "monitor"
-    
     def enter(self, sm):
         State.enter(self, sm)
         
+        self.start_timer(sm)
+        self.update(sm)  # The first measurement doesn't wait for the timer
+
+    def start_timer(self, sm):
         ''' Start the timer that calls the update routine at set intervals '''
+        self.period_ms = sm.settings.update_time_ms
         # make a lambda so I can pass sm as a parameter to the timer callback
         my_callback = lambda timer: self.update(sm)
-        
-        self.timer.init(period=self.UPDATE_TIME_MS, mode=Timer.PERIODIC, callback=my_callback)
+        self.timer.init(period=self.period_ms, mode=Timer.PERIODIC, callback=my_callback)
             
     def exit(self, sm):
+        State.exit(self, sm)
         self.timer.deinit()
         self.counter = 0
     
     def update(self, sm):
         print('Updating "%s" state' % self.name)
-        # Clear all
-        sm.hardware.oled.fill(0)
-        
-        # Make the measurement
-        measurement = self.TEMP_SENSOR.read_u16() - self.adc_offset
-        voltage = (measurement * (self.ADC_REF_VOLT)) / 65535
-        temp_celsius = voltage / (10.0 / 1000)
+        start = ticks_ms()
+        if sm.settings.update_time_ms != self.period_ms:
+            self.start_timer(sm)  # Changed in the menu
+
+        if sm.acks is not None:
+            now = sm.acks.get()
+            while now is not None:
+                self.acknowledge(now)  # Pressed on the UI core
+                now = sm.acks.get()
+
+        temp_celsius = self.measure(sm)  # None if the reading is unusable
+        self.check_fault(sm)
+        if temp_celsius is not None:
+            sm.record(TRACE_SAMPLE, int(temp_celsius * 100))
+            self.check_alarm(sm, temp_celsius)
+            self.temp = temp_celsius
+            if self.first_sample_ms is None:
+                self.first_sample_ms = ticks_ms()
+                print('First sample {}ms after reset'.format(self.first_sample_ms))
+
+        # Only feed the watchdog once the engine has been checked, a hang
+        # in the display below still gets caught by the next update
+        sm.hardware.feed_watchdog()
+
+        if temp_celsius is not None:
+            for output in self.outputs:
+                output.update(temp_celsius)
+
+        if self.shed > 0:
+            # Behind schedule, the display is the first thing to go
+            self.shed -= 1
+            self.updates_shed += 1
+        elif self.temp is not None:
+            sm.publish(self.snapshot(self.temp))  # Only the view on display draws it
+        elif self.fault:
+            sm.publish(self.snapshot(0.0))  # Nothing to show but the fault
+
+        self.counter = self.counter + 1
+
+        elapsed = ticks_diff(ticks_ms(), start)
+        if elapsed > sm.settings.update_time_ms:
+            self.overruns += 1
+            self.shed = self.SHED_UPDATES
+            sm.record(TRACE_OVERRUN, elapsed)
+            print('Update took %dms' % elapsed)
+
+    def snapshot(self, temp_celsius):
+        engine = self.engine
+        self.last_snapshot = Snapshot(temp_celsius, self.alarm, self.fault, engine.latched,
+                                      engine.severity, self.history, self.history_count)
+        return self.last_snapshot
+
+    def to_celsius(self, raw):
+        ''' Convert an ADC reading of the LM35 '''
+        voltage = ((raw - self.adc_offset) * (self.ADC_REF_VOLT)) / 65535
+        return voltage / (10.0 / 1000)
+
+    def measure(self, sm):
+        ''' Make the measurement and record the history '''
+        raw = self.TEMP_SENSOR.read_u16()
+        temp_celsius = self.health.update(raw, self.to_celsius(raw))
+        if temp_celsius is None:
+            print("Unusable reading: {}".format(raw))
+            return None
         print("Temperature: {:.0f}C".format(temp_celsius))
 
         # Record a history point every n seconds
-        if self.counter % self.HIST_INTERVAL == 0:
-            self.history.append(temp_celsius)
+        if self.counter % sm.settings.hist_interval == 0:
+            history = self.history + (temp_celsius,)
+            if len(history) == 128:
+                history = history[1:]  # remove first element
+            self.history = history
+            self.history_count = self.history_count + 1
+
+        return temp_celsius
+
+    def check_fault(self, sm):
+        fault = self.health.fault
+        if fault != self.fault:
+            sm.record(TRACE_FAULT, fault)
+            if not self.fault:
+                self.fault_acked = False
+                sm.post(events.ALARM)  # Bring the monitor view up
+            elif not fault:
+                self.fault_acked = True
+            self.fault = fault
+
+        if fault and not self.fault_acked and not sm.settings.silent:
+            sm.hardware.sound_fault()
+
+    def needs_ack(self):
+        return self.engine.unacked() or not self.fault_acked
+
+    def acknowledge(self, now):
+        self.engine.acknowledge(now)
+        self.fault_acked = True
+
+    def check_alarm(self, sm, temp_celsius):
+        engine = self.engine
+        engine.set_alarm_temp(sm.settings.alarm_temp)
+
+        if engine.update(temp_celsius, ticks_ms()):
+            sm.record(TRACE_ALARM, engine.severity)
+            self.alarm = engine.severity == severity.ALARM
+            if self.alarm:
+                sm.post(events.ALARM)  # Bring the monitor view up
+
+        if engine.sounding() and not sm.settings.silent:
+            sm.hardware.sound_buzzer()
 
-            if len(self.history) == 128:
-                self.history.pop(0)  # remove first element
+class MonitorState(State):
 
-        # Display the value
-        write20 = Write(sm.hardware.oled, ubuntu_mono_20)
-        if temp_celsius >= self.ALARM_TEMP:
-            self.alarm = True
-            write20.text("!!! {:.0f}C !!!".format(temp_celsius), 10, 0)
-            sm.hardware.sound_buzzer()
+    MIN_TEMP       = const(0)
+    MAX_TEMP       = const(150)
 
-        else:
-            self.alarm = False
-            sm.hardware.silent = False
-            write20.text("{:.0f}C".format(temp_celsius), 50, 0)
+    id = states.MONITOR
+    name = "monitor"
+    parent = states.RUNNING
 
-        # Display the graph
-        scaler = 44 / self.MAX_TEMP  # Scale 0-150 degrees to 0-44 available pixels => 0.2933
-        sm.hardware.oled.rect(0, 20, sm.hardware.oled.width, sm.hardware.oled.height - 20, 1)  # rect around graph
+    def __init__(self):
+        self.fault_icon = StatusIcon(0, 6, ICON_SENSOR)
+        self.temp_label = BigNumber(10, 0, 118, 20, ubuntu_mono_20)
+        self.graph = Graph(0, 20, 128, 44, self.MAX_TEMP, autoscale=True)
+        self.screen = Screen(self.fault_icon, self.temp_label, self.graph)
+    
+    def enter(self, sm):
+        State.enter(self, sm)
+        sm.hardware.last_temp = None  # Redraw on the first update
+        self.screen.invalidate()
+
+        # Coming back from the menu, show the last measurement right away
+        snapshot = sm.states[self.parent].last_snapshot
+        if snapshot is not None:
+            self.render(sm, snapshot)
+
+    def render(self, sm, snapshot):
+        temp_celsius = snapshot.temp
+        urgent = snapshot.alarm or snapshot.fault
+        if urgent:
+            sm.hardware.wake()
+        sm.hardware.idle()
+
+        if not sm.hardware.refresh_due(temp_celsius, urgent):
+            return
 
-        # dotted line at alarm temperature
-        for x in range(sm.hardware.oled.width):
-            if x % 4 == 0:
-                sm.hardware.oled.pixel(x, sm.hardware.oled.height - int(self.ALARM_TEMP * scaler), 1)
+        # Display the value
+        self.fault_icon.show(snapshot.fault != 0)
+        if snapshot.alarm:
+            self.temp_label.set("!!! {:.0f}C !!!".format(temp_celsius), 0)
+        elif snapshot.fault:
+            self.temp_label.set("SENSOR", 30)
+        elif snapshot.latched == severity.ALARM:
+            # Over, but nobody has seen it yet
+            self.temp_label.set("! {:.0f}C !".format(temp_celsius), 20)
+        elif snapshot.severity == severity.WARNING:
+            self.temp_label.set("{:.0f}C !".format(temp_celsius), 30)
+        else:
+            self.temp_label.set("{:.0f}C".format(temp_celsius), 40)
 
-        # historical temperature
-        for x in range(len(self.history)):
-            sm.hardware.oled.pixel(x, sm.hardware.oled.height - int(self.history[x] * scaler), 1)
+        # Display the graph
+        self.graph.set_line(sm.settings.alarm_temp)
+        self.graph.set(snapshot.history, snapshot.history_count)
 
-        # Show it all
-        sm.hardware.oled.show()
-        
-        self.counter = self.counter + 1
+        # Show what changed
+        sm.hardware.draw(self.screen)
     
     def button_pressed(self, machine, button):
-        
-        if self.alarm == True:
-            # If alarm is on, silence it
-            self.silent = True
-
-        else:
-            # No alarm, just handle the button event
-            if button == buttons.ENTER:
-                machine.go_to_state('menu')
+        # Going to the menu is in the transition table, the presses
+        # that end up here acknowledge and silence the alarm and fault
+        machine.acknowledge(button)
+        machine.hardware.last_temp = None  # Redraw without the alarm marks
 
 class MenuState(State):
 
-    menu = [
-        "Alarm temp %sC" % MonitorState.ALARM_TEMP, 
-        "Graph time %ss" % (MonitorState.HIST_INTERVAL * MonitorState.UPDATE_TIME_MS / 1000),
-        "Info",
-        "Exit"
-    ]
-    selected_line = 1 # the currently selected line in the menu
-    line_height = 10
-
-    @property
-    def name(self):
-        return "menu"
+    id = states.MENU
+    name = "menu"
+    parent = states.RUNNING
+
+    def __init__(self, settings):
+        # The same ranges as Settings.load clamps to
+        temp_low, temp_high = settings.TYPES['alarm_temp'][1]
+        interval_low, interval_high = settings.TYPES['hist_interval'][1]
+        update_low, update_high = settings.TYPES['update_time_ms'][1]
+        self.root = Menu([
+            MenuItem("Alarm temp", lambda: settings.alarm_temp, fmt="%sC",
+                     setter=lambda v: setattr(settings, 'alarm_temp', v), step=5, low=temp_low, high=temp_high),
+            MenuItem("Graph time", lambda: settings.hist_interval,
+                     fmt=lambda v: "%ss" % (v * settings.update_time_ms // 1000),
+                     setter=lambda v: setattr(settings, 'hist_interval', v), low=interval_low, high=interval_high),
+            MenuItem("Update", lambda: settings.update_time_ms, fmt="%sms",
+                     setter=lambda v: setattr(settings, 'update_time_ms', v), step=250, low=update_low, high=update_high),
+            MenuItem("Silent", lambda: settings.silent, fmt=lambda v: "yes" if v else "no",
+                     setter=lambda v: setattr(settings, 'silent', v)),
+            MenuItem("Info", submenu=Menu([
+                MenuItem("Version", lambda: VERSION),
+                MenuItem("Back"),
+            ])),
+            MenuItem("Exit", action=lambda sm: sm.dispatch(events.EXIT)),
+        ])
+        self.menu = self.root
+        self.menu_list = MenuList(0, 0, 128, 64)
+        self.screen = Screen(self.menu_list)
     
     def enter(self, sm):
         State.enter(self, sm)
+        self._open(self.root)
+        self.screen.invalidate()
         self._display_menu(sm)
 
     def button_pressed(self, sm, button):
+        if self.menu.editing is not None:
+            self._edit(sm, button)
+            self._display_menu(sm)
+            return
+
+        count = len(self.menu.items)
+
         if button == buttons.ENTER:
-            sm.go_to_state('monitor')
+            if self._activate(sm, self.menu.items[self.menu.selected]):
+                return  # Leaving the menu
 
         elif button == buttons.LEFT:
-            self.selected_line = self.selected_line - 1
-            if self.selected_line < 1:
-                self.selected_line = len(self.menu)
-            self._display_menu(sm)
+            self.menu_list.select((self.menu.selected - 1) % count)
 
         elif button == buttons.RIGHT:
-            self.selected_line = self.selected_line + 1
-            if self.selected_line > len(self.menu):
-                self.selected_line = 1
-            self._display_menu(sm)
-            
-    def _display_menu(self, sm):
-        sm.hardware.oled.fill(0) # clear the screen
+            self.menu_list.select((self.menu.selected + 1) % count)
+
+        self._display_menu(sm)
+
+    def _open(self, menu):
+        menu.editing = None
+        self.menu = menu
+        self.menu_list.show_menu(menu)
 
-        pix_res_x = const(128)
-        pix_res_y = const(64)
+    def _edit(self, sm, button):
+        ''' LEFT/RIGHT change the value, ENTER commits and saves it '''
+        menu = self.menu
+        item = menu.items[menu.selected]
 
-        # iterate over menu items with item and index
-        for index, item in enumerate(self.menu):
+        if button == buttons.ENTER:
+            item.setter(menu.editing)
+            menu.editing = None
+            sm.settings.save()
+        elif button == buttons.LEFT:
+            menu.editing = item.adjust(menu.editing, -1)
+        elif button == buttons.RIGHT:
+            menu.editing = item.adjust(menu.editing, 1)
+
+        self.menu_list.invalidate_item(menu.selected)
+
+    def _activate(self, sm, item):
+        ''' Returns True if the menu is being left '''
+        if item.setter is not None:
+            self.menu.editing = item.getter()
+            self.menu_list.invalidate_item(self.menu.selected)
+        elif item.submenu is not None:
+            self._open(item.submenu)
+        elif item.action is not None:
+            item.action(sm)
+            return not sm.queue.empty()  # The action raised an event
+        elif self.menu.parent is not None:
+            self._open(self.menu.parent)  # Plain items go back up a level
+        else:
+            sm.dispatch(events.EXIT)
+            return True
+        return False
             
-            # invert the currently selected item
-            if index == self.selected_line - 1:
-                sm.hardware.oled.fill_rect(0, index * self.line_height, pix_res_x, self.line_height, 1)
-                sm.hardware.oled.text(item, 10, index * self.line_height, 0)
-            else:
-                sm.hardware.oled.text(item, 10, index * self.line_height)
+    def render(self, sm, snapshot):
+        if sm.hardware.recovered:
+            self._display_menu(sm)  # The display came back blank
 
-        sm.hardware.oled.show()
+    def _display_menu(self, sm):
+        sm.hardware.draw(self.screen)
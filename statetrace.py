@@ -0,0 +1,83 @@
+###############################################################
+# State machine trace recorder
+#
+# Keeps the last records of what the state machine did in a
+# preallocated circular array: (ticks_us, event, state, payload).
+# Recording is a few array stores, so it can stay on. Save the
+# trace from the REPL and read it with tools/decode_trace.py:
+#   >>> sm.trace.save()
+#   >>> sm.trace.write(sys.stdout.buffer)   # straight to serial
+# Named so it doesn't hide the standard trace module on the
+# computer, where the decoder imports the record ids from here.
+###############################################################
+
+from array import array
+import struct
+
+try:
+    from micropython import const
+    from utime import ticks_us
+except ImportError:
+    # on the host, where the decoder reads the record ids
+    from time import monotonic_ns
+    const = lambda value: value
+    def ticks_us():
+        return (monotonic_ns() // 1000) & 0x3FFFFFFF
+
+# Record ids next to the state machine events, which are all below 100
+TRACE_ENTER   = const(100)        # Entered a state
+TRACE_EXIT    = const(101)        # Exited a state
+TRACE_DROPPED = const(102)        # An event was dropped, the payload is the event
+TRACE_SAMPLE  = const(103)        # A measurement, the payload is in centi-degrees
+TRACE_OVERRUN = const(104)        # An update took too long, the payload is in ms
+TRACE_ALARM   = const(105)        # The alarm severity changed, the payload is the new one
+TRACE_FAULT   = const(106)        # The sensor faults changed, the payload is sensor.fault bits
+
+MAGIC = b'TRC1'
+
+class Trace(object):
+
+    FILE = 'trace.bin'
+    FIELDS = const(4)
+
+    def __init__(self, size=256):
+        self.size = size
+        self.records = array('i', [0] * (size * self.FIELDS))
+        self.index = 0            # next field to write
+        self.wrapped = False      # the oldest records are being overwritten
+
+    def record(self, event, state, payload=0):
+        # Records made at the same moment on both cores can overwrite
+        # each other, that is the price of not taking a lock here.
+        i = self.index
+        records = self.records
+        records[i] = ticks_us()
+        records[i + 1] = event
+        records[i + 2] = state
+        records[i + 3] = payload
+        i += self.FIELDS
+        if i == len(records):
+            i = 0
+            self.wrapped = True
+        self.index = i
+
+    def clear(self):
+        self.index = 0
+        self.wrapped = False
+
+    def write(self, stream):
+        ''' Write the records, oldest first, after a small header '''
+        index = self.index
+        count = self.size if self.wrapped else index // self.FIELDS
+        stream.write(MAGIC)
+        stream.write(struct.pack('<H', count))
+
+        data = memoryview(self.records)
+        if self.wrapped:
+            stream.write(data[index:])
+        stream.write(data[:index])
+
+    def save(self, path=FILE):
+        with open(path, 'wb') as f:
+            self.write(f)
+        print('Trace saved to "%s"' % path)
@@ -0,0 +1,111 @@
+###############################################################
+# Binary telemetry frames
+#
+# Samples the sensor at its own rate and writes a fixed size
+# frame per sample, by default to the USB serial port. Debug
+# prints end up in between, the host finds the frames again by
+# their sync word and CRC. Read them with tools/record_telemetry.py.
+#
+# Frame, little endian, 17 bytes:
+#   sync      u16  0xA55A
+#   seq       u16  frame counter, wraps around
+#   ticks     u32  ticks_us of the sample
+#   raw       u16  temperature ADC reading
+#   offset    u16  offset ADC reading
+#   centi     i16  temperature in 1/100 degrees Celsius
+#   flags     u8   FLAG_* bits
+#   crc       u16  CRC-16/CCITT of the bytes before it
+###############################################################
+
+from utime import ticks_us
+from machine import Timer
+from array import array
+import struct
+import sys
+
+SYNC          = const(0xA55A)
+FORMAT        = '<HHIHHhB'
+CRC_AT        = const(15)         # struct.calcsize(FORMAT)
+FRAME_SIZE    = const(17)
+
+FLAG_ALARM    = const(1)          # The alarm is on
+FLAG_SILENT   = const(2)          # The buzzer is silenced
+FLAG_HEADLESS = const(4)          # The display is faulty
+FLAG_SHEDDING = const(8)          # Updates are late, the display is skipped
+FLAG_FAULT    = const(16)         # The sensor is faulty
+
+def _crc_table():
+    table = array('H', [0] * 256)
+    for i in range(256):
+        crc = i << 8
+        for bit in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table[i] = crc
+    return table
+
+CRC_TABLE = _crc_table()
+
+def crc16(data, length):
+    crc = 0xFFFF
+    table = CRC_TABLE
+    for i in range(length):
+        crc = ((crc << 8) & 0xFFFF) ^ table[(crc >> 8) ^ data[i]]
+    return crc
+
+class Telemetry(object):
+
+    def __init__(self, sm, running, rate_hz=100, stream=None):
+        self.sm = sm
+        self.running = running    # the state that owns the sensors and the alarm
+        self.rate_hz = rate_hz
+        self.stream = stream if stream is not None else sys.stdout.buffer
+        self.frame = bytearray(FRAME_SIZE)
+        self.seq = 0
+        self.errors = 0           # frames that could not be written
+        self.timer = Timer(-1)
+
+    def start(self):
+        self.timer.init(freq=self.rate_hz, mode=Timer.PERIODIC, callback=self._tick)
+
+    def stop(self):
+        self.timer.deinit()
+
+    def _tick(self, timer):
+        self.send()
+
+    def flags(self):
+        running = self.running
+        hardware = self.sm.hardware
+        flags = 0
+        if running.alarm:
+            flags |= FLAG_ALARM
+        if self.sm.settings.silent or running.engine.silenced():
+            flags |= FLAG_SILENT
+        if not hardware.display_ok:
+            flags |= FLAG_HEADLESS
+        if running.shed > 0:
+            flags |= FLAG_SHEDDING
+        if running.fault:
+            flags |= FLAG_FAULT
+        return flags
+
+    def send(self):
+        ''' Sample the sensor and write one frame '''
+        running = self.running
+        raw = running.TEMP_SENSOR.read_u16()
+        offset = running.OFFSET_SENSOR.read_u16()
+        centi = int(running.to_celsius(raw) * 100)
+
+        frame = self.frame
+        struct.pack_into(FORMAT, frame, 0, SYNC, self.seq, ticks_us(), raw, offset,
+                         max(-32768, min(32767, centi)), self.flags())
+        struct.pack_into('<H', frame, CRC_AT, crc16(frame, CRC_AT))
+        self.seq = (self.seq + 1) & 0xFFFF
+
+        try:
+            self.stream.write(frame)
+        except OSError:
+            self.errors += 1
@@ -0,0 +1,66 @@
+###############################################################
+# Host tests
+#
+# The application runs against the fakes in tests/fakes instead
+# of the MicroPython modules:
+#   python3 -m pytest -q tests
+###############################################################
+
+import builtins
+import os
+import sys
+import time
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, 'fakes'))
+sys.path.insert(1, os.path.dirname(HERE))
+
+builtins.const = lambda value: value  # a builtin on MicroPython
+
+import utime
+
+# picozero takes the ticks from time, as MicroPython has them there
+time.ticks_ms = utime.ticks_ms
+time.ticks_us = utime.ticks_us
+time.ticks_diff = utime.ticks_diff
+
+@pytest.fixture(autouse=True)
+def clock(tmp_path, monkeypatch):
+    ''' Every test starts at tick 0, in a directory of its own for
+        settings.json and the like '''
+    utime.reset()
+    monkeypatch.chdir(tmp_path)
+    return utime
+
+@pytest.fixture
+def make_machine():
+    ''' Builds the state machine as main.py does and runs it past the
+        splash screen. Sampling is driven with running.timer.fire(). '''
+    import machine
+    import ssd1306
+    import statemachine
+    from settings import Settings
+
+    def make(settings=None, temp_celsius=20.0, start=True):
+        settings = settings or Settings()
+        oled = ssd1306.SSD1306_I2C(128, 64, machine.I2C(1), init=False)
+        sm = statemachine.StateMachine(statemachine.Hardware(oled), settings)
+        sm.add_state(statemachine.StartState())
+        sm.add_state(statemachine.RunningState())
+        sm.add_state(statemachine.MonitorState())
+        sm.add_state(statemachine.MenuState(settings))
+        set_temp(sm, temp_celsius)
+        if start:
+            sm.go_to_state(statemachine.states.START)
+            sm.states[statemachine.states.START].timer.fire()  # the splash is over
+        return sm
+
+    return make
+
+def set_temp(sm, temp_celsius):
+    ''' Make the sensor read this temperature '''
+    import statemachine
+    running = sm.states[statemachine.states.RUNNING]
+    running.TEMP_SENSOR.value = int(temp_celsius * 0.01 * 65535 / running.ADC_REF_VOLT)
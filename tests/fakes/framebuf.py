@@ -0,0 +1,86 @@
+###############################################################
+# Fake framebuf for the host tests, plain Python and slow but
+# the same pixels as MicroPython's for what the app draws
+###############################################################
+
+MONO_VLSB = 0
+MONO_HLSB = 3
+
+class FrameBuffer(object):
+
+    def __init__(self, buffer, width, height, format):
+        self._buffer = buffer
+        self._width = width
+        self._height = height
+        self._format = format
+
+    def pixel(self, x, y, c=None):
+        if not (0 <= x < self._width and 0 <= y < self._height):
+            return None if c is not None else 0
+        if self._format == MONO_VLSB:
+            index = (y >> 3) * self._width + x
+            bit = 1 << (y & 7)
+        else:
+            index = (y * self._width + x) >> 3
+            bit = 0x80 >> (x & 7)
+        if c is None:
+            return 1 if self._buffer[index] & bit else 0
+        if c:
+            self._buffer[index] |= bit
+        else:
+            self._buffer[index] &= ~bit & 0xFF
+
+    def fill(self, c):
+        value = 0xFF if c else 0
+        for i in range(len(self._buffer)):
+            self._buffer[i] = value
+
+    def fill_rect(self, x, y, w, h, c):
+        for yy in range(max(y, 0), min(y + h, self._height)):
+            for xx in range(max(x, 0), min(x + w, self._width)):
+                self.pixel(xx, yy, c)
+
+    def hline(self, x, y, w, c):
+        self.fill_rect(x, y, w, 1, c)
+
+    def vline(self, x, y, h, c):
+        self.fill_rect(x, y, 1, h, c)
+
+    def rect(self, x, y, w, h, c, f=False):
+        if f:
+            self.fill_rect(x, y, w, h, c)
+            return
+        self.hline(x, y, w, c)
+        self.hline(x, y + h - 1, w, c)
+        self.vline(x, y, h, c)
+        self.vline(x + w - 1, y, h, c)
+
+    def line(self, x1, y1, x2, y2, c):
+        dx = abs(x2 - x1)
+        dy = -abs(y2 - y1)
+        sx = 1 if x1 < x2 else -1
+        sy = 1 if y1 < y2 else -1
+        error = dx + dy
+        while True:
+            self.pixel(x1, y1, c)
+            if x1 == x2 and y1 == y2:
+                return
+            twice = 2 * error
+            if twice >= dy:
+                error += dy
+                x1 += sx
+            if twice <= dx:
+                error += dx
+                y1 += sy
+
+    def text(self, s, x, y, c=1):
+        # a block per character, the real font doesn't matter here
+        for i in range(len(s)):
+            self.fill_rect(x + i * 8 + 1, y + 1, 6, 6, c)
+
+    def blit(self, source, x, y, key=-1):
+        for yy in range(source._height):
+            for xx in range(source._width):
+                c = source.pixel(xx, yy)
+                if c != key:
+                    self.pixel(x + xx, y + yy, c)
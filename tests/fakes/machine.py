@@ -0,0 +1,171 @@
+###############################################################
+# Fake machine module for the host tests
+#
+# Just enough of the RP2040 peripherals to run the application.
+# Timers don't run on their own, a test calls fire(). The WDT
+# records its feeds against the utime clock.
+###############################################################
+
+import utime
+
+def freq():
+    return 125000000
+
+_pins = {}                        # by GPIO number, for mem32
+
+class Pin(object):
+    IN = 0
+    OUT = 1
+    OPEN_DRAIN = 2
+    PULL_UP = 1
+    PULL_DOWN = 2
+    IRQ_RISING = 4
+    IRQ_FALLING = 8
+
+    def __init__(self, id, mode=None, pull=None, value=None):
+        self.id = id
+        self._value = value or 0
+        self.handler = None
+        if type(id) is int:
+            _pins[id] = self
+
+    def init(self, *args, **kwargs):
+        pass
+
+    def value(self, value=None):
+        if value is None:
+            return self._value
+        self._value = value
+
+    def on(self):
+        self._value = 1
+
+    def off(self):
+        self._value = 0
+
+    high = on
+    low = off
+
+    def irq(self, handler=None, trigger=0, hard=False):
+        self.handler = handler
+
+class _Memory(object):
+    ''' The SIO GPIO output registers, acting on the Pins '''
+
+    GPIO_OUT     = 0xD0000010
+    GPIO_OUT_SET = 0xD0000014
+    GPIO_OUT_CLR = 0xD0000018
+    GPIO_OUT_XOR = 0xD000001C
+
+    def __init__(self):
+        self.writes = []          # (address, value)
+
+    def __getitem__(self, address):
+        assert address == self.GPIO_OUT
+        return sum(1 << id for id, pin in _pins.items() if pin._value)
+
+    def __setitem__(self, address, value):
+        self.writes.append((address, value))
+        for id, pin in _pins.items():
+            if value & (1 << id):
+                if address == self.GPIO_OUT_SET:
+                    pin._value = 1
+                elif address == self.GPIO_OUT_CLR:
+                    pin._value = 0
+                elif address == self.GPIO_OUT_XOR:
+                    pin._value ^= 1
+
+mem32 = _Memory()
+
+class PWM(object):
+
+    def __init__(self, pin):
+        self._freq = 1000
+        self._duty = 0
+
+    def freq(self, value=None):
+        if value is None:
+            return self._freq
+        self._freq = value
+
+    def duty_u16(self, value=None):
+        if value is None:
+            return self._duty
+        self._duty = value
+
+    def deinit(self):
+        pass
+
+class Timer(object):
+    ONE_SHOT = 0
+    PERIODIC = 1
+
+    def __init__(self, id=-1):
+        self.callback = None
+        self.period = None
+        self.mode = None
+        self.fire_count = 0
+
+    def init(self, mode=PERIODIC, period=None, freq=None, callback=None):
+        self.mode = mode
+        self.period = period if freq is None else 1000 // freq
+        self.callback = callback
+
+    def deinit(self):
+        self.callback = None
+
+    def fire(self):
+        self.fire_count += 1
+        callback = self.callback
+        if self.mode == Timer.ONE_SHOT:
+            self.callback = None
+        if callback is not None:
+            callback(self)
+
+class ADC(object):
+
+    def __init__(self, channel):
+        self.channel = channel
+        self.value = 0
+
+    def read_u16(self):
+        return self.value
+
+class WDT(object):
+
+    def __init__(self, id=0, timeout=5000):
+        self.timeout = timeout
+        self.fed_at = utime.ticks_ms()
+        self.feeds = 0
+
+    def feed(self):
+        self.fed_at = utime.ticks_ms()
+        self.feeds += 1
+
+    def expired(self):
+        ''' Would the Pico have been reset by now? '''
+        return utime.ticks_diff(utime.ticks_ms(), self.fed_at) > self.timeout
+
+class I2C(object):
+
+    def __init__(self, id=0, scl=None, sda=None, freq=400000):
+        self.writes = []
+
+    def scan(self):
+        return [0x3C]
+
+    def writeto(self, addr, data):
+        self.writes.append(bytes(data))
+        return len(data)
+
+    def writevto(self, addr, vector):
+        self.writes.append(b''.join(bytes(data) for data in vector))
+
+class UART(object):
+
+    def __init__(self, id=0, baudrate=9600, tx=None, rx=None, txbuf=None):
+        self.sent = bytearray()
+
+    def write(self, data):
+        self.sent += data
+        return len(data)
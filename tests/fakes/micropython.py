@@ -0,0 +1,9 @@
+###############################################################
+# Fake micropython module for the host tests
+###############################################################
+
+def const(value):
+    return value
+
+def schedule(function, argument):
+    function(argument)
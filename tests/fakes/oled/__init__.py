@@ -0,0 +1,12 @@
+###############################################################
+# Fake oled package for the host tests
+###############################################################
+
+class Write(object):
+
+    def __init__(self, fb, font):
+        self.fb = fb
+        self.font = font
+
+    def text(self, s, x, y, c=1):
+        self.fb.text(s, x, y, c)
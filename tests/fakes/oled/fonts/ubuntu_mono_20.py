@@ -0,0 +1,4 @@
+# Fake font for the host tests
+
+def height():
+    return 20
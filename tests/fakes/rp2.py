@@ -0,0 +1,35 @@
+###############################################################
+# Fake rp2 module for the host tests
+#
+# The PIO programs are not run, a StateMachine only records
+# what it was given and whether it is active.
+###############################################################
+
+class PIO(object):
+    OUT_LOW = 0
+    OUT_HIGH = 1
+    SHIFT_LEFT = 0
+    SHIFT_RIGHT = 1
+
+def asm_pio(**options):
+    def program(function):
+        return function
+    return program
+
+class StateMachine(object):
+
+    def __init__(self, id, program=None, freq=None, set_base=None):
+        self.id = id
+        self.program = program
+        self.freq = freq
+        self.set_base = set_base
+        self.words = []
+        self._active = 0
+
+    def put(self, word):
+        self.words.append(word)
+
+    def active(self, value=None):
+        if value is None:
+            return self._active
+        self._active = value
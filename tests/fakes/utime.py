@@ -0,0 +1,39 @@
+###############################################################
+# Fake utime for the host tests
+#
+# A virtual clock that only moves when a test, or a sleep, moves
+# it, so timing paths run the same every time.
+###############################################################
+
+TICKS_PERIOD = 1 << 30
+
+_now_us = 0
+
+def reset():
+    global _now_us
+    _now_us = 0
+
+def advance(ms):
+    global _now_us
+    _now_us += int(ms * 1000)
+
+def ticks_us():
+    return _now_us % TICKS_PERIOD
+
+def ticks_ms():
+    return (_now_us // 1000) % TICKS_PERIOD
+
+def ticks_add(ticks, delta):
+    return (ticks + delta) % TICKS_PERIOD
+
+def ticks_diff(a, b):
+    return ((a - b + TICKS_PERIOD // 2) % TICKS_PERIOD) - TICKS_PERIOD // 2
+
+def sleep(seconds):
+    advance(seconds * 1000)
+
+def sleep_ms(ms):
+    advance(ms)
+
+def sleep_us(us):
+    advance(us / 1000)
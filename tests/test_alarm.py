@@ -0,0 +1,118 @@
+###############################################################
+# alarm.AlarmEngine on its own, with made up timestamps
+###############################################################
+
+import pytest
+
+import utime
+
+from alarm import AlarmEngine, severity
+
+ALARM = 30.0
+WARNING = ALARM - AlarmEngine.WARNING_BELOW
+
+def feed(engine, temps, now=0, step=1000):
+    ''' Returns the severity after every measurement '''
+    out = []
+    for temp in temps:
+        engine.update(temp, now)
+        out.append(engine.severity)
+        now += step
+    return out
+
+@pytest.fixture
+def engine():
+    return AlarmEngine(ALARM)
+
+def test_confirm_of_window(engine):
+    # two of five above is not enough, the third one raises it
+    assert feed(engine, [31, 20, 31, 20, 31]) == [0, 0, 0, 0, severity.ALARM]
+
+def test_confirm_counts_only_the_window(engine):
+    # the same three above, but spread over more than five samples
+    assert feed(engine, [31, 20, 20, 20, 31, 20, 20, 20, 31]) == [0] * 9
+
+def test_single_spike_is_ignored(engine):
+    assert feed(engine, [20, 50, 20, 20, 20]) == [0] * 5
+    assert not engine.unacked()
+
+def test_raised_at_the_threshold_itself(engine):
+    assert feed(engine, [ALARM] * 3)[-1] == severity.ALARM
+
+def test_hysteresis_keeps_it_on(engine):
+    feed(engine, [31] * 5)
+    # just under the alarm temperature, but not by the hysteresis
+    assert feed(engine, [ALARM - 1.0] * 10) == [severity.ALARM] * 10
+
+def test_cleared_below_the_hysteresis(engine):
+    feed(engine, [31] * 5)
+    below = ALARM - AlarmEngine.HYSTERESIS - 0.5
+    out = feed(engine, [below] * 3)
+    assert out == [severity.ALARM, severity.ALARM, severity.WARNING]
+
+def test_warning_level(engine):
+    out = feed(engine, [WARNING] * 3 + [ALARM] * 3)
+    assert out == [0, 0, severity.WARNING, severity.WARNING, severity.WARNING, severity.ALARM]
+
+def test_update_reports_changes(engine):
+    changes = [engine.update(t, 0) for t in [31, 31, 31, 31]]
+    assert changes == [False, False, True, False]
+
+def test_latched_until_acknowledged(engine):
+    feed(engine, [31] * 3)
+    feed(engine, [10] * 5)
+    assert engine.severity == severity.NORMAL
+    assert engine.latched == severity.ALARM
+    assert engine.unacked()
+
+    engine.acknowledge(10000)
+    assert engine.latched == severity.NORMAL
+    assert not engine.unacked()
+    assert not engine.silenced()     # nothing sounding to silence
+
+def test_acknowledge_silences(engine):
+    feed(engine, [31] * 3)
+    assert engine.sounding()
+    engine.acknowledge(3000)
+    assert engine.silenced() and not engine.sounding()
+    assert engine.latched == severity.ALARM
+
+    # still hot, still quiet within the silence time
+    feed(engine, [31] * 10, now=4000)
+    assert not engine.sounding() and not engine.unacked()
+
+def test_silence_runs_out_and_rearms(engine):
+    feed(engine, [31] * 3)
+    engine.acknowledge(0)
+    engine.update(31, AlarmEngine.SILENCE_MS - 1)
+    assert not engine.sounding()
+    engine.update(31, AlarmEngine.SILENCE_MS)
+    assert engine.sounding()
+    assert engine.unacked()           # needs a new acknowledge
+
+def test_silence_ends_when_the_alarm_does(engine):
+    feed(engine, [31] * 3)
+    engine.acknowledge(0)
+    feed(engine, [10] * 3, now=1000)
+    assert engine.severity == severity.NORMAL
+    assert not engine.silenced()
+
+    # a new alarm sounds right away
+    feed(engine, [31] * 3, now=10000)
+    assert engine.sounding() and engine.unacked()
+
+def test_silence_across_ticks_wrap(engine):
+    feed(engine, [31] * 3)
+    start = utime.TICKS_PERIOD - 1000
+    engine.acknowledge(start)
+    engine.update(31, (start + AlarmEngine.SILENCE_MS - 1) % utime.TICKS_PERIOD)
+    assert not engine.sounding()
+    engine.update(31, (start + AlarmEngine.SILENCE_MS) % utime.TICKS_PERIOD)
+    assert engine.sounding()
+
+def test_alarm_temp_moved(engine):
+    feed(engine, [31] * 3)
+    engine.set_alarm_temp(40)
+    # under the new alarm temperature less the hysteresis, over the warning
+    out = feed(engine, [36] * 3)
+    assert out == [severity.ALARM, severity.ALARM, severity.WARNING]
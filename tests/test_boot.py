@@ -0,0 +1,42 @@
+###############################################################
+# Boot to the first sample: it is taken as the splash screen
+# goes up, not after it and not one update period later
+###############################################################
+
+import utime
+from statemachine import states, events, StartState
+from statetrace import Trace, TRACE_ENTER, TRACE_SAMPLE
+
+def boot(make_machine):
+    ''' Boot as main.py does, with the trace on, and let the splash
+        timer run out. Returns the records as (ticks_us, event, state). '''
+    sm = make_machine(start=False)
+    sm.trace = Trace()
+    sm.go_to_state(states.START)
+    timers = [sm.states[states.START].timer, sm.states[states.RUNNING].timer]
+    fired = [timer.fire_count for timer in timers]
+
+    utime.advance(StartState.SPLASH_MS)
+    sm.states[states.START].timer.fire()
+    records = sm.trace.records[:sm.trace.index]
+    return sm, fired, [tuple(records[i:i + 3]) for i in range(0, len(records), Trace.FIELDS)]
+
+def test_first_sample_before_the_splash_timer(make_machine):
+    sm, fired, records = boot(make_machine)
+    events_only = [event for ticks, event, state in records]
+    sample = events_only.index(TRACE_SAMPLE)
+    done = events_only.index(events.DONE)
+    # taken on the way into START, by RUNNING before the splash goes up
+    assert records[sample][2] == states.RUNNING
+    assert sample < done
+    # a whole splash before it leaves, without any timer firing first
+    assert records[done][0] - records[sample][0] >= StartState.SPLASH_MS * 1000
+    assert fired == [0, 0]
+
+def test_states_entered_in_order(make_machine):
+    sm, fired, records = boot(make_machine)
+    entered = [state for ticks, event, state in records if event == TRACE_ENTER]
+    assert entered == [states.RUNNING, states.START, states.MONITOR]
+    assert sm.state.id == states.MONITOR
+    # RUNNING stays entered, its update timer keeps the measurements going
+    assert sm.states[states.RUNNING].timer.period == sm.settings.update_time_ms
@@ -0,0 +1,117 @@
+###############################################################
+# NMEA output loopback: what goes out of the UART is parsed back
+###############################################################
+
+import struct
+
+import pytest
+
+import utime
+from machine import UART
+from nmea import NMEA0183, NMEA2000
+
+def parse(line):
+    ''' Checks the framing and checksum, returns the fields '''
+    assert line.startswith(b'$') and line.endswith(b'\r\n')
+    assert len(line) <= 82
+    body, _, crc = line[1:-2].partition(b'*')
+    expected = 0
+    for c in body:
+        expected ^= c
+    assert crc == b'%02X' % expected
+    return body.decode().split(',')
+
+def sentences(uart):
+    return [line + b'\n' for line in bytes(uart.sent).split(b'\n') if line]
+
+TEMPS = [20.0, 0.0, 0.04, 9.96, 99.95, 123.4, 650.0, -0.3, -12.24]
+
+@pytest.mark.parametrize('temp', TEMPS)
+def test_xdr(temp):
+    uart = UART(0)
+    NMEA0183(uart, interval_ms=0).update(temp)
+    fields = parse(bytes(uart.sent))
+    assert fields[0] == 'IIXDR'
+    assert fields[1] == 'C'
+    assert float(fields[2]) == pytest.approx(temp, abs=0.05)
+    assert fields[3:] == ['C', 'EXHAUST']
+
+@pytest.mark.parametrize('temp', TEMPS)
+def test_mtw(temp):
+    uart = UART(0)
+    NMEA0183(uart, sentence='MTW', talker='YD', interval_ms=0).update(temp)
+    fields = parse(bytes(uart.sent))
+    assert fields[0] == 'YDMTW'
+    assert float(fields[1]) == pytest.approx(temp, abs=0.05)
+    assert fields[2:] == ['C']
+
+def test_one_decimal():
+    uart = UART(0)
+    NMEA0183(uart, interval_ms=0).update(85.0)
+    assert parse(bytes(uart.sent))[2] == '85.0'
+
+def test_sentences_follow_each_other():
+    uart = UART(0)
+    output = NMEA0183(uart, interval_ms=0)
+    for temp in (120.0, 9.5, 100.0):
+        output.update(temp)
+    # a shorter sentence after a longer one leaves nothing behind
+    assert [float(parse(line)[2]) for line in sentences(uart)] == [120.0, 9.5, 100.0]
+
+def test_interval():
+    uart = UART(0)
+    output = NMEA0183(uart, interval_ms=1000)
+    for i in range(10):
+        output.update(50.0)
+        utime.advance(250)
+    assert output.sent == 3
+    assert len(sentences(uart)) == 3
+
+def test_write_errors_are_counted():
+    class Broken(object):
+        def write(self, data):
+            raise OSError(5)
+    output = NMEA0183(Broken(), interval_ms=0)
+    output.update(50.0)
+    assert output.errors == 1
+    assert output.sent == 0
+
+def test_unsupported_sentence():
+    with pytest.raises(ValueError):
+        NMEA0183(UART(0), sentence='MDA')
+
+class Bus(object):
+
+    def __init__(self):
+        self.frames = []
+
+    def send(self, pgn, priority, data):
+        self.frames.append((pgn, priority, bytes(data)))
+
+@pytest.mark.parametrize('temp', [20.0, 0.0, -40.0, 450.5])
+def test_pgn_130316(temp):
+    bus = Bus()
+    NMEA2000(bus, instance=3, interval_ms=0).update(temp)
+    (pgn, priority, data), = bus.frames
+    assert pgn == 130316
+    assert priority == 5
+    assert len(data) == 8
+    sid, instance, source = struct.unpack_from('<BBB', data)
+    assert (sid, instance, source) == (0, 3, 14)
+    kelvin = int.from_bytes(data[3:6], 'little') / 1000
+    assert kelvin - 273.15 == pytest.approx(temp, abs=0.001)
+    assert data[6:] == b'\xff\xff'
+
+def test_pgn_20c_bytes():
+    bus = Bus()
+    NMEA2000(bus, interval_ms=0).update(20.0)
+    assert bus.frames[0][2] == bytes([0, 0, 14, 0x1E, 0x79, 0x04, 0xFF, 0xFF])
+
+def test_pgn_sequence_id():
+    bus = Bus()
+    output = NMEA2000(bus, interval_ms=0)
+    for i in range(255):
+        output.update(20.0)
+    sids = [data[0] for _, _, data in bus.frames]
+    assert sids[:3] == [0, 1, 2]
+    assert sids[252:] == [252, 0, 1]
@@ -0,0 +1,53 @@
+###############################################################
+# picozero.OutputGroup and the RGBLED on top of it
+###############################################################
+
+import pytest
+
+import machine
+from picozero import OutputGroup, DigitalLED, PWMLED, RGBLED
+
+SET, CLR = OutputGroup.SIO_GPIO_OUT_SET, OutputGroup.SIO_GPIO_OUT_CLR
+
+@pytest.fixture
+def bar():
+    bar = OutputGroup(DigitalLED(2), DigitalLED(3), DigitalLED(4))
+    del machine.mem32.writes[:]
+    yield bar
+    bar.close()
+
+def test_digital_pins_in_one_set_and_one_clear(bar):
+    bar.value = (1, 0, 1)
+    assert machine.mem32.writes == [(SET, 0b10100), (CLR, 0b01000)]
+    assert bar.value == (1, 0, 1)
+
+def test_no_read_modify_write(bar):
+    other = machine.Pin(5, machine.Pin.OUT)
+    bar.value = (0, 1, 1)
+    other.on()                # another writer, after the group
+    bar.value = (1, 1, 0)
+    assert other.value() == 1
+    assert all(address in (SET, CLR) for address, _ in machine.mem32.writes)
+
+@pytest.mark.parametrize('value', [1, True, 1.0])
+def test_numbers_are_broadcast(bar, value):
+    bar.value = value
+    assert bar.value == (1, 1, 1)
+
+@pytest.mark.parametrize('value', [[1, 0, 1], (1, 0, 1), bytes((1, 0, 1))])
+def test_sequences_are_per_device(bar, value):
+    bar.value = value
+    assert bar.value == (1, 0, 1)
+
+def test_mixed_group():
+    group = OutputGroup(DigitalLED(6), PWMLED(7))
+    group.value = (1, 0.5)
+    assert group.value[0] == 1 and group.value[1] == pytest.approx(0.5, abs=0.01)
+    group.close()
+
+@pytest.mark.parametrize('pwm', [True, False])
+def test_rgbled_takes_a_list(pwm):
+    led = RGBLED(10, 11, 12, pwm=pwm)
+    led.value = [1, 0, 0]
+    assert led.value == (1, 0, 0)
+    led.close()
@@ -0,0 +1,40 @@
+###############################################################
+# blink patterns on a PIO state machine
+###############################################################
+
+import pytest
+
+import utime
+from picozero import Buzzer, patterns
+
+@pytest.fixture
+def buzzer(monkeypatch):
+    monkeypatch.setattr(patterns, 'sleep', utime.sleep)
+    released = []
+    buzzer = Buzzer(2)
+    buzzer.use_pio(0)
+    monkeypatch.setattr(buzzer, '_pio_release', lambda: released.append(True))
+    buzzer.released = released
+    yield buzzer
+    buzzer.close()
+
+def test_wait_stops_the_state_machine(buzzer):
+    buzzer.beep(0.1, 0.1, n=2, wait=True)
+    pattern = buzzer._value_changer
+    assert pattern._sm.active() == 0
+    assert not pattern.is_running
+    assert buzzer.released == [True]
+    assert buzzer.value == 0
+
+def test_background_pattern_stops_on_its_timer(buzzer):
+    buzzer.beep(0.1, 0.1, n=2)
+    pattern = buzzer._value_changer
+    assert pattern._sm.active() == 1
+    pattern._timer.fire()
+    assert pattern._sm.active() == 0
+    assert buzzer.released == [True]
+
+def test_on_and_off_units(buzzer):
+    buzzer.beep(0.01, 0.03)
+    # low half first: 10 on units, 30 off units, less one each
+    assert buzzer._value_changer._sm.words == [9 | (29 << 16)]
@@ -0,0 +1,42 @@
+###############################################################
+# PWM slice sharing in picozero.PWMChannels
+###############################################################
+
+import pytest
+
+from picozero import PWMLED, PWMChannelAlreadyInUse, PWMSliceFrequencyConflict
+
+@pytest.fixture
+def leds():
+    made = []
+    yield lambda *args, **kwargs: made.append(PWMLED(*args, **kwargs)) or made[-1]
+    for led in made:
+        led.close()
+
+def test_same_channel(leds):
+    leds(2)
+    with pytest.raises(PWMChannelAlreadyInUse):
+        leds(18)              # GP18 is channel 1A as well
+
+def test_sibling_at_another_frequency(leds):
+    leds(2, freq=100)
+    with pytest.raises(PWMSliceFrequencyConflict):
+        leds(3, freq=200)
+    assert leds(3, freq=100).freq == 100
+
+def test_freq_setter_keeps_the_sibling(leds):
+    a = leds(2)
+    b = leds(3)
+    with pytest.raises(PWMSliceFrequencyConflict):
+        a.freq = 500
+    assert a.freq == b.freq == 100
+
+    alone = leds(4)
+    alone.freq = 500
+    assert alone.freq == 500
+
+def test_freq_setter_after_the_sibling_is_closed(leds):
+    a = leds(2)
+    leds(3).close()
+    a.freq = 500
+    assert a.freq == 500
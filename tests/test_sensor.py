@@ -0,0 +1,82 @@
+###############################################################
+# Sensor faults and the filter, see sensor.SensorHealth
+###############################################################
+
+import pytest
+
+from sensor import SensorHealth, fault
+
+RAW = 2000                    # any reading clear of the rails
+
+def feed(health, temps, raw=RAW):
+    return [health.update(raw, t) for t in temps]
+
+def test_moving_average():
+    health = SensorHealth()
+    out = feed(health, [20.0, 24.0, 24.0])
+    assert out == [20.0, 21.0, 21.75]
+    assert health.fault == fault.NONE
+
+@pytest.mark.parametrize('raw, temp', [
+    (0, 0.0),                 # shorted to ground
+    (65535, 0.0),             # open, pulled to the supply
+    (RAW, 0.5),               # below what the LM35 gives on a single supply
+    (RAW, 250.0),
+])
+def test_range(raw, temp):
+    health = SensorHealth()
+    feed(health, [20.0])
+    for i in range(SensorHealth.CONFIRM - 1):
+        assert health.update(raw, temp) is None
+    assert not health.fault & fault.RANGE
+    assert health.update(raw, temp) is None
+    assert health.fault & fault.RANGE
+
+    # good again
+    assert health.update(RAW, 20.0) == 20.0
+    assert health.fault == fault.NONE
+
+def test_stuck_needs_the_same_raw_value_for_long():
+    health = SensorHealth()
+    for i in range(SensorHealth.STUCK_READINGS - 1):
+        health.update(RAW, 20.0)
+    assert health.fault == fault.NONE
+    health.update(RAW, 20.0)
+    assert health.fault == fault.STUCK
+
+    health.update(RAW + 16, 20.1)   # one ADC step
+    assert health.fault == fault.NONE
+
+def test_steady_readings_that_flicker_are_not_stuck():
+    health = SensorHealth()
+    for i in range(10 * SensorHealth.STUCK_READINGS):
+        raw = RAW + 16 if i % 50 == 0 else RAW
+        health.update(raw, raw / 100.0)
+    assert health.fault == fault.NONE
+
+def test_single_jump_is_dropped():
+    health = SensorHealth()
+    feed(health, [20.0] * 5)
+    assert health.update(RAW, 80.0) is None
+    assert health.update(RAW, 20.0) == 20.0
+    assert health.fault == fault.NONE
+
+def test_lasting_jump_restarts_the_filter():
+    health = SensorHealth()
+    feed(health, [20.0] * 5)
+    out = feed(health, [80.0] * SensorHealth.CONFIRM)
+    assert out == [None] * (SensorHealth.CONFIRM - 1) + [80.0]
+    assert health.update(RAW, 84.0) == 81.0
+    assert health.fault == fault.NONE
+
+def test_repeated_jumps_are_slew():
+    health = SensorHealth()
+    feed(health, [20.0] * 5)
+    for i in range(SensorHealth.CONFIRM):
+        assert health.update(RAW, 80.0) is None
+        assert health.update(RAW, 20.0) == 20.0
+    assert health.fault == fault.SLEW
+
+    # cleared once WINDOW readings go by without a jump
+    feed(health, [20.0] * SensorHealth.WINDOW)
+    assert health.fault == fault.NONE
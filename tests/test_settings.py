@@ -0,0 +1,63 @@
+###############################################################
+# Loading settings.json, bad values must not reach the timers
+###############################################################
+
+import json
+
+import pytest
+
+from settings import Settings
+
+def load(data):
+    with open('settings.json', 'w') as f:
+        json.dump(data, f)
+    settings = Settings()
+    settings.load()
+    return settings
+
+def test_saved_settings_load_back():
+    saved = Settings()
+    saved.alarm_temp = 45
+    saved.hist_interval = 3
+    saved.update_time_ms = 500
+    saved.silent = True
+    saved.save()
+
+    settings = Settings()
+    settings.load()
+    assert [getattr(settings, n) for n in Settings.__slots__] == [45, 3, 500, True]
+
+@pytest.mark.parametrize('name, value, expected', [
+    ('hist_interval', 0, 1),
+    ('hist_interval', -5, 1),
+    ('hist_interval', 1000, 60),
+    ('update_time_ms', 0, 250),
+    ('update_time_ms', 100000, 5000),
+    ('alarm_temp', 500, 150),
+    ('alarm_temp', 27.5, 27.5),
+])
+def test_numbers_are_clamped_to_the_menu_range(name, value, expected):
+    assert getattr(load({name: value}), name) == expected
+
+@pytest.mark.parametrize('name, value', [
+    ('hist_interval', '7'),
+    ('hist_interval', 2.5),
+    ('hist_interval', True),
+    ('update_time_ms', None),
+    ('alarm_temp', [30]),
+    ('silent', 1),
+    ('silent', 'no'),
+])
+def test_wrong_types_keep_the_default(name, value):
+    assert getattr(load({name: value}), name) == getattr(Settings(), name)
+
+def test_broken_files_keep_the_defaults():
+    for data in ([1, 2], 'text', None):
+        settings = load(data)
+        assert settings.hist_interval == 7 and settings.update_time_ms == 1000
+    with open('settings.json', 'w') as f:
+        f.write('{"alarm_temp": ')
+    Settings().load()
+
+def test_unknown_keys_are_ignored():
+    assert load({'colour': 'red', 'alarm_temp': 40}).alarm_temp == 40
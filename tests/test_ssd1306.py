@@ -0,0 +1,58 @@
+###############################################################
+# Every write to the display holds the bus lock of the flush
+# thread
+###############################################################
+
+import pytest
+
+import machine
+from ssd1306 import SSD1306_I2C
+
+class Bus(object):
+    ''' A lock that knows whether it is held '''
+
+    def __init__(self):
+        self.held = False
+
+    def acquire(self):
+        assert not self.held
+        self.held = True
+
+    def release(self):
+        self.held = False
+
+class CheckedI2C(machine.I2C):
+
+    def __init__(self):
+        super().__init__(1)
+        self.bus = None
+
+    def writeto(self, addr, data):
+        assert self.bus is None or self.bus.held, 'command written without the bus lock'
+        return super().writeto(addr, data)
+
+    def writevto(self, addr, vector):
+        assert self.bus is None or self.bus.held, 'data written without the bus lock'
+        return super().writevto(addr, vector)
+
+@pytest.fixture
+def oled():
+    i2c = CheckedI2C()
+    oled = SSD1306_I2C(128, 64, i2c, init=False)
+    oled._bus = i2c.bus = Bus()
+    return oled
+
+def test_init_display(oled):
+    oled.init_display()
+    assert len(oled.i2c.writes) > 25
+    assert not oled._bus.held
+
+def test_show_region(oled):
+    oled.show_region(8, 8, 23, 15)
+    assert oled.i2c.writes[-1] == b'\x40' + bytes(16)
+    assert not oled._bus.held
+
+def test_commands(oled):
+    oled.contrast(10)
+    oled.poweroff()
+    assert oled.i2c.writes == [b'\x80\x81', b'\x80\x0a', b'\x80\xae']
@@ -0,0 +1,82 @@
+###############################################################
+# Telemetry frames from telemetry.py, decoded on the computer
+# by tools/record_telemetry.py and tools/analysis
+###############################################################
+
+import io
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+import utime
+from conftest import set_temp
+from statemachine import states
+from telemetry import Telemetry, FRAME_SIZE, FLAG_ALARM
+from tools.record_telemetry import decode, Decoder, Recorder
+from tools.analysis.frames import iter_frames
+
+TEMPS = [20.0, 21.5, 35.25, 80.0, 149.0]
+
+def capture(make_machine, temps=TEMPS, debug=b''):
+    ''' Frames for the temperatures, with debug output after each '''
+    sm = make_machine()
+    running = sm.states[states.RUNNING]
+    stream = io.BytesIO()
+    telemetry = Telemetry(sm, running, stream=stream)
+    expected = []
+    for temp in temps:
+        set_temp(sm, temp)
+        utime.advance(10)
+        expected.append((running.TEMP_SENSOR.read_u16(), utime.ticks_us()))
+        telemetry.send()
+        stream.write(debug)
+    return stream.getvalue(), expected, running
+
+def test_round_trip(make_machine):
+    data, expected, running = capture(make_machine, debug=b'Temperature: 20C\r\n')
+    frames, end, bad = decode(data)
+    assert bad == 0
+    assert list(frames['seq']) == list(range(len(TEMPS)))
+    assert [(int(f['raw']), int(f['ticks'])) for f in frames] == expected
+    assert list(frames['centi']) == [int(running.to_celsius(raw) * 100) for raw, ticks in expected]
+    assert list(frames['centi'] / 100.0) == pytest.approx(TEMPS, abs=0.1)
+
+def test_flags(make_machine):
+    sm = make_machine()
+    running = sm.states[states.RUNNING]
+    stream = io.BytesIO()
+    running.alarm = True
+    Telemetry(sm, running, stream=stream).send()
+    frames, end, bad = decode(stream.getvalue())
+    assert frames['flags'][0] & FLAG_ALARM
+
+@pytest.mark.parametrize('at', range(FRAME_SIZE))
+def test_corrupted_byte_rejects_the_frame(make_machine, at):
+    data, expected, running = capture(make_machine)
+    corrupted = bytearray(data)
+    corrupted[FRAME_SIZE + at] ^= 0x10          # in the second frame
+    frames, end, bad = decode(bytes(corrupted))
+    assert list(frames['seq']) == [0, 2, 3, 4]
+    assert bad == (1 if at >= 2 else 0)         # a broken sync word isn't even tried
+
+def test_pieces_of_any_size(make_machine):
+    data, expected, running = capture(make_machine, debug=b'\x5a\xa5 looks like a sync word\n')
+    for size in (1, 5, FRAME_SIZE, 64):
+        decoder = Decoder()
+        recorder = Recorder()
+        for i in range(0, len(data), size):
+            recorder.add(decoder.feed(data[i:i + size]))
+        assert list(recorder.frames()['seq']) == list(range(len(TEMPS)))
+        assert recorder.lost == 0
+
+def test_analysis_reads_a_capture(make_machine, tmp_path):
+    data, expected, running = capture(make_machine, debug=b'debug\n')
+    path = tmp_path / 'capture.bin'
+    path.write_bytes(data)
+    columns = {}
+    for chunk in iter_frames(str(path), chunk_size=40):  # frames across chunks
+        for name, values in chunk.items():
+            columns.setdefault(name, []).extend(values)
+    assert columns['time_s'] == pytest.approx([0, 0.01, 0.02, 0.03, 0.04])
+    assert columns['temp_c'] == pytest.approx(TEMPS, abs=0.1)
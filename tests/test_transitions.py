@@ -0,0 +1,85 @@
+###############################################################
+# Every event in every state, against the transition graph
+# written out here by hand rather than taken from TRANSITIONS
+###############################################################
+
+import pytest
+
+from conftest import set_temp
+from statemachine import states, events, TRANSITIONS
+
+S, E = states, events
+
+# Where every event leads when nothing waits for an acknowledge.
+# Events missing from a row leave the state as it is.
+EXPECTED = {
+    S.START:   {E.DONE: S.MONITOR},
+    S.RUNNING: {},
+    S.MONITOR: {E.ENTER: S.MENU},
+    S.MENU:    {E.EXIT: S.MONITOR, E.ALARM: S.MONITOR},
+}
+
+def machine_in(make_machine, state):
+    if state == S.START:
+        sm = make_machine(start=False)
+        sm.go_to_state(S.START)   # the splash timer has not fired
+    elif state == S.RUNNING:
+        sm = make_machine(start=False)
+        sm.go_to_state(S.RUNNING)
+    else:
+        sm = make_machine()
+        if state == S.MENU:
+            sm.dispatch(E.ENTER)
+    assert sm.state.id == state
+    return sm
+
+def raise_alarm(sm):
+    running = sm.states[S.RUNNING]
+    set_temp(sm, sm.settings.alarm_temp + 20)
+    # the filter takes a few updates to follow the jump
+    for i in range(30):
+        running.timer.fire()
+        if running.needs_ack():
+            return
+    assert False, 'no alarm'
+
+def test_expected_covers_the_table():
+    for source, event, target, guard, action in TRANSITIONS:
+        assert EXPECTED[source][event] == target
+
+@pytest.mark.parametrize('state', range(S.COUNT))
+@pytest.mark.parametrize('event', range(E.COUNT))
+def test_every_event(make_machine, state, event):
+    sm = machine_in(make_machine, state)
+    sm.dispatch(event)
+    assert sm.state.id == EXPECTED[state].get(event, state)
+
+@pytest.mark.parametrize('event', range(E.COUNT))
+def test_monitor_while_an_alarm_needs_ack(make_machine, event):
+    sm = machine_in(make_machine, S.MONITOR)
+    raise_alarm(sm)
+    sm.dispatch(event)
+    # ENTER acknowledges instead of opening the menu, so do the arrows
+    assert sm.state.id == S.MONITOR
+    if event <= E.RIGHT:
+        assert not sm.states[S.RUNNING].needs_ack()
+
+def test_enter_opens_the_menu_once_acknowledged(make_machine):
+    sm = machine_in(make_machine, S.MONITOR)
+    raise_alarm(sm)
+    sm.dispatch(E.ENTER)
+    assert sm.state.id == S.MONITOR
+    sm.dispatch(E.ENTER)
+    assert sm.state.id == S.MENU
+
+def test_unacknowledged_fault_guards_enter(make_machine):
+    sm = machine_in(make_machine, S.MONITOR)
+    sm.states[S.RUNNING].fault_acked = False
+    sm.dispatch(E.ENTER)
+    assert sm.state.id == S.MONITOR
+    assert sm.states[S.RUNNING].fault_acked
+
+def test_alarm_in_the_menu_brings_the_monitor_up(make_machine):
+    sm = machine_in(make_machine, S.MENU)
+    raise_alarm(sm)
+    assert sm.state.id == S.MONITOR
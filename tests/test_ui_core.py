@@ -0,0 +1,127 @@
+###############################################################
+# Sampling on one core, the display on the other: the UI core
+# only sees whole Snapshots, never the running state mid-update
+###############################################################
+
+import threading
+
+import _thread
+import utime
+from statemachine import states, buttons
+
+from conftest import set_temp
+
+def split(make_machine, monkeypatch):
+    ''' The machine with the UI core started, but not running '''
+    monkeypatch.setattr(_thread, 'start_new_thread', lambda function, args: None)
+    sm = make_machine()
+    sm.start_ui_core()
+    sm.settings.hist_interval = 1  # a history point every update
+    return sm, sm.states[states.RUNNING], sm.states[states.MONITOR]
+
+def test_updates_are_drawn_from_snapshots(make_machine, monkeypatch):
+    sm, running, monitor = split(make_machine, monkeypatch)
+    drawn = []
+    monkeypatch.setattr(monitor.graph, 'set', lambda values, version: drawn.append((values, version)))
+
+    for i in range(3):
+        utime.advance(1000)
+        running.timer.fire()
+    assert drawn == []        # nothing is drawn on the sampling core
+
+    sm.hardware.last_temp = None
+    sm._ui_step()
+    values, version = drawn[-1]
+    assert isinstance(values, tuple)
+    assert version == running.history_count
+    assert len(values) == running.history_count
+
+def test_update_during_render(make_machine, monkeypatch):
+    ''' The sampling core runs while the UI core is half way through
+        drawing: what is drawn stays the same '''
+    sm, running, monitor = split(make_machine, monkeypatch)
+    seen = []
+
+    def interrupted(values, version):
+        before = tuple(values)
+        for i in range(200):  # more than the history holds
+            utime.advance(1000)
+            running.timer.fire()
+        seen.append((before, tuple(values), version, len(values)))
+    monkeypatch.setattr(monitor.graph, 'set', interrupted)
+
+    utime.advance(1000)
+    running.timer.fire()
+    sm.hardware.last_temp = None
+    sm._ui_step()
+
+    (before, after, version, count), = seen
+    assert before == after
+    assert count == version   # history and its count belong together
+
+def test_events_reach_the_ui_core(make_machine, monkeypatch):
+    sm, running, monitor = split(make_machine, monkeypatch)
+    sm.button_pressed(buttons.ENTER)
+    assert sm.state is monitor  # only queued
+    sm._ui_step()
+    assert sm.state.id == states.MENU
+
+    # an alarm raised on the sampling core goes back to the monitor
+    set_temp(sm, 200.0)
+    for i in range(5):
+        utime.advance(1000)
+        running.timer.fire()
+    sm._ui_step()
+    assert sm.state is monitor
+
+def test_threads(make_machine, monkeypatch):
+    ''' Both sides on real threads, every snapshot drawn is whole '''
+    sm, running, monitor = split(make_machine, monkeypatch)
+    errors = []
+
+    def check(values, version):
+        if not isinstance(values, tuple) or len(values) != min(version, 127):
+            errors.append((type(values), len(values), version))
+    monkeypatch.setattr(monitor.graph, 'set', check)
+
+    done = threading.Event()
+
+    def ui():
+        while not done.is_set():
+            sm.hardware.last_temp = None
+            sm._ui_step()
+
+    thread = threading.Thread(target=ui)
+    thread.start()
+    try:
+        for i in range(3000):
+            set_temp(sm, 20.0 + i % 10)
+            utime.advance(1000)
+            running.timer.fire()
+    finally:
+        done.set()
+        thread.join()
+
+    assert errors == []
+    assert running.history_count > 127
+
+def test_acknowledge_is_applied_on_the_sampling_core(make_machine, monkeypatch):
+    sm, running, monitor = split(make_machine, monkeypatch)
+    set_temp(sm, 200.0)
+    for i in range(5):
+        utime.advance(1000)
+        running.timer.fire()
+    sm._ui_step()
+    assert running.needs_ack()
+
+    engine = running.engine
+    changed = []
+    monkeypatch.setattr(engine, 'acknowledge', lambda now: changed.append(now))
+    sm.button_pressed(buttons.LEFT)
+    sm._ui_step()
+    assert changed == []      # the UI core leaves the engine alone
+
+    now = utime.ticks_ms()
+    utime.advance(1000)
+    running.timer.fire()
+    assert changed == [now]   # at the time of the press
@@ -0,0 +1,100 @@
+###############################################################
+# Watchdog feeding and overrun shedding, see RunningState.update
+###############################################################
+
+import utime
+from statemachine import states, Hardware, RunningState
+from statetrace import Trace, TRACE_OVERRUN
+
+def start(make_machine):
+    sm = make_machine()
+    sm.hardware.start_watchdog()
+    return sm, sm.states[states.RUNNING]
+
+def tick(running, ms=1000, sm=None):
+    utime.advance(ms)
+    if sm is not None:
+        sm.hardware.last_temp = None  # the monitor redraws even when stable
+    running.timer.fire()
+
+def test_fed_after_the_alarm_is_checked(make_machine):
+    sm, running = start(make_machine)
+    order = []
+    check_alarm = running.check_alarm
+    running.check_alarm = lambda sm, temp: (order.append('alarm'), check_alarm(sm, temp))
+    feed = sm.hardware.wdt.feed
+    sm.hardware.wdt.feed = lambda: (order.append('feed'), feed())
+
+    for i in range(3):
+        tick(running)
+
+    assert order == ['alarm', 'feed'] * 3
+
+def test_fed_by_every_update(make_machine):
+    sm, running = start(make_machine)
+    for i in range(20):
+        tick(running, sm.settings.update_time_ms)
+        assert not sm.hardware.wdt.expired()
+    assert sm.hardware.wdt.feeds == 20
+
+def test_sampling_hang_starves_the_watchdog(make_machine):
+    sm, running = start(make_machine)
+    tick(running)
+
+    # the timer stops firing, e.g. a hang on this core
+    utime.advance(Hardware.WATCHDOG_MS - 1)
+    assert not sm.hardware.wdt.expired()
+    utime.advance(2)
+    assert sm.hardware.wdt.expired()
+
+def test_display_hang_is_caught_by_the_next_update(make_machine):
+    sm, running = start(make_machine)
+    draw = sm.hardware.draw
+    sm.hardware.draw = lambda screen: utime.advance(Hardware.WATCHDOG_MS + 1)
+
+    tick(running, sm=sm)  # fed before the display work that hangs
+    assert sm.hardware.wdt.expired()
+
+    sm.hardware.draw = draw
+    tick(running, sm=sm)
+    assert not sm.hardware.wdt.expired()
+
+def test_overrun_is_counted_and_sheds_the_display(make_machine):
+    sm, running = start(make_machine)
+    sm.trace = Trace()
+    slow = [1500]             # ms the next draw takes
+    draws = []
+
+    def draw(screen):
+        draws.append(utime.ticks_ms())
+        utime.advance(slow.pop() if slow else 0)
+    sm.hardware.draw = draw
+
+    tick(running, sm=sm)
+    assert running.overruns == 1
+    assert running.shed == RunningState.SHED_UPDATES
+    events = sm.trace.records[1:sm.trace.index:Trace.FIELDS]
+    assert TRACE_OVERRUN in events
+
+    # the next updates skip the display, but still measure and feed
+    drawn = len(draws)
+    feeds = sm.hardware.wdt.feeds
+    for i in range(RunningState.SHED_UPDATES):
+        tick(running, 1000, sm)
+    assert len(draws) == drawn
+    assert running.updates_shed == RunningState.SHED_UPDATES
+    assert sm.hardware.wdt.feeds == feeds + RunningState.SHED_UPDATES
+    assert running.overruns == 1
+
+    tick(running, 1000, sm)
+    assert len(draws) == drawn + 1
+    assert running.shed == 0
+    assert running.overruns == 1
+
+def test_on_time_updates_are_not_overruns(make_machine):
+    sm, running = start(make_machine)
+    sm.hardware.draw = lambda screen: utime.advance(sm.settings.update_time_ms - 1)
+    for i in range(5):
+        tick(running, sm=sm)
+    assert running.overruns == 0
+    assert running.shed == 0
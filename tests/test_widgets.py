@@ -0,0 +1,100 @@
+###############################################################
+# Widgets, drawn into a plain FrameBuffer
+###############################################################
+
+import random
+
+import pytest
+
+import utime
+from statemachine import states
+from widgets import Graph, WindowMinMax
+
+@pytest.mark.parametrize('autoscale', [False, True])
+def test_graph_without_history(autoscale):
+    graph = Graph(0, 20, 128, 44, 150, autoscale=autoscale)
+    graph.set((), 0)
+    assert graph.count == 0
+    graph.set((25.0,), 1)
+    assert graph.count == 1 and graph.rows[0] == graph.row(25.0)
+
+def test_sensor_fault_before_the_first_sample(make_machine):
+    sm = make_machine(start=False)
+    running = sm.states[states.RUNNING]
+    running.TEMP_SENSOR.value = 0     # shorted, every reading is unusable
+    sm.go_to_state(states.START)
+    sm.states[states.START].timer.fire()
+    for i in range(5):
+        utime.advance(1000)
+        sm.hardware.last_temp = None
+        running.timer.fire()
+
+    assert running.history_count == 0
+    assert running.fault
+    assert sm.state.id == states.MONITOR
+
+def test_window_min_max_matches_a_scan():
+    rng = random.Random(4)
+    for size, window in [(8, 8), (16, 5), (129, 128)]:
+        tracker = WindowMinMax(size)
+        values = []
+        for i in range(1000):
+            # runs up and down, and repeats, exercise the evictions
+            value = float(rng.choice([rng.randint(0, 100), values[-1] if values else 0]))
+            values.append(value)
+            tracker.add(value, window)
+            last = values[-window:]
+            assert (tracker.min(), tracker.max()) == (min(last), max(last))
+
+def test_window_min_max_evicts_the_old_extremes():
+    tracker = WindowMinMax(5)
+    for value in [90, 10, 50, 50, 50]:
+        tracker.add(value, 5)
+    assert (tracker.min(), tracker.max()) == (10, 90)
+    tracker.add(50, 5)            # 90 leaves the window
+    assert (tracker.min(), tracker.max()) == (10, 50)
+    tracker.add(50, 5)            # and 10
+    assert (tracker.min(), tracker.max()) == (50, 50)
+
+@pytest.mark.parametrize('autoscale', [False, True])
+def test_incremental_set_matches_a_rebuild(autoscale):
+    rng = random.Random(7)
+    graph = Graph(0, 20, 32, 44, 150, line=30, autoscale=autoscale)
+    history = ()
+    temp = 25.0
+    for version in range(1, 200):
+        temp = min(max(temp + rng.randint(-12, 12) / 4, 0), 150)  # exact in the float array
+        history = (history + (temp,))[-graph.w:]   # trimmed like RunningState's
+        graph.set(history, version)
+
+        # the same rows as a rebuild on the same axis
+        rows = bytes(graph.rows[:graph.count])
+        graph._rebuild()
+        assert rows == bytes(graph.rows[:graph.count])
+        assert graph.count == len(history)
+
+        # and an axis that fits what is shown and the line
+        if autoscale:
+            assert (graph.window.min(), graph.window.max()) == (min(history), max(history))
+            assert graph.low <= min(min(history), graph.line) - Graph.HEADROOM
+            assert graph.high >= max(max(history), graph.line) + Graph.HEADROOM
+
+def test_axis_follows_the_line():
+    graph = Graph(0, 20, 32, 44, 150, line=30, autoscale=True)
+    graph.set((20.0, 21.0, 22.0), 3)
+    assert (graph.low, graph.high) == (15, 35)
+    graph.set_line(60)
+    assert graph.high == 65
+    assert list(graph.rows[:3]) == [graph.row(v) for v in (20.0, 21.0, 22.0)]
+    graph.set_line(30)            # shrinks back, by more than a step
+    assert graph.high == 35
+
+def test_axis_shrinks_when_the_peak_leaves_the_window():
+    graph = Graph(0, 20, 8, 44, 150, autoscale=True)
+    history = (100.0,) + (20.0,) * 7
+    graph.set(history, 8)
+    assert graph.high == 105
+    for version in range(9, 17):
+        history = history[1:] + (20.0,)
+        graph.set(history, version)
+    assert (graph.low, graph.high) == (15, 25)
@@ -0,0 +1,22 @@
+###############################################################
+# Analysis of recorded exhaust temperatures
+#
+# Runs on the computer, needs numpy. Reads the telemetry frames
+# of telemetry.py (raw captures or .npz files made by
+# record_telemetry.py) and the samples in a statetrace.py trace.
+# From the top of the repository:
+#   python3 -m tools.analysis capture.bin --alarm 30 --alarm 35
+# The frames are decoded by tools/record_telemetry.py and the
+# alarm is replayed with the device's own alarm.py and sensor.py,
+# found there as well.
+###############################################################
+
+from .frames import read_frames, iter_frames, load_npz, load_trace
+from .series import resample, moving_average, rate_of_rise
+from .replay import AlarmReplay, DeviceFilter, replay_alarm
+
+__all__ = [
+    'read_frames', 'iter_frames', 'load_npz', 'load_trace',
+    'resample', 'moving_average', 'rate_of_rise',
+    'AlarmReplay', 'DeviceFilter', 'replay_alarm',
+]
@@ -0,0 +1,96 @@
+###############################################################
+# Summary of one or more recordings, e.g. before and after an
+# impeller change:
+#   python3 -m tools.analysis before.bin after.npz --alarm 30 --alarm 35
+# Raw captures are streamed, so they may be larger than memory.
+###############################################################
+
+import argparse
+
+import numpy as np
+
+from .frames import iter_frames, load_npz, load_trace
+from .series import rate_of_rise
+from .replay import AlarmReplay, DeviceFilter
+
+def chunks(path):
+    with open(path, 'rb') as f:
+        magic = f.read(4)
+
+    if path.endswith('.npz'):
+        yield load_npz(path)
+    elif magic == b'TRC1':
+        yield load_trace(path)
+    else:
+        for chunk in iter_frames(path):
+            yield chunk
+
+def summarize(path, alarm_temps, window_s, update_s, exact=False):
+    replays = [AlarmReplay(t) for t in alarm_temps]
+    device = DeviceFilter(update_s, exact)
+    count = 0
+    duration = 0.0
+    low = np.inf
+    high = -np.inf
+    total = 0.0
+    max_rate = 0.0
+    carry_t = np.zeros(0)         # the last window_s of the chunk before
+    carry_v = np.zeros(0)
+
+    for chunk in chunks(path):
+        time_s = chunk['time_s']
+        temp_c = chunk['temp_c']
+        if len(time_s) == 0:
+            continue
+
+        count += len(time_s)
+        duration = time_s[-1]
+        low = min(low, temp_c.min())
+        high = max(high, temp_c.max())
+        total += temp_c.sum()
+
+        t = np.concatenate((carry_t, time_s))
+        v = np.concatenate((carry_v, temp_c))
+        rate = rate_of_rise(t, v, window_s)[len(carry_t):]
+        max_rate = max(max_rate, rate.max())
+        keep = t > t[-1] - window_s
+        carry_t = t[keep]
+        carry_v = v[keep]
+
+        # as the device measures them, traces already are
+        if 'raw' in chunk:
+            time_s, temp_c = device.feed(time_s, chunk['raw'], temp_c)
+        for replay in replays:
+            replay.feed(time_s, temp_c)
+
+    print(path)
+    if count == 0:
+        print('  no measurements')
+        return
+
+    print('  %d measurements over %.2f h' % (count, duration / 3600))
+    print('  min %.1fC  mean %.1fC  max %.1fC' % (low, total / count, high))
+    print('  fastest rise %.2fC/min over %ds' % (max_rate, window_s))
+    for replay in replays:
+        first = replay.first_alarm()
+        print('  alarm at %gC: %d times, %.0f s in alarm, first after %s' % (
+            replay.alarm_temp, len(replay.episodes), replay.alarm_s,
+            '-' if first is None else '%.0f s' % first))
+
+def main():
+    parser = argparse.ArgumentParser(prog='python3 -m tools.analysis')
+    parser.add_argument('paths', nargs='+', help='raw capture, .npz recording or trace.bin')
+    parser.add_argument('--alarm', type=float, action='append',
+                        help='alarm temperature to replay, may be repeated')
+    parser.add_argument('--window', type=int, default=60,
+                        help='seconds over which the rate of rise is taken')
+    parser.add_argument('--update', type=float, default=1.0,
+                        help='seconds between measurements on the device, the Update setting')
+    parser.add_argument('--exact', action='store_true',
+                        help='filter every sample with sensor.SensorHealth, slower')
+    args = parser.parse_args()
+
+    for path in args.paths:
+        summarize(path, args.alarm or [30.0], args.window, args.update, args.exact)
+
+main()
@@ -0,0 +1,79 @@
+###############################################################
+# Reading recordings
+#
+# Raw captures are decoded a chunk at a time, so files larger
+# than memory can be streamed. Every reader returns the same
+# columns: time_s from the first sample, and temp_c. The frame
+# layout and the CRC are those of record_telemetry.py.
+###############################################################
+
+import numpy as np
+
+from ..record_telemetry import TICKS_PERIOD, decode
+from statetrace import TRACE_SAMPLE
+
+class Clock(object):
+    ''' Turns wrapping ticks_us into seconds, across chunks '''
+
+    def __init__(self):
+        self.last = None
+        self.elapsed = 0
+
+    def seconds(self, ticks):
+        ticks = ticks.astype(np.int64)
+        if len(ticks) == 0:
+            return np.zeros(0)
+
+        previous = ticks[0] if self.last is None else self.last
+        elapsed = self.elapsed + np.cumsum(np.diff(ticks, prepend=previous) % TICKS_PERIOD)
+        self.last = ticks[-1]
+        self.elapsed = elapsed[-1]
+        return elapsed / 1e6
+
+def iter_frames(path, chunk_size=1 << 24):
+    ''' Yields dicts of columns for every chunk of a raw capture '''
+    clock = Clock()
+    tail = b''
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            data = tail + chunk
+            frames, end, bad = decode(data)
+            tail = data[end:]
+            yield {
+                'time_s': clock.seconds(frames['ticks']),
+                'temp_c': frames['centi'] / 100.0,
+                'raw': frames['raw'],
+                'offset': frames['offset'],
+                'flags': frames['flags'],
+                'seq': frames['seq'],
+            }
+
+def read_frames(path, chunk_size=1 << 24):
+    ''' A whole raw capture at once '''
+    chunks = list(iter_frames(path, chunk_size))
+    if not chunks:
+        return {'time_s': np.zeros(0), 'temp_c': np.zeros(0)}
+    return dict((name, np.concatenate([c[name] for c in chunks])) for name in chunks[0])
+
+def load_npz(path):
+    ''' A recording saved by record_telemetry.py '''
+    with np.load(path) as data:
+        return dict((name, data[name]) for name in data.files)
+
+def load_trace(path):
+    ''' The measurements in a trace saved by statetrace.py '''
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data[:4] != b'TRC1':
+        raise ValueError('%s is not a trace file' % path)
+
+    count = int(np.frombuffer(data, '<u2', 1, 4)[0])
+    records = np.frombuffer(data, '<i4', count * 4, 6).reshape(-1, 4)
+    samples = records[records[:, 1] == TRACE_SAMPLE]
+    return {
+        'time_s': Clock().seconds(samples[:, 0]),
+        'temp_c': samples[:, 3] / 100.0,
+    }
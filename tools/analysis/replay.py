@@ -0,0 +1,129 @@
+###############################################################
+# Alarm what-if replay
+#
+# Runs recorded temperatures through the alarm level of the
+# device's alarm.AlarmEngine: it is raised when `confirm` of the
+# last `window` samples are at or above the alarm temperature and
+# cleared when as many are below it minus the hysteresis.
+# Acknowledging is not replayed. Chunks can be fed one after the
+# other, the state carries over.
+# The device alarms on the filtered temperature, measured once
+# per update, while telemetry frames hold every raw sample. Pass
+# those through DeviceFilter first, or the replay alarms earlier
+# and more often than the device would. Traces already hold the
+# filtered measurements.
+###############################################################
+
+import numpy as np
+
+from alarm import AlarmEngine
+from sensor import SensorHealth
+
+from .series import ema
+
+HYSTERESIS = AlarmEngine.HYSTERESIS
+CONFIRM    = AlarmEngine.CONFIRM
+WINDOW     = AlarmEngine.WINDOW
+
+class DeviceFilter(object):
+    ''' Keeps the samples the device measures, one per update_s, drops
+        the readings SensorHealth can't use and filters the rest with its
+        moving average, all vectorised. SensorHealth also drops single
+        jumps of more than MAX_STEP and restarts the filter on lasting
+        ones; exact=True replays that too, by running every sample
+        through SensorHealth itself, which takes seconds for a week. '''
+
+    def __init__(self, update_s=1.0, exact=False):
+        self.update_s = update_s
+        self.exact = exact
+        self.next_s = None        # the next update
+        self.mean = None          # the filtered temperature so far
+        self.health = SensorHealth()
+
+    def feed(self, time_s, raw, temp_c):
+        ''' Returns the times and the filtered temperatures '''
+        if self.next_s is None and len(time_s):
+            self.next_s = time_s[0]
+        if len(time_s) == 0 or time_s[-1] < self.next_s:
+            return np.zeros(0), np.zeros(0)
+
+        # the first sample at or after every update
+        count = int((time_s[-1] - self.next_s) // self.update_s) + 1
+        updates = self.next_s + self.update_s * np.arange(count)
+        self.next_s = updates[-1] + self.update_s
+        at = np.searchsorted(time_s, updates)
+        at = at[np.concatenate(([True], np.diff(at) > 0))]  # sorted, unique
+        time_s, raw, temp_c = time_s[at], raw[at], temp_c[at]
+
+        if self.exact:
+            filtered = [self.health.update(int(r), float(t)) for r, t in zip(raw, temp_c)]
+            usable = np.array([t is not None for t in filtered], bool)
+            return time_s[usable], np.array([t for t in filtered if t is not None], float)
+
+        health = SensorHealth
+        usable = ((raw > health.RAW_LOW) & (raw < health.RAW_HIGH)
+                  & (temp_c >= health.MIN_TEMP) & (temp_c <= health.MAX_TEMP))
+        filtered = ema(temp_c[usable], health.ALPHA, self.mean)
+        if len(filtered):
+            self.mean = filtered[-1]
+        return time_s[usable], filtered
+
+class AlarmReplay(object):
+
+    def __init__(self, alarm_temp, hysteresis=HYSTERESIS, confirm=CONFIRM, window=WINDOW):
+        self.alarm_temp = alarm_temp
+        self.hysteresis = hysteresis
+        self.confirm = confirm
+        self.window = window
+        self.alarm = False
+        self.above = np.zeros(window - 1, bool)   # the samples before this chunk
+        self.below = np.zeros(window - 1, bool)
+        self.last_time = None
+        self.alarm_s = 0.0        # time spent in alarm
+        self.episodes = []        # [start_s, end_s], end_s is None while on
+
+    def _counts(self, history, flags):
+        ''' How many of the last `window` samples have the flag set, and
+            the flags to keep for the next chunk '''
+        flags = np.concatenate((history, flags))
+        total = np.concatenate(([0], np.cumsum(flags)))
+        return total[self.window:] - total[:-self.window], flags[len(flags) - self.window + 1:]
+
+    def feed(self, time_s, temp_c):
+        ''' Returns the alarm state after every measurement '''
+        if len(time_s) == 0:
+            return np.zeros(0, bool)
+
+        above, self.above = self._counts(self.above, temp_c >= self.alarm_temp)
+        below, self.below = self._counts(self.below, temp_c < self.alarm_temp - self.hysteresis)
+
+        # raised or cleared, whichever happened last; neither keeps the state
+        change = np.where(above >= self.confirm, 1, np.where(below >= self.confirm, -1, 0))
+        last = np.maximum.accumulate(np.where(change != 0, np.arange(len(change)), -1))
+        alarm = np.where(last >= 0, change[np.maximum(last, 0)] > 0, self.alarm)
+
+        before = np.concatenate(([self.alarm], alarm[:-1]))
+
+        # the alarm holds until the next measurement
+        previous = time_s[0] if self.last_time is None else self.last_time
+        held = np.diff(time_s, prepend=previous)
+        self.alarm_s += held[before].sum()
+
+        changes = np.flatnonzero(alarm != before)
+        for i in changes:
+            if alarm[i]:
+                self.episodes.append([time_s[i], None])
+            else:
+                self.episodes[-1][1] = time_s[i]
+
+        self.alarm = bool(alarm[-1])
+        self.last_time = time_s[-1]
+        return alarm
+
+    def first_alarm(self):
+        return self.episodes[0][0] if self.episodes else None
+
+def replay_alarm(time_s, temp_c, alarm_temp):
+    replay = AlarmReplay(alarm_temp)
+    replay.feed(time_s, temp_c)
+    return replay
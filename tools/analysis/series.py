@@ -0,0 +1,60 @@
+###############################################################
+# Signal processing on temperature series
+#
+# Every function takes and returns NumPy arrays and works on
+# unevenly spaced samples, as the device's clock and the serial
+# port both add jitter.
+###############################################################
+
+import numpy as np
+
+def resample(time_s, values, period_s=1.0, max_gap_s=None):
+    ''' Linear interpolation on an even grid. Grid points in a gap
+        longer than max_gap_s are NaN instead of a made up line. '''
+    grid = np.arange(time_s[0], time_s[-1] + period_s / 2, period_s)
+    out = np.interp(grid, time_s, values)
+
+    if max_gap_s is not None:
+        after = np.clip(np.searchsorted(time_s, grid), 1, len(time_s) - 1)
+        gap = time_s[after] - time_s[after - 1]
+        out[gap > max_gap_s] = np.nan
+    return grid, out
+
+def moving_average(values, window):
+    ''' Trailing average over window samples, like a filter on the
+        device would see it. The first samples average what there is. '''
+    total = np.concatenate(([0.0], np.cumsum(values, dtype=np.float64)))
+    end = np.arange(1, len(values) + 1)
+    count = np.minimum(end, window)
+    return (total[end] - total[end - count]) / count
+
+def rate_of_rise(time_s, values, window_s=60.0):
+    ''' Degrees per minute over the last window_s seconds '''
+    start = np.searchsorted(time_s, time_s - window_s)
+    span = time_s - time_s[start]
+    rise = values - values[start]
+    rate = np.zeros(len(values))
+    np.divide(rise * 60.0, span, out=rate, where=span > 0)
+    return rate
+
+EMA_BLOCK = 256                   # the weights of a longer block underflow
+
+def ema(values, alpha, initial=None):
+    ''' Exponential moving average, each value moves the mean alpha of
+        the way to it, as SensorHealth does. Starts from initial, or
+        from the first value. Computed a block at a time from the
+        closed form, without a loop over the samples. '''
+    values = np.asarray(values, np.float64)
+    out = np.empty(len(values))
+    if len(values) == 0:
+        return out
+
+    last = values[0] if initial is None else initial
+    decay = 1.0 - alpha
+    for start in range(0, len(values), EMA_BLOCK):
+        block = values[start:start + EMA_BLOCK]
+        weights = decay ** np.arange(1, len(block) + 1)
+        mean = weights * (last + alpha * np.cumsum(block / weights))
+        out[start:start + len(block)] = mean
+        last = mean[-1]
+    return out
@@ -0,0 +1,55 @@
+###############################################################
+# DistanceSensor benchmark
+#
+# Compares the CPU time spent per reading by the polling and the
+# IRQ mode of picozero's DistanceSensor. Run it on the Pico with
+# a HC-SR04 connected, e.g.:
+#   mpremote run tools/bench_distance.py
+###############################################################
+
+from time import ticks_us, ticks_diff, sleep_ms
+from machine import Pin
+from picozero import DistanceSensor
+
+ECHO       = 2    # GP2
+TRIGGER    = 3    # GP3
+READINGS   = 50
+INTERVAL   = 60   # ms between readings, as advised for the HC-SR04
+
+def bench_polling():
+    sensor = DistanceSensor(ECHO, TRIGGER)
+    busy = 0
+    for i in range(READINGS):
+        start = ticks_us()
+        sensor.distance
+        busy += ticks_diff(ticks_us(), start)
+        sleep_ms(INTERVAL)
+    return busy / READINGS
+
+def bench_irq():
+    sensor = DistanceSensor(ECHO, TRIGGER, irq=True)
+    handler_us = [0]
+
+    # time the pin handler as well, it runs during the flight time.
+    # A hard IRQ like the sensor's own, so nothing here allocates.
+    def timed_handler(p):
+        start = ticks_us()
+        sensor._echo_change(p)
+        handler_us[0] += ticks_diff(ticks_us(), start)
+
+    sensor._echo.irq(timed_handler, Pin.IRQ_RISING | Pin.IRQ_FALLING, hard=True)
+
+    busy = 0
+    for i in range(READINGS):
+        start = ticks_us()
+        sensor.distance
+        busy += ticks_diff(ticks_us(), start)
+        sleep_ms(INTERVAL)
+    return (busy + handler_us[0]) / READINGS
+
+if __name__ == '__main__':
+    polling = bench_polling()
+    irq = bench_irq()
+    print("CPU time per reading")
+    print("  polling: {:.0f}us".format(polling))
+    print("  irq    : {:.0f}us".format(irq))
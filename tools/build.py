@@ -0,0 +1,92 @@
+###############################################################
+# Precompile the device modules to .mpy
+#
+# The Pico compiles every .py it imports on each boot, picozero
+# alone is a few thousand lines. mpy-cross does that once on the
+# host, the .mpy files load straight into bytecode:
+#   pip install mpy-cross    (same version as the firmware)
+#   python3 tools/build.py --lib path/to/oled/parent [--slim]
+#   mpremote cp -r build/. :
+# --slim replaces the picozero package with a single module of
+# only the devices these modules import, see slim_picozero.py.
+# Remove the picozero directory from the Pico when using it.
+# Remove the .py files of these modules from the Pico, MicroPython
+# imports a .py before a .mpy of the same name. main.py is copied
+# as source, it is what the Pico runs at boot.
+# To freeze the modules into the firmware instead, see manifest.py.
+###############################################################
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+from slim_picozero import slim
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Everything main.py imports, keep in step with manifest.py
+MODULES = (
+    'alarm', 'i2cbus', 'menu', 'nmea', 'sensor', 'settings', 'ssd1306',
+    'statemachine', 'statetrace', 'telemetry', 'widgets',
+)
+PACKAGES = ('picozero', 'oled')   # oled is not in this repo, found with --lib
+
+def cross_compile(mpy_cross, source, target, name):
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    subprocess.check_call([mpy_cross, '-march=armv6m', '-s', name, '-o', target, source])
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompile the device modules with mpy-cross')
+    parser.add_argument('--out', default=os.path.join(ROOT, 'build'), help='output directory')
+    parser.add_argument('--lib', action='append', default=[],
+                        help='directory holding the oled package, may be repeated')
+    parser.add_argument('--mpy-cross', default='mpy-cross', help='mpy-cross executable')
+    parser.add_argument('--slim', action='store_true',
+                        help='only the picozero devices the modules import')
+    args = parser.parse_args()
+
+    if shutil.which(args.mpy_cross) is None:
+        sys.exit('%s not found, pip install mpy-cross' % args.mpy_cross)
+
+    count = 0
+    for module in MODULES:
+        cross_compile(args.mpy_cross, os.path.join(ROOT, module + '.py'),
+                      os.path.join(args.out, module + '.mpy'), module + '.py')
+        count += 1
+
+    packages = PACKAGES
+    if args.slim:
+        paths = [os.path.join(ROOT, name + '.py') for name in MODULES + ('main',)]
+        source, names = slim(paths)
+        slim_path = os.path.join(args.out, 'picozero.py')
+        with open(slim_path, 'w') as f:
+            f.write(source)
+        cross_compile(args.mpy_cross, slim_path, os.path.join(args.out, 'picozero.mpy'), 'picozero.py')
+        os.remove(slim_path)
+        print('picozero slimmed to ' + ', '.join(names))
+        count += 1
+        packages = tuple(p for p in PACKAGES if p != 'picozero')
+
+    for package in packages:
+        found = [lib for lib in [ROOT] + args.lib if os.path.isdir(os.path.join(lib, package))]
+        if not found:
+            print('%s not found, copy it as source or pass --lib' % package)
+            continue
+        base = found[0]
+        for folder, _, files in os.walk(os.path.join(base, package)):
+            for name in files:
+                if not name.endswith('.py'):
+                    continue
+                source = os.path.join(folder, name)
+                relative = os.path.relpath(source, base)
+                cross_compile(args.mpy_cross, source,
+                              os.path.join(args.out, relative[:-3] + '.mpy'), relative)
+                count += 1
+
+    shutil.copy(os.path.join(ROOT, 'main.py'), args.out)
+    print('%d modules compiled to %s' % (count, args.out))
+
+if __name__ == '__main__':
+    main()
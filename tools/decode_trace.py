@@ -0,0 +1,78 @@
+###############################################################
+# Trace decoder
+#
+# Turns a trace saved by statetrace.py into a readable timeline.
+# Run it on the computer from the top of the repository, after
+# copying the trace off the Pico:
+#   mpremote cp :trace.bin .
+#   python3 -m tools.decode_trace trace.bin
+###############################################################
+
+import struct
+import sys
+
+from statetrace import (TRACE_ENTER, TRACE_EXIT, TRACE_DROPPED, TRACE_SAMPLE,
+                        TRACE_OVERRUN, TRACE_ALARM, TRACE_FAULT)
+
+TICKS_PERIOD = 1 << 30            # MicroPython ticks_us wraps around here
+
+# Keep these in step with statemachine.py, which only runs on the Pico
+STATES = {-1: '-', 0: 'start', 1: 'running', 2: 'monitor', 3: 'menu'}
+EVENTS = {1: 'ENTER', 2: 'LEFT', 3: 'RIGHT', 4: 'DONE', 5: 'EXIT', 6: 'ALARM'}
+
+SEVERITIES = {0: 'normal', 1: 'warning', 2: 'alarm'}
+FAULTS = ((1, 'range'), (2, 'stuck'), (4, 'slew'))
+
+def read_trace(path):
+    ''' Returns the records as (ticks_us, event, state, payload) tuples '''
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if data[:4] != b'TRC1':
+        raise ValueError('%s is not a trace file' % path)
+    count, = struct.unpack_from('<H', data, 4)
+    return [struct.unpack_from('<4i', data, 6 + i * 16) for i in range(count)]
+
+def describe(event, payload):
+    if event == TRACE_ENTER:
+        return 'enter'
+    if event == TRACE_EXIT:
+        return 'exit'
+    if event == TRACE_DROPPED:
+        return 'dropped %s' % EVENTS.get(payload, payload)
+    if event == TRACE_SAMPLE:
+        return 'sample %.2fC' % (payload / 100)
+    if event == TRACE_OVERRUN:
+        return 'overrun %dms' % payload
+    if event == TRACE_ALARM:
+        return 'severity %s' % SEVERITIES.get(payload, payload)
+    if event == TRACE_FAULT:
+        return 'sensor %s' % (' '.join(name for bit, name in FAULTS if payload & bit) or 'ok')
+
+    name = EVENTS.get(event, 'event %d' % event)
+    if payload < 0:
+        return name
+    return '%s -> %s' % (name, STATES.get(payload, payload))
+
+def timeline(records):
+    ''' Yields (ms since the first record, ms since the previous one,
+        state name, description) '''
+    elapsed = 0
+    previous = None
+    for ticks, event, state, payload in records:
+        delta = 0 if previous is None else (ticks - previous) % TICKS_PERIOD
+        previous = ticks
+        elapsed += delta
+        yield elapsed / 1000, delta / 1000, STATES.get(state, state), describe(event, payload)
+
+def main(argv):
+    if len(argv) != 2:
+        print('usage: %s trace.bin' % argv[0])
+        return 1
+
+    for elapsed, delta, state, text in timeline(read_trace(argv[1])):
+        print('%10.3f %+9.3f  %-8s %s' % (elapsed, delta, state, text))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,24 @@
+###############################################################
+# Freeze the alarm into a MicroPython firmware build. Frozen
+# modules are neither compiled nor loaded into RAM at boot, the
+# bytecode runs from flash:
+#   cd micropython/ports/rp2
+#   make BOARD=RPI_PICO FROZEN_MANIFEST=/path/to/tools/manifest.py
+# main.py stays on the file system, copy it as before. Keep the
+# module list in step with build.py.
+###############################################################
+
+include("$(PORT_DIR)/boards/manifest.py")
+
+for name in ("alarm", "i2cbus", "menu", "nmea", "sensor", "settings", "ssd1306",
+             "statemachine", "statetrace", "telemetry", "widgets"):
+    module(name + ".py", base_path="..")
+
+package("picozero", base_path="..")
+# or only the devices the alarm uses, after
+# python3 tools/slim_picozero.py main.py statemachine.py:
+# module("picozero.py", base_path="../build")
+
+# The oled package and its fonts are not in this repo, point this
+# at the directory that holds it:
+# package("oled", base_path="../lib")
@@ -0,0 +1,179 @@
+###############################################################
+# Telemetry recorder
+#
+# Reads the binary frames written by telemetry.py from the serial
+# port, or from a file captured earlier, and saves them as NumPy
+# arrays. Anything between the frames, like debug prints, is
+# skipped. Run it on the computer:
+#   python3 tools/record_telemetry.py /dev/ttyACM0 engine_test.npz
+#   python3 tools/record_telemetry.py capture.bin engine_test.npz
+# Needs numpy, and pyserial to read from a serial port.
+###############################################################
+
+import os
+import sys
+
+import numpy as np
+
+SYNC         = 0xA55A
+FORMAT       = '<HHIHHhB'
+CRC_AT       = 15
+FRAME_SIZE   = 17
+TICKS_PERIOD = 1 << 30             # MicroPython ticks_us wraps around here
+
+FLAG_ALARM    = 1
+FLAG_SILENT   = 2
+FLAG_HEADLESS = 4
+FLAG_SHEDDING = 8
+FLAG_FAULT    = 16
+
+# A whole frame, as telemetry.py packs it
+FRAME_DTYPE = np.dtype([
+    ('sync', '<u2'),
+    ('seq', '<u2'),
+    ('ticks', '<u4'),
+    ('raw', '<u2'),
+    ('offset', '<u2'),
+    ('centi', '<i2'),
+    ('flags', 'u1'),
+    ('crc', '<u2'),
+])
+
+# What is kept of it
+FIELDS = ('seq', 'ticks', 'raw', 'offset', 'centi', 'flags')
+
+def _crc_table():
+    table = np.zeros(256, np.uint16)
+    for i in range(256):
+        crc = i << 8
+        for bit in range(8):
+            if crc & 0x8000:
+                crc = ((crc << 1) ^ 0x1021) & 0xFFFF
+            else:
+                crc = (crc << 1) & 0xFFFF
+        table[i] = crc
+    return table
+
+CRC_TABLE = _crc_table()
+
+def crc16(rows):
+    ''' CRC-16/CCITT of every row of a 2D uint8 array, as computed on
+        the Pico '''
+    crc = np.full(len(rows), 0xFFFF, np.uint16)
+    for i in range(rows.shape[1]):
+        crc = (crc << 8) ^ CRC_TABLE[(crc >> 8) ^ rows[:, i]]
+    return crc
+
+def decode(data):
+    ''' Finds the frames in a buffer. Returns the frames, the offset of
+        the tail that may hold the start of a frame, and the number of
+        sync words whose CRC was wrong. '''
+    buf = np.frombuffer(bytes(data), np.uint8)
+    last = len(buf) - FRAME_SIZE
+    if last < 0:
+        return np.zeros(0, FRAME_DTYPE), 0, 0
+
+    starts = np.flatnonzero((buf[:last + 1] == (SYNC & 0xFF)) & (buf[1:last + 2] == (SYNC >> 8)))
+    rows = buf[starts[:, None] + np.arange(FRAME_SIZE)]
+    crc = rows[:, CRC_AT].astype(np.uint16) | (rows[:, CRC_AT + 1].astype(np.uint16) << 8)
+    valid = crc16(rows[:, :CRC_AT]) == crc
+    starts = starts[valid]
+    rows = rows[valid]
+
+    # a sync word inside a frame that happens to pass the CRC as well
+    overlap = np.diff(starts) < FRAME_SIZE
+    if overlap.any():
+        rows = rows[np.concatenate(([True], ~overlap))]
+
+    frames = np.ascontiguousarray(rows).view(FRAME_DTYPE).reshape(-1)
+    return frames, last + 1, int((~valid).sum())
+
+class Decoder(object):
+    ''' Finds frames in a byte stream fed to it in pieces of any size '''
+
+    def __init__(self):
+        self.tail = b''
+        self.bad_frames = 0       # sync word found, CRC wrong
+        self.skipped = 0          # bytes that were not part of a frame
+
+    def feed(self, data):
+        ''' Returns the complete frames '''
+        data = self.tail + bytes(data)
+        frames, end, bad = decode(data)
+        self.tail = data[end:]
+        self.bad_frames += bad
+        # frames that run into the tail are counted there
+        self.skipped += max(0, end - len(frames) * FRAME_SIZE)
+        return frames
+
+class Recorder(object):
+    ''' Collects the frames in NumPy chunks '''
+
+    def __init__(self):
+        self.chunks = []
+        self.lost = 0             # frames missing according to seq
+        self.last_seq = None
+
+    def add(self, frames):
+        if len(frames) == 0:
+            return
+        seq = frames['seq'].astype(np.int64)
+        previous = seq[0] - 1 if self.last_seq is None else self.last_seq
+        self.lost += int(((np.diff(seq, prepend=previous) - 1) & 0xFFFF).sum())
+        self.last_seq = seq[-1]
+        self.chunks.append(np.ascontiguousarray(frames[list(FIELDS)]))
+
+    def frames(self):
+        if not self.chunks:
+            return np.zeros(0, FRAME_DTYPE)[list(FIELDS)]
+        return np.concatenate(self.chunks)
+
+    def arrays(self):
+        ''' Columns ready for analysis, times in seconds from the start '''
+        frames = self.frames()
+        # ticks_us wraps, unwrap the differences
+        steps = np.diff(frames['ticks'].astype(np.int64)) % TICKS_PERIOD
+        time_s = np.concatenate(([0], np.cumsum(steps))) / 1e6
+        return {
+            'time_s': time_s,
+            'seq': frames['seq'],
+            'raw': frames['raw'],
+            'offset': frames['offset'],
+            'temp_c': frames['centi'] / 100.0,
+            'flags': frames['flags'],
+        }
+
+def open_source(name):
+    ''' Returns the stream and whether it is a file that ends '''
+    if os.path.isfile(name):
+        return open(name, 'rb'), True
+
+    import serial
+    return serial.Serial(name, 115200, timeout=0.1), False
+
+def main(argv):
+    if len(argv) != 3:
+        print('usage: %s port-or-file output.npz' % argv[0])
+        return 1
+
+    decoder = Decoder()
+    recorder = Recorder()
+    source, is_file = open_source(argv[1])
+    try:
+        while True:
+            data = source.read(4096)
+            if not data and is_file:
+                break
+            recorder.add(decoder.feed(data))
+    except KeyboardInterrupt:
+        pass  # stop recording from the serial port
+    finally:
+        source.close()
+
+    np.savez(argv[2], **recorder.arrays())
+    print('%d frames, %d lost, %d bad, %d bytes skipped' % (
+        len(recorder.frames()), recorder.lost, decoder.bad_frames, decoder.skipped))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv))
@@ -0,0 +1,155 @@
+###############################################################
+# Slim picozero for one application
+#
+# Finds the picozero names the application imports, follows what
+# they need through the picozero package and writes a single
+# picozero.py with just those classes and functions:
+#   python3 tools/slim_picozero.py main.py statemachine.py -o build/picozero.py
+# Names that are only looked up at run time can be added with
+# --keep. tools/build.py --slim does this for the modules it
+# builds.
+###############################################################
+
+import argparse
+import ast
+import os
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PACKAGE = os.path.join(ROOT, 'picozero')
+
+class Definition(object):
+    ''' A top level statement of a submodule, with the names it
+        defines and the names it uses '''
+
+    def __init__(self, lines, defines, uses):
+        self.lines = lines
+        self.defines = defines
+        self.uses = uses
+
+def names_used(node):
+    used = set()
+    for child in ast.walk(node):
+        if isinstance(child, ast.Name):
+            used.add(child.id)
+        elif isinstance(child, ast.ImportFrom) and child.module == 'picozero':
+            used.update(alias.name for alias in child.names)
+    return used
+
+def names_defined(node):
+    if isinstance(node, (ast.ClassDef, ast.FunctionDef)):
+        return {node.name}
+    if isinstance(node, ast.Assign):
+        target = node.targets[0]
+        if isinstance(target, ast.Attribute):
+            # Buzzer.beep = Buzzer.blink belongs to Buzzer
+            return {target.value.id}
+        return {target.id}
+    # try and if blocks, e.g. the PIO programs
+    defined = set()
+    for child in ast.walk(node):
+        if isinstance(child, (ast.ClassDef, ast.FunctionDef)):
+            defined.add(child.name)
+        elif isinstance(child, ast.Name) and isinstance(child.ctx, ast.Store):
+            defined.add(child.id)
+    return defined
+
+def read_package():
+    ''' The imports and definitions of every submodule, in the order of
+        picozero._SUBMODULES '''
+    tree = ast.parse(open(os.path.join(PACKAGE, '__init__.py')).read())
+    submodules = next(ast.literal_eval(node.value) for node in tree.body
+                      if isinstance(node, ast.Assign) and node.targets[0].id == '_SUBMODULES')
+
+    imports = []                  # (module, name), the stdlib and machine imports
+    definitions = []
+    for submodule in submodules:
+        source = open(os.path.join(PACKAGE, submodule + '.py')).read()
+        lines = source.split('\n')
+        for node in ast.parse(source).body:
+            if isinstance(node, ast.ImportFrom):
+                if node.level == 0:
+                    imports.extend((node.module, alias.name) for alias in node.names)
+                continue
+            first = min([node.lineno] + [d.lineno for d in getattr(node, 'decorator_list', ())])
+            definitions.append(Definition(lines[first - 1:node.end_lineno],
+                                          names_defined(node), names_used(node)))
+    return imports, definitions
+
+def imported_names(paths):
+    ''' The picozero names the application modules import '''
+    names = set()
+    for path in paths:
+        for node in ast.walk(ast.parse(open(path).read())):
+            if isinstance(node, ast.ImportFrom) and node.module == 'picozero':
+                names.update(alias.name for alias in node.names)
+            elif (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                    and node.value.id == 'picozero'):
+                names.add(node.attr)
+    if '*' in names:
+        raise ValueError('"from picozero import *" hides what is used, list the names')
+    return names
+
+def slim(paths, keep=()):
+    ''' Returns the source of a picozero module with what the application
+        modules need, and the names it defines '''
+    imports, definitions = read_package()
+    wanted = imported_names(paths) | set(keep)
+
+    defined = set()
+    for definition in definitions:
+        defined |= definition.defines
+    unknown = wanted - defined
+    if unknown:
+        raise ValueError('not in picozero: ' + ', '.join(sorted(unknown)))
+
+    # everything the wanted names need, however deep
+    needed = set()
+    todo = list(wanted)
+    while todo:
+        name = todo.pop()
+        if name in needed:
+            continue
+        needed.add(name)
+        for definition in definitions:
+            if name in definition.defines:
+                todo.extend((definition.uses & defined) - needed)
+
+    kept = [d for d in definitions if d.defines & needed]
+    used = set()
+    for definition in kept:
+        used |= definition.uses
+
+    out = ['# Generated by tools/slim_picozero.py, do not edit.',
+           '# Keeps: ' + ', '.join(sorted(wanted)), '']
+    modules = []
+    for module, name in imports:
+        if name in used and module not in modules:
+            modules.append(module)
+    for module in modules:
+        names = []
+        for m, name in imports:
+            if m == module and name in used and name not in names:
+                names.append(name)
+        out.append('from %s import %s' % (module, ', '.join(names)))
+    out.append('')
+    for definition in kept:
+        out.extend(definition.lines)
+        out.append('')
+    return '\n'.join(out), sorted(needed)
+
+def main():
+    parser = argparse.ArgumentParser(description='Write a picozero module with only what an application uses')
+    parser.add_argument('paths', nargs='+', help='application modules that import picozero')
+    parser.add_argument('-o', '--out', default=os.path.join(ROOT, 'build', 'picozero.py'))
+    parser.add_argument('--keep', action='append', default=[],
+                        help='picozero name to keep, may be repeated')
+    args = parser.parse_args()
+
+    source, names = slim(args.paths, args.keep)
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    with open(args.out, 'w') as f:
+        f.write(source)
+    print('%s: %d lines, %s' % (args.out, source.count('\n'), ', '.join(names)))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,390 @@
+###############################################################
+# Retained-mode widgets for the SSD1306 display
+#
+# Every widget knows its bounding box and whether it has to be
+# redrawn. A Screen only redraws the widgets that changed and
+# returns the merged area that needs to be sent to the display.
+###############################################################
+
+import framebuf
+from array import array
+from oled import Write
+
+# 8x8 icons, one byte per row, most significant bit on the left
+ICON_ALARM = bytearray((0x18, 0x3C, 0x3C, 0x3C, 0x7E, 0xFF, 0x00, 0x18))  # bell
+ICON_SENSOR = bytearray((0x18, 0x24, 0x24, 0x24, 0x24, 0x5A, 0x5A, 0x3C))  # thermometer
+
+class Widget(object):
+
+    def __init__(self, x, y, w, h):
+        self.x = x
+        self.y = y
+        self.w = w
+        self.h = h
+        self.dirty = True
+
+    def invalidate(self):
+        self.dirty = True
+
+    def dirty_rect(self):
+        ''' The area to redraw as (x, y, w, h) '''
+        return (self.x, self.y, self.w, self.h)
+
+    def draw(self, fb):
+        ''' Draw the widget, its dirty area has already been cleared '''
+        pass
+
+class Label(Widget):
+    ''' A line of text in the built-in 8x8 font '''
+
+    def __init__(self, x, y, text='', w=None, inverted=False):
+        Widget.__init__(self, x, y, w if w is not None else len(text) * 8, 8)
+        self.text = text
+        self.inverted = inverted
+
+    def set(self, text):
+        if text != self.text:
+            self.text = text
+            self.dirty = True
+
+    def draw(self, fb):
+        if self.inverted:
+            fb.fill_rect(self.x, self.y, self.w, self.h, 1)
+            fb.text(self.text, self.x, self.y, 0)
+        else:
+            fb.text(self.text, self.x, self.y, 1)
+
+class BigNumber(Widget):
+    ''' Text in a large font, placed at an offset inside the widget '''
+
+    def __init__(self, x, y, w, h, font):
+        Widget.__init__(self, x, y, w, h)
+        self.font = font
+        self.text = ''
+        self.offset = 0
+
+    def set(self, text, offset=0):
+        if text != self.text or offset != self.offset:
+            self.text = text
+            self.offset = offset
+            self.dirty = True
+
+    def draw(self, fb):
+        Write(fb, self.font).text(self.text, self.x + self.offset, self.y)
+
+class WindowMinMax(object):
+    ''' Minimum and maximum of the last values added. Each value
+        is compared a constant number of times on average, however
+        long the window: two monotonic queues of sample numbers. '''
+
+    def __init__(self, size):
+        self.size = size
+        self.values = array('f', [0] * size)  # by sample number % size
+        self.mins = array('i', [0] * size)    # sample numbers, values increasing
+        self.maxs = array('i', [0] * size)    # sample numbers, values decreasing
+        self.reset()
+
+    def reset(self):
+        self.n = 0                # samples added
+        self.min_head = self.min_tail = 0
+        self.max_head = self.max_tail = 0
+
+    def add(self, value, window):
+        ''' Add a value, the window is the number of values that count '''
+        size = self.size
+        values = self.values
+        n = self.n
+        values[n % size] = value
+
+        # drop what the new value hides, then what left the window
+        mins = self.mins
+        tail = self.min_tail
+        while tail > self.min_head and values[mins[(tail - 1) % size] % size] >= value:
+            tail -= 1
+        mins[tail % size] = n
+        self.min_tail = tail + 1
+        while mins[self.min_head % size] <= n - window:
+            self.min_head += 1
+
+        maxs = self.maxs
+        tail = self.max_tail
+        while tail > self.max_head and values[maxs[(tail - 1) % size] % size] <= value:
+            tail -= 1
+        maxs[tail % size] = n
+        self.max_tail = tail + 1
+        while maxs[self.max_head % size] <= n - window:
+            self.max_head += 1
+
+        self.n = n + 1
+
+    def min(self):
+        return self.values[self.mins[self.min_head % self.size] % self.size]
+
+    def max(self):
+        return self.values[self.maxs[self.max_head % self.size] % self.size]
+
+class Graph(Widget):
+    ''' History graph in a frame, with a dotted line at a set value.
+        Every sample is turned into its pixel row once, when it is
+        added, and drawn as a line from the sample before it. With
+        autoscale the axis follows the values shown and the line. '''
+
+    STEP     = 5                      # autoscaled axis ends are multiples of this
+    HEADROOM = 2                      # space above and below the values
+    MIN_SPAN = 10                     # smallest autoscaled range
+
+    def __init__(self, x, y, w, h, max_value, line=None, autoscale=False):
+        Widget.__init__(self, x, y, w, h)
+        self.low = 0
+        self.high = max_value
+        self.line = line
+        self.autoscale = autoscale
+        self.rows = bytearray(w)      # pixel row of every sample, oldest first
+        self.count = 0
+        self.version = -1
+        self.values = ()
+        self.window = WindowMinMax(w + 1)  # room for a new value before the oldest leaves
+
+        # the dotted line, blitted in one go
+        self.dots = framebuf.FrameBuffer(bytearray(w), w, 1, framebuf.MONO_VLSB)
+        for i in range(w):
+            if (x + i) % 4 == 0:
+                self.dots.pixel(i, 0, 1)
+
+    def row(self, value):
+        bottom = self.y + self.h
+        row = bottom - int((value - self.low) * self.h / (self.high - self.low))
+        return min(max(row, self.y), bottom)
+
+    def set(self, values, version):
+        ''' version goes up by one for every value added '''
+        if version == self.version:
+            return
+
+        n = len(values)
+        rows = self.rows
+        self.values = values
+        if version == self.version + 1 and n == self.count + 1 and n <= self.w:
+            self.count = n
+            if not self._add(values[-1]):
+                rows[n - 1] = self.row(values[-1])
+        elif version == self.version + 1 and n == self.count and n > 0:
+            # the oldest value was dropped
+            if not self._add(values[-1]):
+                rows[:n - 1] = rows[1:n]
+                rows[n - 1] = self.row(values[-1])
+        else:
+            self.count = min(n, self.w)
+            if self.autoscale:
+                self.window.reset()
+                for i in range(n - self.count, n):
+                    self.window.add(values[i], self.count)
+            if not self._rescale():
+                self._rebuild()
+
+        self.version = version
+        self.dirty = True
+
+    def set_line(self, line):
+        if line != self.line:
+            self.line = line
+            self._rescale()
+            self.dirty = True
+
+    def _add(self, value):
+        ''' Track a new value, returns True if the axis changed '''
+        if not self.autoscale:
+            return False
+        self.window.add(value, self.count)
+        return self._rescale()
+
+    def _rebuild(self):
+        values = self.values
+        start = len(values) - self.count
+        for i in range(self.count):
+            self.rows[i] = self.row(values[start + i])
+
+    def _rescale(self):
+        ''' Fit the axis to the values and the line. Returns True if
+            it changed, the rows have been rebuilt then. '''
+        if not self.autoscale or self.window.n == 0:
+            return False
+
+        low = self.window.min() - self.HEADROOM
+        high = self.window.max() + self.HEADROOM
+        if self.line is not None:
+            low = min(low, self.line - self.HEADROOM)
+            high = max(high, self.line + self.HEADROOM)
+        low = int(low // self.STEP) * self.STEP
+        high = -int(-high // self.STEP) * self.STEP
+        if high - low < self.MIN_SPAN:
+            high = low + self.MIN_SPAN
+
+        # grow right away, shrink only by more than a step to avoid flapping
+        if (low < self.low or high > self.high
+                or low - self.low > self.STEP or self.high - high > self.STEP):
+            self.low = low
+            self.high = high
+            self._rebuild()
+            return True
+        return False
+
+    def draw(self, fb):
+        fb.rect(self.x, self.y, self.w, self.h, 1)  # rect around graph
+
+        # dotted line, 0 is transparent so the frame stays
+        if self.line is not None:
+            fb.blit(self.dots, self.x, self.row(self.line), 0)
+
+        # historical values, each connected to the one before
+        rows = self.rows
+        vline = fb.vline
+        x = self.x
+        previous = rows[0]
+        for i in range(self.count):
+            row = rows[i]
+            if row > previous:
+                vline(x + i, previous + 1, row - previous, 1)
+            elif row < previous:
+                vline(x + i, row, previous - row, 1)
+            else:
+                vline(x + i, row, 1, 1)
+            previous = row
+
+class MenuList(Widget):
+    ''' A scrolling list of menu items, the selected one is inverted.
+        Only the rows that changed are redrawn. '''
+
+    LINE_HEIGHT = 10
+
+    def __init__(self, x, y, w, h):
+        Widget.__init__(self, x, y, w, h)
+        self.rows = h // self.LINE_HEIGHT
+        self.menu = None
+        self.dirty_rows = 0       # bit per visible row
+
+    def show_menu(self, menu):
+        self.menu = menu
+        self.invalidate()
+
+    def invalidate(self):
+        self.dirty = True
+        self.dirty_rows = (1 << self.rows) - 1
+
+    def invalidate_item(self, index):
+        row = index - self.menu.top
+        if 0 <= row < self.rows:
+            self.dirty = True
+            self.dirty_rows |= 1 << row
+
+    def select(self, index):
+        menu = self.menu
+        top = menu.top
+        if index < top:
+            top = index
+        elif index >= top + self.rows:
+            top = index - self.rows + 1
+
+        if top != menu.top:
+            # scrolled, every row changes
+            menu.top = top
+            menu.selected = index
+            self.invalidate()
+        else:
+            self.invalidate_item(menu.selected)
+            menu.selected = index
+            self.invalidate_item(index)
+
+    def _row_span(self):
+        first = 0
+        while not self.dirty_rows & (1 << first):
+            first += 1
+        last = self.rows - 1
+        while not self.dirty_rows & (1 << last):
+            last -= 1
+        return first, last
+
+    def dirty_rect(self):
+        first, last = self._row_span()
+        return (self.x, self.y + first * self.LINE_HEIGHT,
+                self.w, (last - first + 1) * self.LINE_HEIGHT)
+
+    def draw(self, fb):
+        first, last = self._row_span()
+        self.dirty_rows = 0
+
+        items = self.menu.items
+        for row in range(first, last + 1):
+            index = self.menu.top + row
+            if index >= len(items):
+                break
+            y = self.y + row * self.LINE_HEIGHT
+
+            # invert the currently selected item
+            if index == self.menu.selected:
+                if self.menu.editing is not None:
+                    text = items[index].text(self.menu.editing, True)
+                else:
+                    text = items[index].text()
+                fb.fill_rect(self.x, y, self.w, self.LINE_HEIGHT, 1)
+                fb.text(text, self.x + 10, y, 0)
+            else:
+                fb.text(items[index].text(), self.x + 10, y, 1)
+
+class StatusIcon(Widget):
+    ''' An 8x8 icon which can be shown or hidden '''
+
+    def __init__(self, x, y, icon):
+        Widget.__init__(self, x, y, 8, 8)
+        self.icon = framebuf.FrameBuffer(icon, 8, 8, framebuf.MONO_HLSB)
+        self.visible = False
+
+    def show(self, visible):
+        if visible != self.visible:
+            self.visible = visible
+            self.dirty = True
+
+    def draw(self, fb):
+        if self.visible:
+            fb.blit(self.icon, self.x, self.y)
+
+class Screen(object):
+    ''' A set of widgets drawn together '''
+
+    def __init__(self, *widgets):
+        self.widgets = widgets
+        self.cleared = False
+
+    def invalidate(self):
+        ''' Clear the display and redraw every widget on the next render '''
+        self.cleared = False
+        for widget in self.widgets:
+            widget.invalidate()
+
+    def render(self, fb):
+        ''' Redraw the dirty widgets. Returns the area that changed as
+            (x0, y0, x1, y1), or None if nothing did. '''
+        if not self.cleared:
+            fb.fill(0)
+            self.cleared = True
+            x0, y0, x1, y1 = 0, 0, fb.width - 1, fb.height - 1
+        else:
+            x0 = y0 = 0x7FFF
+            x1 = y1 = -1
+
+        for widget in self.widgets:
+            if widget.dirty:
+                x, y, w, h = widget.dirty_rect()
+                widget.dirty = False
+                fb.fill_rect(x, y, w, h, 0)
+                widget.draw(fb)
+
+                # merge the dirty rectangles
+                x0 = min(x0, x)
+                y0 = min(y0, y)
+                x1 = max(x1, x + w - 1)
+                y1 = max(y1, y + h - 1)
+
+        if x1 < 0:
+            return None
+        return (x0, y0, x1, y1)